@@ -2,23 +2,32 @@ import cv2
 import time
 import logging
 import asyncio
-import json
-import random
-import queue
+import orjson
 import torch
 import numpy as np
 import os
 import signal
 import sys
 import base64
+import zlib
+import socket
 import argparse
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
+import yaml
 from ultralytics import YOLO
-from threading import Thread, Event, Lock
+from ultralytics.trackers.bot_sort import BOTSORT
+from ultralytics.utils import IterableSimpleNamespace
+from ultralytics.utils.checks import check_yaml
+from threading import Thread, Event, Lock, Condition
 from aiohttp import web, web_ws, ClientSession
 from aiohttp_cors import setup as cors_setup, ResourceOptions
+import av
+import fractions
 from av import VideoFrame
-from aiortc import RTCPeerConnection, RTCSessionDescription, VideoStreamTrack, RTCConfiguration, RTCIceServer
+from aiortc import RTCPeerConnection, RTCSessionDescription, VideoStreamTrack, RTCConfiguration, RTCIceServer, RTCRtpSender
+from aiortc.codecs import h264 as aiortc_h264
+import aiortc.rtcrtpsender as aiortc_rtcrtpsender
 
 # ==================== CONFIGURATION ====================
 
@@ -57,8 +66,9 @@ class Config:
             self.DRONE_SERIAL = drone_data.get('deviceSerialNumber', 'UNKNOWN')
             
             # Port assignment: can be based on serial number hash or explicitly set
-            # For now, use environment variable or auto-assign based on serial
-            self.WEB_SERVER_PORT = int(os.getenv("WEB_SERVER_PORT", str(6000 + hash(self.DRONE_SERIAL) % 1000)))
+            # For now, use environment variable or auto-assign based on serial (CRC32 - stable across restarts,
+            # unlike hash() which is randomized per process)
+            self.WEB_SERVER_PORT = int(os.getenv("WEB_SERVER_PORT", str(6000 + zlib.crc32(self.DRONE_SERIAL.encode()) % 1000)))
         else:
             # Fallback to environment variables (backward compatibility)
             self.RTSP_URL = os.getenv("RTSP_URL", "rtsp://djiuser_p7GyO68feTrF:Jasonbrown200617@@192.168.1.106:8554/streaming/live/1")
@@ -70,8 +80,18 @@ class Config:
         # Common configuration (from environment variables)
         self.NOTIFICATION_ENDPOINT = os.getenv("NOTIFICATION_ENDPOINT", "http://192.168.1.89:9000/notify")
         self.YOLO_MODEL = os.getenv("YOLO_MODEL", "yolo11l.pt")
+        # TensorRT engine (FP16) exported from YOLO_MODEL - used instead of the .pt weights on CUDA
+        self.USE_TENSORRT = os.getenv("USE_TENSORRT", "true").lower() == "true"
+        self.YOLO_ENGINE = os.getenv("YOLO_ENGINE", "")  # Defaults to <model>_<H>x<W>_b<MAX_BATCH>.engine (see below)
+        self.TENSORRT_WORKSPACE = int(os.getenv("TENSORRT_WORKSPACE", "4"))  # GiB
+        # PyTorch fallback (no engine): compile the forward pass with Torch-TensorRT (FP16) if available
+        self.TORCH_TENSORRT = os.getenv("TORCH_TENSORRT", "true").lower() == "true"
+        self.TRACKER_CONFIG = os.getenv("TRACKER_CONFIG", "botsort.yaml")  # BoT-SORT settings (Ultralytics format)
         self.CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", "0.5"))
         self.NMS_THRESHOLD = float(os.getenv("NMS_THRESHOLD", "0.45"))
+        # Fast NMS on the inference device - Ultralytics' NMS only pre-filters near-identical boxes at FAST_NMS_PRE_IOU
+        self.FAST_NMS = os.getenv("FAST_NMS", "true").lower() == "true"
+        self.FAST_NMS_PRE_IOU = float(os.getenv("FAST_NMS_PRE_IOU", "0.9"))
 
         # Notification cooldown period (seconds) - prevents duplicate notifications
         self.NOTIFICATION_COOLDOWN = float(os.getenv("NOTIFICATION_COOLDOWN", "30.0"))
@@ -94,7 +114,12 @@ class Config:
         # Stream processing settings
         self.OUTPUT_WIDTH = int(os.getenv("OUTPUT_WIDTH", "640"))
         self.OUTPUT_HEIGHT = int(os.getenv("OUTPUT_HEIGHT", "480"))
+        # Inference shape (H, W) pinned to the output size rounded up to the model stride (32), so the
+        # frame resized in process_frame is fed as-is and Ultralytics' LetterBox neither rescales nor pads
+        self.INFERENCE_IMGSZ = (-(-self.OUTPUT_HEIGHT // 32) * 32, -(-self.OUTPUT_WIDTH // 32) * 32)
         self.WEB_SERVER_HOST = os.getenv("WEB_SERVER_HOST", "0.0.0.0")
+        # Health/metrics are served on their own port (and event loop) so probes never queue behind signaling
+        self.HEALTH_PORT = int(os.getenv("HEALTH_PORT", str(self.WEB_SERVER_PORT + 1000)))
         # Public host for client connections (defaults to localhost, override with actual IP/domain in production)
         self.PUBLIC_HOST = os.getenv("PUBLIC_HOST", "localhost")
         self.RECONNECT_DELAY = int(os.getenv("RECONNECT_DELAY", "5"))
@@ -102,7 +127,19 @@ class Config:
         self.BUFFER_SIZE = int(os.getenv("BUFFER_SIZE", "1"))
         self.WATCHDOG_TIMEOUT = int(os.getenv("WATCHDOG_TIMEOUT", "15"))
         self.CAPTURE_READ_TIMEOUT = int(os.getenv("CAPTURE_READ_TIMEOUT", "5"))
+        # RTSP decode backend: "nvdec" (PyAV + h264_cuvid/hevc_cuvid, CUDA only) or "opencv" (FFmpeg software decode)
+        self.CAPTURE_BACKEND = os.getenv("CAPTURE_BACKEND", "nvdec").lower()
+        # Encode outgoing WebRTC video with NVENC (h264_nvenc) instead of aiortc's software VP8/libx264
+        self.USE_NVENC = os.getenv("USE_NVENC", "true").lower() == "true"
         self.PROCESS_EVERY_N_FRAMES = int(os.getenv("PROCESS_EVERY_N_FRAMES", "1"))
+        # Batched inference - up to MAX_BATCH queued frames are collected (within BATCH_COLLECT_MS) per predict call
+        self.MAX_BATCH = max(1, int(os.getenv("MAX_BATCH", "8")))
+        self.BATCH_COLLECT_MS = float(os.getenv("BATCH_COLLECT_MS", "3"))
+
+        if not self.YOLO_ENGINE:
+            # Engine shape is baked in at export - encode it in the filename so a size/batch change triggers a re-export
+            self.YOLO_ENGINE = (f"{os.path.splitext(self.YOLO_MODEL)[0]}_{self.INFERENCE_IMGSZ[0]}x{self.INFERENCE_IMGSZ[1]}"
+                                f"_b{self.MAX_BATCH}.engine")
 
 
 # ==================== DRONE API CLIENT ====================
@@ -173,22 +210,249 @@ async def update_drone_webrtc_url(serial_number, webrtc_url, api_base_url="http:
             return False
 
 
+# ==================== TENSORRT EXPORT ====================
+def export_tensorrt_engine(config):
+    """
+    One-time export of the YOLO weights to a TensorRT engine (FP16)
+
+    Args:
+        config: Config instance (YOLO_MODEL, OUTPUT_WIDTH/HEIGHT, TENSORRT_WORKSPACE)
+
+    Returns:
+        str: Path of the exported engine file
+    """
+    model = YOLO(config.YOLO_MODEL)
+    engine_path = model.export(
+        format="engine",
+        half=True,
+        imgsz=config.INFERENCE_IMGSZ,
+        dynamic=config.MAX_BATCH > 1,  # Dynamic batch axis so partial batches run on the same engine
+        batch=config.MAX_BATCH,
+        workspace=config.TENSORRT_WORKSPACE,
+        device=0
+    )
+    # Ultralytics writes the engine next to the weights - move it to the configured path if different
+    if os.path.abspath(engine_path) != os.path.abspath(config.YOLO_ENGINE):
+        os.replace(engine_path, config.YOLO_ENGINE)
+    return config.YOLO_ENGINE
+
+
+# ==================== NVDEC CAPTURE ====================
+class NvdecCapture:
+    """
+    Minimal cv2.VideoCapture stand-in that decodes the RTSP stream on the GPU (NVDEC) through PyAV
+
+    The cuvid decoder also scales to the output size on the GPU, so frames arrive already
+    resized. PyAV hands decoded frames back in host memory (bgr24 ndarray).
+    """
+    CUVID_DECODERS = {"h264": "h264_cuvid", "hevc": "hevc_cuvid"}
+
+    def __init__(self, url, config):
+        self.container = av.open(
+            url,
+            options={"rtsp_transport": "tcp", "fflags": "nobuffer", "flags": "low_delay"},
+            timeout=(config.RTSP_TIMEOUT, config.CAPTURE_READ_TIMEOUT)
+        )
+        try:
+            self.stream = self.container.streams.video[0]
+            codec_name = self.stream.codec_context.name
+            if codec_name not in self.CUVID_DECODERS:
+                raise ConnectionError(f"No NVDEC decoder for codec '{codec_name}'")
+            self.decoder = av.CodecContext.create(self.CUVID_DECODERS[codec_name], "r")
+            self.decoder.extradata = self.stream.codec_context.extradata
+            self.decoder.options = {"resize": f"{config.OUTPUT_WIDTH}x{config.OUTPUT_HEIGHT}"}
+        except Exception:
+            self.container.close()
+            raise
+        self._frames = self._decode()
+        self._opened = True
+
+    def _decode(self):
+        for packet in self.container.demux(self.stream):
+            for frame in self.decoder.decode(packet):
+                yield frame.to_ndarray(format="bgr24")
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self):
+        try:
+            return True, next(self._frames)
+        except Exception:
+            # End of stream or demux/decode error - caller reconnects
+            self._opened = False
+            return False, None
+
+    def release(self):
+        self._opened = False
+        try:
+            self.container.close()
+        except Exception:
+            pass
+
+
+# ==================== NVENC ENCODER ====================
+class NvencH264Encoder(aiortc_h264.H264Encoder):
+    """aiortc H264 encoder backed by NVENC (h264_nvenc) instead of libx264"""
+    def _encode_frame(self, frame, force_keyframe):
+        # Recreate the encoder on resolution change or a >10% bitrate change (same policy as aiortc)
+        if self.codec and (
+            frame.width != self.codec.width
+            or frame.height != self.codec.height
+            or abs(self.target_bitrate - self.codec.bit_rate) / self.codec.bit_rate > 0.1
+        ):
+            self.buffer_data = b""
+            self.buffer_pts = None
+            self.codec = None
+
+        if force_keyframe:
+            frame.pict_type = av.video.frame.PictureType.I
+        else:
+            frame.pict_type = av.video.frame.PictureType.NONE
+
+        if self.codec is None:
+            self.codec = av.CodecContext.create("h264_nvenc", "w")
+            self.codec.width = frame.width
+            self.codec.height = frame.height
+            self.codec.bit_rate = self.target_bitrate
+            self.codec.pix_fmt = "yuv420p"
+            self.codec.framerate = fractions.Fraction(aiortc_h264.MAX_FRAME_RATE, 1)
+            self.codec.time_base = fractions.Fraction(1, aiortc_h264.MAX_FRAME_RATE)
+            self.codec.options = {
+                "preset": "p1",
+                "tune": "ull",
+                "zerolatency": "1",
+                "delay": "0",
+                "forced-idr": "1",
+                "profile": "baseline",
+            }
+
+        data_to_send = b""
+        for package in self.codec.encode(frame):
+            data_to_send += bytes(package)
+
+        if data_to_send:
+            yield from self._split_bitstream(data_to_send)
+
+
+def enable_nvenc():
+    """
+    Route aiortc's H264 encoding through NvencH264Encoder
+
+    Returns:
+        bool: True if h264_nvenc is available and the encoder was installed
+    """
+    if "h264_nvenc" not in av.codecs_available:
+        return False
+    default_get_encoder = aiortc_rtcrtpsender.get_encoder
+
+    def get_encoder(codec):
+        if codec.mimeType.lower() == "video/h264":
+            return NvencH264Encoder()
+        return default_get_encoder(codec)
+
+    aiortc_rtcrtpsender.get_encoder = get_encoder
+    return True
+
+
+# ==================== FAST NMS ====================
+def box_iou_batch(boxes_a, boxes_b):
+    """Pairwise IoU of (N, 4) and (M, 4) xyxy tensors -> (N, M) tensor"""
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
+    top_left = torch.max(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = torch.min(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    inter = (bottom_right - top_left).clamp(min=0).prod(dim=2)
+    return inter / (area_a[:, None] + area_b[None, :] - inter + 1e-7)
+
+
+def fast_nms(boxes, scores, classes, iou_threshold, max_wh=7680):
+    """
+    Class-aware Fast NMS (YOLACT): one IoU matrix instead of a sequential suppression loop
+
+    Boxes are offset by class * max_wh so different classes never overlap; a box is dropped
+    if any higher-scoring box overlaps it above iou_threshold. Runs on the tensors' device.
+
+    Returns:
+        Tensor of kept indices, highest score first
+    """
+    order = scores.argsort(descending=True)
+    if len(order) < 2:
+        return order
+    offset_boxes = boxes[order] + classes[order, None].to(boxes.dtype) * max_wh
+    iou = box_iou_batch(offset_boxes, offset_boxes).triu_(diagonal=1)
+    # Column j holds the IoU of box j with every higher-scoring box
+    keep = iou.max(dim=0).values <= iou_threshold
+    return order[keep]
+
+
+# ==================== FRAME RING ====================
+class FrameRing:
+    """
+    Bounded frame buffer between the capture and processing threads
+
+    A deque with maxlen drops the oldest frame on overflow (live video wants the newest frames),
+    and append/popleft are atomic, so the only synchronization is an Event to wake the consumer.
+    """
+    def __init__(self, maxlen):
+        self._frames = deque(maxlen=maxlen)
+        self._ready = Event()
+
+    def push(self, frame):
+        """Append a frame, evicting the oldest one if the ring is full"""
+        self._frames.append(frame)
+        self._ready.set()
+
+    def pop(self, timeout=None):
+        """
+        Take the oldest frame, waiting up to timeout seconds if the ring is empty
+
+        Returns:
+            Frame, or None if nothing arrived in time
+        """
+        if not self._frames:
+            self._ready.wait(timeout)
+        # Clear before popping: a push racing with this leaves its frame in the deque,
+        # and the emptiness check above catches it on the next call
+        self._ready.clear()
+        try:
+            return self._frames.popleft()
+        except IndexError:
+            return None
+
+    def __len__(self):
+        return len(self._frames)
+
+
 # ==================== NOTIFICATION MANAGER ====================
 class NotificationManager:
     """Manages object detection notifications with cooldown-based and spatial deduplication"""
-    def __init__(self, config, logger):
+    def __init__(self, config, logger, class_names):
         self.config = config
         self.logger = logger
-        self.tracked_objects = {}  # Dict of {track_id: {"time": last_time, "position": (cx, cy), "class": class_name}}
+        self.class_names = class_names  # {class_id: name} - only resolved for logs and notification payloads
+        # Tracked objects as parallel NumPy arrays (row per track ID) so the spatial check is one vectorized pass
+        self._capacity = 256
+        self._count = 0
+        self._pos = np.empty((self._capacity, 2), dtype=np.float32)  # (cx, cy) of last notification
+        self._time = np.empty(self._capacity, dtype=np.float64)  # last notification time
+        self._cls = np.empty(self._capacity, dtype=np.int32)  # class ID
+        self._track_id = np.empty(self._capacity, dtype=np.int64)
+        self._rows = {}  # Dict of {track_id: row}
         self.notification_cooldown = self.config.NOTIFICATION_COOLDOWN
         self.spatial_threshold = self.config.SPATIAL_DISTANCE_THRESHOLD
+        self.spatial_threshold_sq = self.spatial_threshold ** 2  # Compare squared distances (no sqrt)
         self.notification_queue = asyncio.Queue()
+        self.loop = None  # Event loop owning notification_queue (set in initialize)
         self.session = None
-        self.last_cleanup_time = time.time()
+        # All track times are time.monotonic() (immune to wall-clock/NTP adjustments)
+        self.last_cleanup_time = time.monotonic()
 
     async def initialize(self):
         """Initialize aiohttp ClientSession for sending notifications"""
-        self.session = ClientSession()
+        self.loop = asyncio.get_running_loop()
+        # orjson for the POST bodies too (aiohttp expects a str-returning serializer)
+        self.session = ClientSession(json_serialize=lambda obj: orjson.dumps(obj).decode())
         self.logger.info(f"NotificationManager initialized - endpoint: {self.config.NOTIFICATION_ENDPOINT}")
         self.logger.info(f"Notification cooldown: {self.notification_cooldown}s between duplicate notifications")
         self.logger.info(f"Spatial filtering: {self.spatial_threshold}px distance threshold")
@@ -198,57 +462,71 @@ class NotificationManager:
         if self.session:
             await self.session.close()
 
-    def cleanup_old_tracks(self):
+    def _update_track(self, track_id, class_id, center_position, now):
+        """Insert or update the row for a track ID"""
+        row = self._rows.get(track_id)
+        if row is None:
+            if self._count == self._capacity:
+                # Grow all arrays (amortized doubling)
+                self._capacity *= 2
+                for name in ("_pos", "_time", "_cls", "_track_id"):
+                    old = getattr(self, name)
+                    new = np.empty((self._capacity,) + old.shape[1:], dtype=old.dtype)
+                    new[:self._count] = old[:self._count]
+                    setattr(self, name, new)
+            row = self._count
+            self._count += 1
+            self._rows[track_id] = row
+            self._track_id[row] = track_id
+        self._pos[row] = center_position
+        self._time[row] = now
+        self._cls[row] = class_id
+
+    def cleanup_old_tracks(self, now):
         """Remove old track IDs from memory to prevent memory leak"""
-        now = time.time()
         # Only cleanup every 60 seconds
         if now - self.last_cleanup_time < 60:
             return
 
-        # Remove tracks older than 5 minutes (300 seconds)
-        expired_tracks = [
-            track_id for track_id, track_data in self.tracked_objects.items()
-            if now - track_data["time"] > 300
-        ]
-
-        for track_id in expired_tracks:
-            del self.tracked_objects[track_id]
-
-        if expired_tracks:
-            self.logger.info(f"Cleaned up {len(expired_tracks)} expired track IDs from memory")
+        # Remove tracks older than 5 minutes (300 seconds) - compact the arrays, keeping row order
+        n = self._count
+        keep = np.flatnonzero(now - self._time[:n] <= 300)
+        expired = n - len(keep)
+
+        if expired:
+            k = len(keep)
+            self._pos[:k] = self._pos[keep]
+            self._time[:k] = self._time[keep]
+            self._cls[:k] = self._cls[keep]
+            self._track_id[:k] = self._track_id[keep]
+            self._count = k
+            self._rows = {int(track_id): row for row, track_id in enumerate(self._track_id[:k])}
+            self.logger.info(f"Cleaned up {expired} expired track IDs from memory")
 
         self.last_cleanup_time = now
 
-    def calculate_distance(self, pos1, pos2):
-        """Calculate Euclidean distance between two positions"""
-        return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
-
-    def find_nearby_notification(self, class_name, center_position):
+    def find_nearby_notification(self, class_id, center_position, now):
         """
         Check if there's a recent notification for the same class nearby
         Returns (is_duplicate, reason) tuple
         """
-        now = time.time()
+        n = self._count
+        if n == 0:
+            return False, None
 
-        for track_id, track_data in self.tracked_objects.items():
-            # Only compare same object class
-            if track_data["class"] != class_name:
-                continue
+        # Squared distances to every tracked center, masked to same class + within cooldown
+        d2 = (self._pos[:n, 0] - center_position[0]) ** 2 + (self._pos[:n, 1] - center_position[1]) ** 2
+        age = now - self._time[:n]
+        hits = np.flatnonzero((self._cls[:n] == class_id) & (d2 < self.spatial_threshold_sq) &
+                              (age < self.notification_cooldown))
 
-            # Calculate distance between centers
-            distance = self.calculate_distance(center_position, track_data["position"])
-
-            # If within spatial threshold
-            if distance < self.spatial_threshold:
-                time_since_last = now - track_data["time"]
-
-                # If within cooldown period
-                if time_since_last < self.notification_cooldown:
-                    return True, f"Too close to recent notification (dist: {distance:.1f}px, {time_since_last:.1f}s ago)"
+        if len(hits):
+            row = hits[0]
+            return True, f"Too close to recent notification (dist: {float(d2[row]) ** 0.5:.1f}px, {age[row]:.1f}s ago)"
 
         return False, None
 
-    def is_new_detection(self, track_id, class_name, bbox):
+    def is_new_detection(self, track_id, class_id, bbox, now):
         """
         Check if this detection should trigger a notification
         Uses both cooldown period AND spatial filtering to prevent duplicates
@@ -256,14 +534,14 @@ class NotificationManager:
         Returns True if:
         - First time seeing this track ID AND not near any recent notification, OR
         - Cooldown period has expired since last notification for this track
+
+        now is a time.monotonic() value taken once per frame by the caller
         """
         if track_id is None:
             return False
 
-        now = time.time()
-
         # Cleanup old tracks periodically
-        self.cleanup_old_tracks()
+        self.cleanup_old_tracks(now)
 
         # Calculate center position from bbox
         x1, y1, x2, y2 = bbox
@@ -272,56 +550,35 @@ class NotificationManager:
         center_position = (center_x, center_y)
 
         # Check if we've seen this exact track ID before
-        if track_id in self.tracked_objects:
-            track_data = self.tracked_objects[track_id]
-            time_since_last = now - track_data["time"]
+        row = self._rows.get(track_id)
+        if row is not None:
+            time_since_last = now - self._time[row]
 
             # If cooldown period hasn't passed, don't notify
             if time_since_last < self.notification_cooldown:
                 return False
             else:
                 # Cooldown expired, update and allow notification
-                self.logger.info(f"🔄 Re-notifying for {class_name}#{track_id} (cooldown expired: {time_since_last:.1f}s)")
-                self.tracked_objects[track_id] = {
-                    "time": now,
-                    "position": center_position,
-                    "class": class_name
-                }
+                self.logger.info(f"🔄 Re-notifying for {self.class_names[class_id]}#{track_id} (cooldown expired: {time_since_last:.1f}s)")
+                self._update_track(track_id, class_id, center_position, now)
                 return True
         else:
             # New track ID - check if there's a similar detection nearby (spatial filtering)
-            is_duplicate, reason = self.find_nearby_notification(class_name, center_position)
+            is_duplicate, reason = self.find_nearby_notification(class_id, center_position, now)
+
+            # Track this ID either way (duplicates too, to prevent future notifications)
+            self._update_track(track_id, class_id, center_position, now)
 
             if is_duplicate:
-                self.logger.debug(f"🚫 Blocking duplicate: {class_name}#{track_id} - {reason}")
-                # Still track this ID to prevent future notifications
-                self.tracked_objects[track_id] = {
-                    "time": now,
-                    "position": center_position,
-                    "class": class_name
-                }
+                self.logger.debug(f"🚫 Blocking duplicate: {self.class_names[class_id]}#{track_id} - {reason}")
                 return False
             else:
                 # Truly new detection - allow notification
-                self.tracked_objects[track_id] = {
-                    "time": now,
-                    "position": center_position,
-                    "class": class_name
-                }
                 return True
 
-    def encode_frame_to_base64(self, frame, bbox):
-        """Extract bbox region from frame and encode as base64 JPEG"""
+    def encode_frame_to_base64(self, bbox_img):
+        """Encode a bbox crop (already clipped to the frame) as base64 JPEG"""
         try:
-            x1, y1, x2, y2 = bbox
-            # Ensure coordinates are within frame bounds
-            h, w = frame.shape[:2]
-            x1, y1 = max(0, x1), max(0, y1)
-            x2, y2 = min(w, x2), min(h, y2)
-
-            # Extract bbox region
-            bbox_img = frame[y1:y2, x1:x2]
-
             # Encode as JPEG
             _, buffer = cv2.imencode('.jpg', bbox_img, [cv2.IMWRITE_JPEG_QUALITY, 85])
             base64_str = base64.b64encode(buffer).decode('utf-8')
@@ -351,20 +608,36 @@ class NotificationManager:
         except Exception as e:
             self.logger.error(f"❌ Notification error: {e}")
 
-    def queue_notification(self, frame, box, class_name, track_id, confidence):
-        """Queue a notification for async sending (call from sync context)"""
+    async def encode_notification(self, roi, detection_data, detected_at):
+        """Encode the bbox crop as base64 JPEG in the default executor (off the inference thread and event loop)"""
+        # Wall-clock timestamp of the detection, derived here from its monotonic time (off the hot path)
+        detection_data["timestamp"] = (datetime.now() - timedelta(seconds=time.monotonic() - detected_at)).isoformat()
+        detection_data["frame_base64"] = await asyncio.get_running_loop().run_in_executor(
+            None, self.encode_frame_to_base64, roi
+        )
+        return detection_data
+
+    def _enqueue(self, item):
+        try:
+            self.notification_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.logger.warning("Notification queue full, dropping notification")
+
+    def queue_notification(self, roi, box, class_id, track_id, confidence, detected_at):
+        """Queue a notification for async sending (call from sync context)
+
+        roi is a private copy of the bbox pixels; box stays in frame coordinates for the payload.
+        detected_at is the time.monotonic() of the frame.
+        """
         # Extract bbox coordinates
         x1, y1, x2, y2 = box
 
-        # Encode frame with bbox
-        frame_base64 = self.encode_frame_to_base64(frame, [x1, y1, x2, y2])
-
-        # Prepare detection data
+        # Prepare detection data (timestamp and frame_base64 are filled in by the async consumer, see encode_notification)
         detection_data = {
-            "object_class": class_name,
+            "object_class": self.class_names[class_id],
             "track_id": int(track_id),
             "confidence": float(confidence),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": None,
             "device_name": self.config.STREAM_NAME,
             "device_type": self.config.STREAM_DEVICE,
             "bbox": {
@@ -373,42 +646,55 @@ class NotificationManager:
                 "x2": int(x2),
                 "y2": int(y2)
             },
-            "frame_base64": frame_base64
+            "frame_base64": None
         }
 
-        # Queue for async sending (non-blocking)
-        try:
-            self.notification_queue.put_nowait(detection_data)
-        except asyncio.QueueFull:
-            self.logger.warning("Notification queue full, dropping notification")
+        # Queue for async sending (non-blocking) - asyncio.Queue is not thread-safe, hand off to the loop
+        if self.loop is None:
+            self.logger.warning("NotificationManager not initialized, dropping notification")
+            return
+        self.loop.call_soon_threadsafe(self._enqueue, (roi, detection_data, detected_at))
 
 
 # ==================== VIDEO STREAM TRACK ====================
 class YOLOVideoStreamTrack(VideoStreamTrack):
     """WebRTC video stream track with YOLO detection"""
+    # Max time recv waits for a new processed frame before repeating the last one (one frame at 30 FPS)
+    FRAME_WAIT_TIMEOUT = 1 / 30
+
     def __init__(self, detector):
         super().__init__()
         self.detector = detector
         self.last_frame = None
+        # Set (via loop.call_soon_threadsafe) by the processing thread whenever a new frame lands
+        self.frame_event = asyncio.Event()
+        self.detector.frame_events.add(self.frame_event)
+
+    def stop(self):
+        self.detector.frame_events.discard(self.frame_event)
+        super().stop()
 
     async def recv(self):
         pts, time_base = await self.next_timestamp()
         frame = None
-        while not self.detector.processed_frame_queue.empty():
+        if not self.frame_event.is_set():
             try:
-                frame = self.detector.processed_frame_queue.get_nowait()
-            except queue.Empty:
-                break
+                await asyncio.wait_for(self.frame_event.wait(), timeout=self.FRAME_WAIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+        if self.frame_event.is_set():
+            self.frame_event.clear()
+            frame = self.detector.processed_frame
 
         if frame is None:
             frame = self.last_frame
         if frame is None:
-            frame = np.zeros((self.detector.config.OUTPUT_HEIGHT, self.detector.config.OUTPUT_WIDTH, 3), dtype=np.uint8)
+            frame = self.detector.black_frame
         else:
             self.last_frame = frame
 
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        av_frame = VideoFrame.from_ndarray(rgb_frame, format="rgb24")
+        # Processed frames are already RGB (converted once in the processing thread)
+        av_frame = VideoFrame.from_ndarray(frame, format="rgb24")
         av_frame.pts = pts
         av_frame.time_base = time_base
         return av_frame
@@ -423,24 +709,20 @@ class CleanVideoStreamTrack(VideoStreamTrack):
 
     async def recv(self):
         pts, time_base = await self.next_timestamp()
-        frame = None
 
-        # Get the most recent frame only (drop all intermediate frames for lowest latency)
-        while not self.detector.clean_frame_queue.empty():
-            try:
-                frame = self.detector.clean_frame_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Get the most recent frame only (single slot, newest wins - no queue lock or drain loop)
+        frame = self.detector.clean_frame
 
         if frame is None:
             frame = self.last_frame
         if frame is None:
-            frame = np.zeros((self.detector.config.OUTPUT_HEIGHT, self.detector.config.OUTPUT_WIDTH, 3), dtype=np.uint8)
+            frame = self.detector.black_frame
         else:
             self.last_frame = frame
 
-        # Resize for consistent output
-        frame = cv2.resize(frame, (self.detector.config.OUTPUT_WIDTH, self.detector.config.OUTPUT_HEIGHT))
+        # Resize for consistent output (NVDEC frames already match)
+        if frame.shape[:2] != (self.detector.config.OUTPUT_HEIGHT, self.detector.config.OUTPUT_WIDTH):
+            frame = cv2.resize(frame, (self.detector.config.OUTPUT_WIDTH, self.detector.config.OUTPUT_HEIGHT))
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         av_frame = VideoFrame.from_ndarray(rgb_frame, format="rgb24")
         av_frame.pts = pts
@@ -448,9 +730,17 @@ class CleanVideoStreamTrack(VideoStreamTrack):
         return av_frame
 
 
+# ==================== HTTP HELPERS ====================
+def json_response(data, status=200):
+    """web.json_response equivalent serialized with orjson (bytes body, no str round-trip)"""
+    return web.Response(body=orjson.dumps(data), status=status, content_type="application/json")
+
+
 # ==================== DETECTOR CLASS ====================
 class WebRTCDetector:
     """RTSP Stream Object Detection with YOLO and WebRTC"""
+    WS_SEND_BATCH = 64  # Max messages coalesced into one WebSocket frame
+
     def __init__(self, config=None):
         """
         Initialize WebRTC Detector
@@ -464,46 +754,169 @@ class WebRTCDetector:
         self.logger.info(f"Drone Serial: {self.config.DRONE_SERIAL}")
         self.logger.info("Loading YOLO model...")
 
-        self.model = YOLO(self.config.YOLO_MODEL)
-        if torch.cuda.is_available():
-            self.device = "cuda"
-            self.model.to(self.device)  # Removed .half() to fix tracking dtype error
-            self.logger.info(f"Using CUDA: {torch.cuda.get_device_name(0)} (FP32 mode - tracking enabled)")
-        else:
-            print("CUDA not available, using CPU")
-            self.device = "cpu"
-            self.model.to(self.device)
-            self.logger.warning("CUDA not available — using CPU")
-
-        self.class_colors = {cls: (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-                             for cls in self.model.names.keys()}
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.is_engine = False
+        self.model = self.load_model()
+        # Inference size - must match the static TensorRT engine shape
+        self.imgsz = self.config.INFERENCE_IMGSZ
+        # With Fast NMS, Ultralytics' own NMS is loosened and ours runs in predict's postprocess callback,
+        # i.e. before the tracker sees the boxes
+        self.predict_iou = self.config.FAST_NMS_PRE_IOU if self.config.FAST_NMS else self.config.NMS_THRESHOLD
+        if self.config.FAST_NMS:
+            self.model.add_callback("on_predict_postprocess_end", self.fast_nms_callback)
+
+        # Reusable resize targets, one per batch slot (touched only by the processing thread). Safe to reuse:
+        # notifications copy their ROI and publish_processed_frame converts into a new RGB array.
+        self._resize_buffers = np.empty((self.config.MAX_BATCH, self.config.OUTPUT_HEIGHT, self.config.OUTPUT_WIDTH, 3),
+                                        dtype=np.uint8)
+
+        # Pinned (page-locked) host staging buffers, double-buffered, for async H2D upload on CUDA.
+        # Layout is NHWC uint8 at the inference shape; frames are written top-left so any stride padding stays
+        # zero and boxes come back in display coordinates.
+        self.pinned_upload = self.device == "cuda"
+        self.nvenc_enabled = self.device == "cuda" and self.config.USE_NVENC and enable_nvenc()
+        if self.nvenc_enabled:
+            self.logger.info("Using NVENC for WebRTC video encoding (H264 preferred)")
+        if self.pinned_upload:
+            upload_shape = (self.config.MAX_BATCH, self.imgsz[0], self.imgsz[1], 3)
+            self._host_buffers = [torch.zeros(upload_shape, dtype=torch.uint8, pin_memory=True) for _ in range(2)]
+            self._host_views = [buffer.numpy() for buffer in self._host_buffers]
+            self._device_buffers = [torch.zeros(upload_shape, dtype=torch.uint8, device=self.device) for _ in range(2)]
+            self._upload_stream = torch.cuda.Stream()
+            self._upload_slot = 0
+
+        # BoT-SORT tracker owned by the detector (config parsed once) and fed from plain predict() results,
+        # so tracking doesn't depend on Ultralytics' track() wrapper and survives inference errors
+        with open(check_yaml(self.config.TRACKER_CONFIG)) as f:
+            tracker_args = IterableSimpleNamespace(**yaml.safe_load(f))
+        self.tracker = BOTSORT(args=tracker_args, frame_rate=30)
+
+        # Color lookup table indexed by class ID - shape (num_classes, 3)
+        self.class_colors = np.random.randint(0, 256, (max(self.model.names.keys()) + 1, 3), dtype=np.uint8)
 
         # Log surveillance classes being monitored
         surveillance_class_names = [self.model.names[cls_id] for cls_id in self.config.SURVEILLANCE_CLASSES]
         self.logger.info(f"Monitoring {len(surveillance_class_names)} surveillance classes: {', '.join(surveillance_class_names)}")
 
         # Initialize notification manager
-        self.notification_manager = NotificationManager(self.config, self.logger)
+        self.notification_manager = NotificationManager(self.config, self.logger, self.model.names)
+        self._notif_get_task = None  # Pending notification_queue.get(), cancelled on shutdown
 
         self.cap = None
+        self._cap_open = False  # Mirrors cap.isOpened() for the health probe (written by the capture side)
         self.cap_lock = Lock()  # Protect cap operations
         self.reconnect_count = 0
         self.peer_connections = set()
         self.clean_peer_connections = set()
+        # ICE config is identical for every peer (AI and clean) - build it once
+        self._rtc_config = RTCConfiguration(iceServers=[RTCIceServer(urls=["stun:stun.l.google.com:19302"])])
         self.stop_event = Event()
         self.restart_capture_event = Event()  # Signal to restart capture
 
-        self.raw_frame_queue = queue.Queue(maxsize=1)
-        self.processed_frame_queue = queue.Queue(maxsize=1)
-        self.clean_frame_queue = queue.Queue(maxsize=1)  # For clean stream (zero latency)
+        self.raw_frames = FrameRing(self.config.MAX_BATCH)  # Room for the batch collect window, oldest dropped first
+        # Latest annotated frame - written only by the processing thread (sole CUDA owner), read by AI tracks.
+        # Together with each track's last_frame this is a double buffer; no queue polling on the event loop.
+        self.processed_frame = None  # RGB
+        # Shared read-only placeholder sent before the first frame arrives
+        self.black_frame = np.zeros((self.config.OUTPUT_HEIGHT, self.config.OUTPUT_WIDTH, 3), dtype=np.uint8)
+        self.black_frame.setflags(write=False)
+        self.frame_events = set()  # asyncio.Event per YOLOVideoStreamTrack
+        self.loop = None  # asyncio loop serving the tracks (set in run)
+        # Latest captured frame for the clean stream (zero latency). A plain reference swap: the capture thread
+        # assigns, tracks read - atomic under the GIL, so no lock or Queue is needed for a latest-wins slot.
+        self.clean_frame = None
 
         self.last_fps_time = time.time()
         self.frame_count = 0
         self.fps = 0.0
-        self.last_frame_time = time.time()  # for watchdog
-        self.last_capture_time = time.time()  # Track capture thread health
+        # Watchdog timestamps are time.monotonic() so wall-clock/NTP jumps can't trip (or mask) a stall
+        self.last_frame_time = time.monotonic()  # for watchdog
+        self.last_capture_time = time.monotonic()  # Track capture thread health
+        self._wd_cv = Condition()  # Watchdog sleeps on this; shutdown notifies it
+        self.health_loop = None  # Event loop of the health/metrics server thread
         self.is_healthy = True  # Overall health status
-        self.frame_skip_counter = 0  # For frame skipping optimization
+        self.frame_skip_counter = 0  # Captured-frame counter for PROCESS_EVERY_N_FRAMES (capture thread)
+
+        # Metrics exposition: the constant stream label is formatted in once, and the encoded
+        # body is only rebuilt when one of the gauge values changes between scrapes
+        self._metrics_tpl = """# HELP stream_fps Current frames per second
+# TYPE stream_fps gauge
+stream_fps{{{{stream="{name}"}}}} {{fps}}
+
+# HELP stream_healthy Stream health status (1=healthy, 0=unhealthy)
+# TYPE stream_healthy gauge
+stream_healthy{{{{stream="{name}"}}}} {{healthy}}
+
+# HELP stream_reconnects Total number of reconnections
+# TYPE stream_reconnects counter
+stream_reconnects{{{{stream="{name}"}}}} {{reconnects}}
+
+# HELP stream_clients_ai Number of connected WebRTC clients (AI detection)
+# TYPE stream_clients_ai gauge
+stream_clients_ai{{{{stream="{name}"}}}} {{clients_ai}}
+
+# HELP stream_clients_clean Number of connected WebRTC clients (clean stream)
+# TYPE stream_clients_clean gauge
+stream_clients_clean{{{{stream="{name}"}}}} {{clients_clean}}
+""".format(name=self.config.STREAM_NAME.replace("{", "{{").replace("}", "}}"))  # Braces survive the second format()
+        self._metrics_key = None
+        self._metrics_body = b""
+
+    def load_model(self):
+        """Load the TensorRT engine on CUDA (exporting it once if missing), else the PyTorch weights"""
+        if self.device == "cuda" and self.config.USE_TENSORRT:
+            try:
+                if not os.path.exists(self.config.YOLO_ENGINE):
+                    self.logger.info(f"TensorRT engine not found, exporting {self.config.YOLO_MODEL} (one-time)...")
+                    export_tensorrt_engine(self.config)
+                model = YOLO(self.config.YOLO_ENGINE, task="detect")
+                self.is_engine = True
+                self.logger.info(f"Using CUDA: {torch.cuda.get_device_name(0)} (TensorRT FP16 engine: {self.config.YOLO_ENGINE})")
+                return model
+            except Exception as e:
+                self.logger.warning(f"TensorRT engine unavailable, falling back to PyTorch: {e}")
+
+        model = YOLO(self.config.YOLO_MODEL)
+        model.to(self.device)  # Removed .half() to fix tracking dtype error
+        if self.device == "cuda":
+            if self.config.TORCH_TENSORRT and self.compile_pytorch_model(model):
+                self.logger.info(f"Using CUDA: {torch.cuda.get_device_name(0)} (Torch-TensorRT FP16 - tracking enabled)")
+            else:
+                self.logger.info(f"Using CUDA: {torch.cuda.get_device_name(0)} (FP32 mode - tracking enabled)")
+        else:
+            print("CUDA not available, using CPU")
+            self.logger.warning("CUDA not available — using CPU")
+        return model
+
+    def compile_pytorch_model(self, model):
+        """
+        Compile the PyTorch model's forward with the Torch-TensorRT torch.compile backend (FP16)
+
+        The module itself stays a regular DetectionModel, so Ultralytics' .track() keeps working and
+        TensorRT owns the precision reduction (inputs stay FP32). Falls back to eager on any failure.
+
+        Returns:
+            bool: True if the compiled forward is in use
+        """
+        eager_forward = model.model.forward
+        try:
+            import torch_tensorrt  # noqa: F401 - registers the "torch_tensorrt" backend
+
+            model.model.forward = torch.compile(
+                eager_forward,
+                backend="torch_tensorrt",
+                dynamic=False,
+                options={"enabled_precisions": {torch.float16}, "truncate_long_and_double": True}
+            )
+            # Compilation is lazy - warm up now so failures surface here rather than on the first live frame
+            height, width = self.config.INFERENCE_IMGSZ
+            model.predict(np.zeros((height, width, 3), dtype=np.uint8), imgsz=self.config.INFERENCE_IMGSZ,
+                          verbose=False, device=self.device)
+            return True
+        except Exception as e:
+            model.model.forward = eager_forward
+            self.logger.warning(f"Torch-TensorRT compile unavailable, using eager PyTorch: {e}")
+            return False
 
     def setup_logging(self):
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -517,13 +930,9 @@ class WebRTCDetector:
                 if self.cap is not None:
                     self.cap.release()
                     self.cap = None
+                    self._cap_open = False
 
-                # Create capture with timeout settings
-                self.cap = cv2.VideoCapture(self.config.RTSP_URL, cv2.CAP_FFMPEG)
-                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.config.BUFFER_SIZE)
-                # Set read timeout (in milliseconds)
-                self.cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self.config.RTSP_TIMEOUT * 1000)
-                self.cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, self.config.CAPTURE_READ_TIMEOUT * 1000)
+                self.cap = self.open_capture()
 
                 if not self.cap.isOpened():
                     raise ConnectionError("Failed to open video stream")
@@ -532,6 +941,7 @@ class WebRTCDetector:
                 if not ret or frame is None:
                     raise ConnectionError("Failed to read initial frame")
 
+            self._cap_open = True
             self.logger.info("RTSP connected successfully")
             self.reconnect_count = 0
             return True
@@ -541,42 +951,79 @@ class WebRTCDetector:
                 if self.cap:
                     self.cap.release()
                     self.cap = None
+                    self._cap_open = False
             return False
 
-    def draw_boxes(self, frame, results):
-        """Draw bounding boxes with tracking IDs and info overlay"""
+    def open_capture(self):
+        """Create the capture with timeout settings - NVDEC via PyAV on CUDA, falling back to OpenCV/FFmpeg"""
+        if self.config.CAPTURE_BACKEND == "nvdec" and self.device == "cuda":
+            try:
+                cap = NvdecCapture(self.config.RTSP_URL, self.config)
+                self.logger.info("Using NVDEC hardware decode")
+                return cap
+            except Exception as e:
+                self.logger.warning(f"NVDEC capture unavailable, falling back to OpenCV: {e}")
+
+        cap = cv2.VideoCapture(self.config.RTSP_URL, cv2.CAP_FFMPEG)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, self.config.BUFFER_SIZE)
+        # Set read timeout (in milliseconds)
+        cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self.config.RTSP_TIMEOUT * 1000)
+        cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, self.config.CAPTURE_READ_TIMEOUT * 1000)
+        return cap
+
+    def fast_nms_callback(self, predictor):
+        """Apply Fast NMS to each result in place (on device, no host round-trip)"""
+        for result in predictor.results:
+            boxes = result.boxes
+            if boxes is not None and len(boxes) > 1:
+                result.boxes = boxes[fast_nms(boxes.xyxy, boxes.conf, boxes.cls, self.config.NMS_THRESHOLD)]
+
+    def draw_boxes(self, frame, results, render=True):
+        """
+        Draw bounding boxes with tracking IDs and info overlay
+
+        Notifications are always evaluated; the overlay itself is only rendered when render is True
+        (i.e. the frame will actually be shown to an AI-stream viewer).
+        """
         boxes = results.boxes
         names = self.model.names
+        frame_h, frame_w = frame.shape[:2]
+        detection_time = time.monotonic()  # One clock read per frame for all notification checks
         if boxes is not None and len(boxes) > 0:
-            for box in boxes:
-                x1, y1, x2, y2 = box.xyxy[0].int().tolist()
-                conf = float(box.conf[0])
-                cls = int(box.cls[0])
+            # One device->host transfer for all boxes, then plain Python lists (no per-box tensor access)
+            boxes = boxes.cpu()
+            xyxy = boxes.xyxy.int().tolist()
+            confs = boxes.conf.tolist()
+            classes = boxes.cls.int().tolist()
+            # Track IDs if available (BoT-SORT)
+            track_ids = boxes.id.int().tolist() if boxes.id is not None else [None] * len(xyxy)
 
-                # Get track ID if available (BoT-SORT)
-                track_id = None
-                if hasattr(box, 'id') and box.id is not None:
-                    track_id = int(box.id[0])
+            for (x1, y1, x2, y2), conf, cls, track_id in zip(xyxy, confs, classes, track_ids):
 
                 # Check if this is a new detection and queue notification
-                if track_id is not None and self.notification_manager.is_new_detection(track_id, names[cls], [x1, y1, x2, y2]):
+                if track_id is not None and self.notification_manager.is_new_detection(track_id, cls, [x1, y1, x2, y2], detection_time):
                     self.logger.info(f"🆕 New object detected: {names[cls]}#{track_id}")
-                    # Queue notification (non-blocking)
+                    # Queue notification (non-blocking) - copy only the bbox pixels, not the whole frame
+                    roi = frame[max(0, y1):min(frame_h, y2), max(0, x1):min(frame_w, x2)].copy()
                     self.notification_manager.queue_notification(
-                        frame=frame.copy(),
+                        roi=roi,
                         box=[x1, y1, x2, y2],
-                        class_name=names[cls],
+                        class_id=cls,
                         track_id=track_id,
-                        confidence=conf
+                        confidence=conf,
+                        detected_at=detection_time
                     )
 
+                if not render:
+                    continue
+
                 # Build label with track ID
                 if track_id is not None:
                     label = f"{names[cls]}#{track_id} {conf*100:.1f}%"
                 else:
                     label = f"{names[cls]} {conf*100:.1f}%"
 
-                color = self.class_colors.get(cls, (0, 255, 0))
+                color = tuple(self.class_colors[cls].tolist())  # cv2 needs Python ints
                 cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
                 (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
                 cv2.rectangle(frame, (x1, y1 - 20), (x1 + w, y1), color, -1)
@@ -591,6 +1038,9 @@ class WebRTCDetector:
             self.last_fps_time = now
             self.frame_count = 0
 
+        if not render:
+            return frame
+
         # Draw stream info overlay
         cv2.putText(frame, f"{self.config.STREAM_NAME}", (10, 25),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
@@ -599,53 +1049,115 @@ class WebRTCDetector:
         return frame
 
     def process_frame(self, frame):
-        """Process frame with YOLO inference and optional ByteTrack object tracking"""
-        frame = cv2.resize(frame, (self.config.OUTPUT_WIDTH, self.config.OUTPUT_HEIGHT))
+        """Process a single frame (see process_batch)"""
+        return self.process_batch([frame])[0]
+
+    def upload_batch(self, frames):
+        """
+        Stage frames in a pinned host buffer and copy them to the GPU on the upload stream
+
+        Returns:
+            Float RGB NCHW tensor (0-1) on the device, ready to be passed to the model as source
+        """
+        slot = self._upload_slot
+        self._upload_slot ^= 1
+        host_view = self._host_views[slot]
+        for i, frame in enumerate(frames):
+            host_view[i, :frame.shape[0], :frame.shape[1]] = frame
+
+        n = len(frames)
+        device_buffer = self._device_buffers[slot]
+        # Don't overwrite the device buffer while the default stream may still be reading it (two batches ago)
+        self._upload_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(self._upload_stream):
+            device_buffer[:n].copy_(self._host_buffers[slot][:n], non_blocking=True)
+        torch.cuda.current_stream().wait_stream(self._upload_stream)
+
+        # BGR NHWC uint8 -> RGB NCHW float (Ultralytics skips its own BGR->RGB and /255 for tensor sources)
+        return device_buffer[:n].flip(-1).permute(0, 3, 1, 2).float().div_(255)
+
+    def update_tracks(self, result, frame):
+        """Run BoT-SORT on one frame's detections and attach track IDs (same as Ultralytics' track callback)"""
+        try:
+            tracks = self.tracker.update(result.boxes.cpu().numpy(), frame)
+        except Exception as track_error:
+            # Keep the detections (without IDs) and the tracker state
+            self.logger.warning(f"Tracking failed, using detection only: {track_error}")
+            return result
+        if len(tracks) == 0:
+            return result
+        # tracks: [x1, y1, x2, y2, track_id, score, cls, det_index]
+        result = result[tracks[:, -1].astype(int)]
+        result.update(boxes=torch.as_tensor(tracks[:, :-1]))
+        return result
+
+    def process_batch(self, frames):
+        """Process a batch of frames with one YOLO inference call and BoT-SORT object tracking"""
+        # Single resize to the display size, into the preallocated buffers; boxes come back in these
+        # coordinates (no rescale needed). NVDEC frames are already scaled by the decoder - copy those
+        # instead, since captured frames are shared with the clean stream and draw_boxes draws in place.
+        output_size = (self.config.OUTPUT_HEIGHT, self.config.OUTPUT_WIDTH)
+        resized = []
+        for frame, buffer in zip(frames, self._resize_buffers):
+            if frame.shape[:2] == output_size:
+                np.copyto(buffer, frame)
+            else:
+                cv2.resize(frame, (self.config.OUTPUT_WIDTH, self.config.OUTPUT_HEIGHT), dst=buffer,
+                           interpolation=cv2.INTER_LINEAR)
+            resized.append(buffer)
+        frames = resized
         try:
             with torch.no_grad():
-                # Try tracking first, fall back to detection if tracking fails
-                try:
-                    results = self.model.track(
-                        frame,
-                        conf=self.config.CONFIDENCE_THRESHOLD,
-                        iou=self.config.NMS_THRESHOLD,
-                        classes=self.config.SURVEILLANCE_CLASSES,  # Filter to surveillance classes
-                        persist=True,
-                        tracker="botsort.yaml",  # BoT-SORT for better ID persistence
-                        verbose=False,
-                        device=self.device
-                    )[0]
-                except Exception as track_error:
-                    # Fall back to regular detection if tracking fails
-                    self.logger.warning(f"Tracking failed, using detection only: {track_error}")
-                    results = self.model.predict(
-                        frame,
-                        conf=self.config.CONFIDENCE_THRESHOLD,
-                        iou=self.config.NMS_THRESHOLD,
-                        classes=self.config.SURVEILLANCE_CLASSES,  # Filter to surveillance classes
-                        verbose=False,
-                        device=self.device
-                    )[0]
-
-            if self.device == "cuda":
-                torch.cuda.synchronize()
-            frame = self.draw_boxes(frame, results)
+                source = self.upload_batch(frames) if self.pinned_upload else frames
+                results = self.model.predict(
+                    source,
+                    conf=self.config.CONFIDENCE_THRESHOLD,
+                    iou=self.predict_iou,
+                    classes=self.config.SURVEILLANCE_CLASSES,  # Filter to surveillance classes
+                    imgsz=self.imgsz,
+                    rect=False,  # Fixed shape - LetterBox is a no-op on the pre-resized frame
+                    verbose=False,
+                    device=self.device
+                )
+
+            # Frames are consecutive frames of this detector's single stream, so the tracker
+            # consumes the batch results in order and IDs stay consistent
+            results = [self.update_tracks(result, frame) for frame, result in zip(frames, results)]
+
+            # No explicit torch.cuda.synchronize(): the device->host reads of the boxes in draw_boxes sync only what they need
+            # Only the newest frame of a batch is published, and only if an AI-stream track is connected -
+            # skip the CPU overlay rendering for everything else
+            has_viewers = bool(self.frame_events)
+            last = len(frames) - 1
+            frames = [self.draw_boxes(frame, result, render=has_viewers and i == last)
+                      for i, (frame, result) in enumerate(zip(frames, results))]
             self.is_healthy = True
         except Exception as e:
             self.logger.error(f"Error in inference: {e}")
             self.is_healthy = False
             # Draw error message on frame
-            cv2.putText(frame, "INFERENCE ERROR", (10, 100),
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+            for frame in frames:
+                cv2.putText(frame, "INFERENCE ERROR", (10, 100),
+                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
         finally:
-            # Always update frame time and clean GPU memory
-            self.last_frame_time = time.time()
-            if self.device == "cuda":
-                try:
-                    torch.cuda.empty_cache()
-                except:
-                    pass
-        return frame
+            # Always update frame time (no per-frame empty_cache - it stalls the stream and forces reallocation)
+            self.last_frame_time = time.monotonic()
+        return frames
+
+    def collect_batch(self):
+        """Wait for one raw frame, then gather up to MAX_BATCH frames within the collect window"""
+        frame = self.raw_frames.pop(timeout=1)
+        if frame is None:
+            return []
+        batch = [frame]
+        deadline = time.monotonic() + self.config.BATCH_COLLECT_MS / 1000.0
+        while len(batch) < self.config.MAX_BATCH:
+            # timeout=0 once the window has passed still takes anything already buffered
+            frame = self.raw_frames.pop(timeout=max(deadline - time.monotonic(), 0))
+            if frame is None:
+                break
+            batch.append(frame)
+        return batch
 
     def capture_thread_worker(self):
         """Continuously capture frames from RTSP with timeout protection"""
@@ -657,6 +1169,7 @@ class WebRTCDetector:
                     if self.cap:
                         self.cap.release()
                         self.cap = None
+                        self._cap_open = False
                 self.restart_capture_event.clear()
 
             # Reconnect if needed
@@ -681,23 +1194,25 @@ class WebRTCDetector:
                         if self.cap:
                             self.cap.release()
                             self.cap = None
+                            self._cap_open = False
                     time.sleep(1)
                     continue
 
                 # Successfully captured frame
-                self.last_capture_time = time.time()
+                self.last_capture_time = time.monotonic()
 
                 # Feed frame to AI detection pipeline
-                try:
-                    self.raw_frame_queue.put_nowait(frame)
-                except queue.Full:
-                    pass  # Drop old frame
+                # Frame skipping happens here, so skipped frames never enter the ring; AI tracks keep
+                # re-sending the last processed frame in between. Ring drops the oldest frame when full.
+                self.frame_skip_counter += 1
+                n = self.config.PROCESS_EVERY_N_FRAMES
+                if n <= 1 or self.frame_skip_counter % n == 0:
+                    self.raw_frames.push(frame)
 
-                # Feed frame to clean stream (zero latency - always use fresh frame)
-                try:
-                    self.clean_frame_queue.put_nowait(frame.copy())
-                except queue.Full:
-                    pass  # Drop old frame
+                # Feed frame to clean stream (zero latency - always use fresh frame).
+                # No copy: cap.read() / NVDEC allocate a new ndarray per frame, and consumers must never
+                # mutate a captured frame in place (process_batch draws on its own resized/copied frame).
+                self.clean_frame = frame
 
             except Exception as e:
                 self.logger.error(f"Capture error: {e}")
@@ -705,43 +1220,35 @@ class WebRTCDetector:
                     if self.cap:
                         self.cap.release()
                         self.cap = None
+                        self._cap_open = False
                 time.sleep(1)
 
     def processing_thread_worker(self):
-        """Run YOLO inference on captured frames with optional frame skipping"""
-        last_processed_frame = None
+        """Run YOLO inference on the frames the capture thread selected"""
         while not self.stop_event.is_set():
             try:
-                frame = self.raw_frame_queue.get(timeout=1)
+                frames = self.collect_batch()
+                if not frames:
+                    continue
 
-                # Frame skipping logic for performance boost
-                self.frame_skip_counter += 1
-                if self.config.PROCESS_EVERY_N_FRAMES > 1:
-                    if self.frame_skip_counter % self.config.PROCESS_EVERY_N_FRAMES != 0:
-                        # Skip this frame, but re-use last processed frame with current raw overlay
-                        if last_processed_frame is not None:
-                            try:
-                                self.processed_frame_queue.put_nowait(last_processed_frame)
-                            except queue.Full:
-                                pass
-                        continue
-
-                # Process this frame
-                processed = self.process_frame(frame)
-                last_processed_frame = processed
-                try:
-                    self.processed_frame_queue.put_nowait(processed)
-                except queue.Full:
-                    pass
-            except queue.Empty:
-                continue
+                # Frames were already decimated by the capture thread; every one here gets inference.
+                # Process the batch; only the newest result is shown (notifications fire for every frame)
+                self.publish_processed_frame(self.process_batch(frames)[-1])
             except Exception as e:
                 self.logger.error(f"Processing error: {e}")
 
+    def publish_processed_frame(self, frame):
+        """Swap in the latest processed frame and wake the AI tracks (called from the processing thread)"""
+        # Convert to RGB here, once per published frame, instead of in every track's recv
+        self.processed_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if self.loop is not None:
+            for frame_event in list(self.frame_events):
+                self.loop.call_soon_threadsafe(frame_event.set)
+
     def watchdog_thread_worker(self):
         """Enhanced watchdog: monitors both capture and processing threads"""
         while not self.stop_event.is_set():
-            now = time.time()
+            now = time.monotonic()
 
             # Check if processing is stale
             if now - self.last_frame_time > self.config.WATCHDOG_TIMEOUT:
@@ -756,39 +1263,59 @@ class WebRTCDetector:
                 self.restart_capture_event.set()
 
             # Check queue health
-            if self.raw_frame_queue.qsize() == 0 and self.processed_frame_queue.qsize() == 0:
+            if len(self.raw_frames) == 0:
                 if now - self.last_capture_time > 5:
                     self.logger.warning("Watchdog: Queues empty, possible pipeline stall")
                     self.restart_capture_event.set()
 
-            time.sleep(3)
+            with self._wd_cv:
+                self._wd_cv.wait_for(self.stop_event.is_set, timeout=3)
+
+    def wake_watchdog(self):
+        """Wake the watchdog so it sees stop_event immediately instead of after its 3s sleep"""
+        with self._wd_cv:
+            self._wd_cv.notify_all()
 
     async def notification_worker(self):
         """Async worker that processes notification queue"""
         self.logger.info("Notification worker started")
         while not self.stop_event.is_set():
+            # Block on the queue with no timeout; shutdown cancels this get() directly
+            self._notif_get_task = asyncio.create_task(self.notification_manager.notification_queue.get())
             try:
-                # Get notification from queue (with timeout to allow checking stop_event)
-                detection_data = await asyncio.wait_for(
-                    self.notification_manager.notification_queue.get(),
-                    timeout=1.0
-                )
+                roi, detection_data, detected_at = await self._notif_get_task
+            except asyncio.CancelledError:
+                break
+            finally:
+                self._notif_get_task = None
+            try:
+                # JPEG-encode the crop here rather than on the inference thread
+                detection_data = await self.notification_manager.encode_notification(roi, detection_data, detected_at)
                 # Send notification
                 await self.notification_manager.send_notification(detection_data)
-            except asyncio.TimeoutError:
-                continue  # No notification in queue, check again
             except Exception as e:
                 self.logger.error(f"Error in notification worker: {e}")
+        self.logger.info("Notification worker stopped")
+
+    def cancel_notification_wait(self):
+        """Wake the notification worker out of its queue get() (event loop thread only)"""
+        if self._notif_get_task is not None:
+            self._notif_get_task.cancel()
 
     async def websocket_handler(self, request):
         """WebSocket handler for AI detection stream"""
         ws = web_ws.WebSocketResponse()
         await ws.prepare(request)
         self.logger.info("WebSocket connected (AI detection stream)")
-        async for msg in ws:
-            if msg.type == web_ws.WSMsgType.TEXT:
-                data = json.loads(msg.data)
-                await self.handle_signaling_message(ws, data)
+        outbox = asyncio.Queue()
+        writer = asyncio.create_task(self.websocket_writer(ws, outbox))
+        try:
+            async for msg in ws:
+                if msg.type == web_ws.WSMsgType.TEXT:
+                    data = orjson.loads(msg.data)
+                    await self.handle_signaling_message(outbox, data)
+        finally:
+            writer.cancel()
         self.logger.info("WebSocket closed (AI detection stream)")
         return ws
 
@@ -797,44 +1324,87 @@ class WebRTCDetector:
         ws = web_ws.WebSocketResponse()
         await ws.prepare(request)
         self.logger.info("WebSocket connected (CLEAN stream)")
-        async for msg in ws:
-            if msg.type == web_ws.WSMsgType.TEXT:
-                data = json.loads(msg.data)
-                await self.handle_clean_signaling_message(ws, data)
+        outbox = asyncio.Queue()
+        writer = asyncio.create_task(self.websocket_writer(ws, outbox))
+        try:
+            async for msg in ws:
+                if msg.type == web_ws.WSMsgType.TEXT:
+                    data = orjson.loads(msg.data)
+                    await self.handle_clean_signaling_message(outbox, data)
+        finally:
+            writer.cancel()
         self.logger.info("WebSocket closed (CLEAN stream)")
         return ws
 
-    async def handle_signaling_message(self, ws, data):
+    async def websocket_writer(self, ws, outbox):
+        """
+        Single writer per WebSocket: drain everything queued and send it as one frame
+
+        Every frame is a JSON array of messages, even when only one is ready (see the
+        wire-format note above handle_signaling_message); up to WS_SEND_BATCH ready
+        messages share a frame.
+
+        Args:
+            ws: WebSocketResponse to write to
+            outbox: asyncio.Queue of already-serialized JSON strings
+        """
+        while not ws.closed:
+            batch = [await outbox.get()]
+            while len(batch) < self.WS_SEND_BATCH:
+                try:
+                    batch.append(outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await ws.send_str("[" + ",".join(batch) + "]")
+            except ConnectionResetError:
+                break
+
+    def prefer_h264(self, pc):
+        """Put H264 first in the video codec preferences so the NVENC encoder is negotiated"""
+        if not self.nvenc_enabled:
+            return
+        codecs = RTCRtpSender.getCapabilities("video").codecs
+        preferred = [c for c in codecs if c.mimeType == "video/H264"] + [c for c in codecs if c.mimeType != "video/H264"]
+        for transceiver in pc.getTransceivers():
+            if transceiver.kind == "video":
+                transceiver.setCodecPreferences(preferred)
+
+    # Signaling wire format (both /ws and /ws-clean):
+    #   client -> server: one JSON object per frame, e.g. {"type": "offer", "sdp": ...}
+    #   server -> client: every frame is a JSON array of message objects, e.g.
+    #                     [{"type": "answer", "sdp": ...}] - clients iterate the array
+    async def handle_signaling_message(self, outbox, data):
         """Handle WebRTC signaling for AI detection stream"""
         if data.get("type") == "offer":
-            config = RTCConfiguration(iceServers=[RTCIceServer(urls=["stun:stun.l.google.com:19302"])])
-            pc = RTCPeerConnection(configuration=config)
+            pc = RTCPeerConnection(configuration=self._rtc_config)
             self.peer_connections.add(pc)
             # Create a new track instance for each peer connection
             video_track = YOLOVideoStreamTrack(self)
             pc.addTrack(video_track)
+            self.prefer_h264(pc)
             await pc.setRemoteDescription(RTCSessionDescription(sdp=data["sdp"], type=data["type"]))
             answer = await pc.createAnswer()
             await pc.setLocalDescription(answer)
-            await ws.send_str(json.dumps({"type": "answer", "sdp": pc.localDescription.sdp}))
+            outbox.put_nowait(orjson.dumps({"type": "answer", "sdp": pc.localDescription.sdp}).decode())
 
-    async def handle_clean_signaling_message(self, ws, data):
+    async def handle_clean_signaling_message(self, outbox, data):
         """Handle WebRTC signaling for clean stream"""
         if data.get("type") == "offer":
-            config = RTCConfiguration(iceServers=[RTCIceServer(urls=["stun:stun.l.google.com:19302"])])
-            pc = RTCPeerConnection(configuration=config)
+            pc = RTCPeerConnection(configuration=self._rtc_config)
             self.clean_peer_connections.add(pc)
             # Create a new track instance for each peer connection
             clean_track = CleanVideoStreamTrack(self)
             pc.addTrack(clean_track)
+            self.prefer_h264(pc)
             await pc.setRemoteDescription(RTCSessionDescription(sdp=data["sdp"], type=data["type"]))
             answer = await pc.createAnswer()
             await pc.setLocalDescription(answer)
-            await ws.send_str(json.dumps({"type": "answer", "sdp": pc.localDescription.sdp}))
+            outbox.put_nowait(orjson.dumps({"type": "answer", "sdp": pc.localDescription.sdp}).decode())
 
     async def health_check_handler(self, request):
         """Health check endpoint for Kubernetes liveness/readiness probes"""
-        now = time.time()
+        now = time.monotonic()
         capture_age = now - self.last_capture_time
         processing_age = now - self.last_frame_time
 
@@ -847,7 +1417,7 @@ class WebRTCDetector:
             "reconnect_count": self.reconnect_count,
             "connected_clients_ai": len(self.peer_connections),
             "connected_clients_clean": len(self.clean_peer_connections),
-            "is_streaming": self.cap is not None and self.cap.isOpened()
+            "is_streaming": self._cap_open
         }
 
         # Determine HTTP status code
@@ -858,43 +1428,37 @@ class WebRTCDetector:
         else:
             status = 503  # Unhealthy
 
-        return web.json_response(health_data, status=status)
+        return json_response(health_data, status=status)
 
     async def metrics_handler(self, request):
         """Prometheus-style metrics endpoint"""
-        metrics = f"""# HELP stream_fps Current frames per second
-# TYPE stream_fps gauge
-stream_fps{{stream="{self.config.STREAM_NAME}"}} {self.fps}
-
-# HELP stream_healthy Stream health status (1=healthy, 0=unhealthy)
-# TYPE stream_healthy gauge
-stream_healthy{{stream="{self.config.STREAM_NAME}"}} {1 if self.is_healthy else 0}
-
-# HELP stream_reconnects Total number of reconnections
-# TYPE stream_reconnects counter
-stream_reconnects{{stream="{self.config.STREAM_NAME}"}} {self.reconnect_count}
-
-# HELP stream_clients_ai Number of connected WebRTC clients (AI detection)
-# TYPE stream_clients_ai gauge
-stream_clients_ai{{stream="{self.config.STREAM_NAME}"}} {len(self.peer_connections)}
-
-# HELP stream_clients_clean Number of connected WebRTC clients (clean stream)
-# TYPE stream_clients_clean gauge
-stream_clients_clean{{stream="{self.config.STREAM_NAME}"}} {len(self.clean_peer_connections)}
-"""
-        return web.Response(text=metrics, content_type="text/plain")
+        key = (self.fps, 1 if self.is_healthy else 0, self.reconnect_count,
+               len(self.peer_connections), len(self.clean_peer_connections))
+        if key != self._metrics_key:
+            fps, healthy, reconnects, clients_ai, clients_clean = key
+            self._metrics_body = self._metrics_tpl.format(
+                fps=fps, healthy=healthy, reconnects=reconnects,
+                clients_ai=clients_ai, clients_clean=clients_clean
+            ).encode()
+            self._metrics_key = key
+        return web.Response(body=self._metrics_body, content_type="text/plain")
+
+    @staticmethod
+    async def set_tcp_nodelay(request, response):
+        """on_response_prepare hook: disable Nagle so small answer/health frames aren't held back by delayed ACK"""
+        sock = request.transport.get_extra_info("socket") if request.transport else None
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     async def run_web_server(self):
         app = web.Application()
+        app.on_response_prepare.append(self.set_tcp_nodelay)  # Covers both WS routes and HTTP
         cors = cors_setup(app, defaults={"*": ResourceOptions(allow_credentials=True, expose_headers="*", allow_headers="*", allow_methods="*")})
 
         # Add routes - using serial number in path
         serial = self.config.DRONE_SERIAL if hasattr(self.config, 'DRONE_SERIAL') else 'UNKNOWN'
         app.router.add_get(f"/{serial}/ai", self.websocket_handler)
         app.router.add_get(f"/{serial}", self.websocket_clean_handler)
-        app.router.add_get("/health", self.health_check_handler)
-        app.router.add_get("/healthz", self.health_check_handler)  # K8s convention
-        app.router.add_get("/metrics", self.metrics_handler)
 
         for route in list(app.router.routes()):
             cors.add(route)
@@ -905,37 +1469,57 @@ stream_clients_clean{{stream="{self.config.STREAM_NAME}"}} {len(self.clean_peer_
         self.logger.info(f"Server running at http://{self.config.WEB_SERVER_HOST}:{self.config.WEB_SERVER_PORT}")
         self.logger.info(f"  WebRTC (CLEAN): ws://{{host}}:{self.config.WEB_SERVER_PORT}/{serial}")
         self.logger.info(f"  WebRTC (AI):    ws://{{host}}:{self.config.WEB_SERVER_PORT}/{serial}/ai")
-        self.logger.info(f"  Health:         http://{{host}}:{self.config.WEB_SERVER_PORT}/health")
-        self.logger.info(f"  Metrics:        http://{{host}}:{self.config.WEB_SERVER_PORT}/metrics")
+        self.logger.info(f"  Health:         http://{{host}}:{self.config.HEALTH_PORT}/health")
+        self.logger.info(f"  Metrics:        http://{{host}}:{self.config.HEALTH_PORT}/metrics")
+
+    def health_server_thread_worker(self):
+        """Serve /health, /healthz and /metrics on HEALTH_PORT from a dedicated event loop"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.on_response_prepare.append(self.set_tcp_nodelay)
+        app.router.add_get("/health", self.health_check_handler)
+        app.router.add_get("/healthz", self.health_check_handler)  # K8s convention
+        app.router.add_get("/metrics", self.metrics_handler)
+        runner = web.AppRunner(app, handle_signals=False)
+        try:
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.TCPSite(runner, self.config.WEB_SERVER_HOST, self.config.HEALTH_PORT).start())
+        except Exception as e:
+            self.logger.error(f"Health server failed to start on port {self.config.HEALTH_PORT}: {e}")
+            loop.close()
+            return
+        self.health_loop = loop
+        loop.run_forever()
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
 
     def start_threads(self):
         Thread(target=self.capture_thread_worker, daemon=True).start()
         Thread(target=self.processing_thread_worker, daemon=True).start()
         Thread(target=self.watchdog_thread_worker, daemon=True).start()
+        Thread(target=self.health_server_thread_worker, daemon=True).start()
         self.logger.info("Threads started")
 
     async def cleanup(self):
         """Graceful shutdown"""
         self.logger.info("Cleaning up...")
         self.stop_event.set()
+        self.cancel_notification_wait()
+        self.wake_watchdog()
+        if self.health_loop:
+            self.health_loop.call_soon_threadsafe(self.health_loop.stop)
 
         # Cleanup notification manager
         await self.notification_manager.cleanup()
 
-        # Close WebRTC connections (AI detection)
-        for pc in self.peer_connections.copy():
-            try:
-                await pc.close()
-            except:
-                pass
+        # Close WebRTC connections (AI detection + clean stream) concurrently; errors are ignored
+        await asyncio.gather(
+            *(pc.close() for pc in self.peer_connections.copy()),
+            *(pc.close() for pc in self.clean_peer_connections.copy()),
+            return_exceptions=True
+        )
         self.peer_connections.clear()
-
-        # Close WebRTC connections (clean stream)
-        for pc in self.clean_peer_connections.copy():
-            try:
-                await pc.close()
-            except:
-                pass
         self.clean_peer_connections.clear()
 
         # Release camera
@@ -946,6 +1530,7 @@ stream_clients_clean{{stream="{self.config.STREAM_NAME}"}} {len(self.clean_peer_
                 except:
                     pass
                 self.cap = None
+                self._cap_open = False
 
         # Clear GPU memory
         if self.device == "cuda":
@@ -961,14 +1546,20 @@ stream_clients_clean{{stream="{self.config.STREAM_NAME}"}} {len(self.clean_peer_
         self.logger.info("="*60)
         self.logger.info(f"Starting YOLO WebRTC Detector: {self.config.STREAM_NAME}")
         self.logger.info("="*60)
+        self.loop = asyncio.get_running_loop()
+
+        # Setup signal handlers for graceful shutdown - delivered on the event loop, not by interrupting a thread
+        shutdown = asyncio.Event()
 
-        # Setup signal handlers for graceful shutdown
-        def signal_handler(sig, frame):
-            self.logger.info(f"Received signal {sig}, shutting down...")
+        def signal_handler(sig):
+            self.logger.info(f"Received signal {sig.name}, shutting down...")
             self.stop_event.set()
+            shutdown.set()  # Wake the main loop now rather than on its next 1s tick
+            self.cancel_notification_wait()
+            self.wake_watchdog()
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            self.loop.add_signal_handler(sig, signal_handler, sig)
 
         # Update webRTCUrl in database (if drone serial is available)
         if hasattr(self.config, 'DRONE_SERIAL') and self.config.DRONE_SERIAL != 'UNKNOWN':
@@ -988,11 +1579,17 @@ stream_clients_clean{{stream="{self.config.STREAM_NAME}"}} {len(self.clean_peer_
 
         try:
             # Main loop - just keep running
+            next_status = time.monotonic() + 30
             while not self.stop_event.is_set():
-                await asyncio.sleep(1)
+                try:
+                    await asyncio.wait_for(shutdown.wait(), timeout=1)
+                except asyncio.TimeoutError:
+                    pass
 
-                # Log status every 30 seconds
-                if int(time.time()) % 30 == 0:
+                # Log status every 30 seconds (explicit due time: exactly one log per window)
+                now = time.monotonic()
+                if now >= next_status:
+                    next_status = now + 30
                     self.logger.info(f"Status: FPS={self.fps:.1f}, Healthy={self.is_healthy}, "
                                    f"Clients(AI)={len(self.peer_connections)}, "
                                    f"Clients(Clean)={len(self.clean_peer_connections)}, "
@@ -1013,8 +1610,13 @@ stream_clients_clean{{stream="{self.config.STREAM_NAME}"}} {len(self.clean_peer_
 
 
 # ==================== MAIN ENTRY ====================
-async def main():
-    """Main entry point"""
+def setup():
+    """
+    Parse arguments and build the Config synchronously, before the event loop starts
+
+    Returns:
+        Config, or None if there is nothing to run (e.g. --export-engine)
+    """
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='RTSP Object Detection System with WebRTC')
     parser.add_argument('--drone-serial', '-s', type=str,
@@ -1023,9 +1625,17 @@ async def main():
                         help='Drone management API base URL')
     parser.add_argument('--skip-stream-check', action='store_true',
                         help='Skip checking if stream is active (start anyway)')
+    parser.add_argument('--export-engine', action='store_true',
+                        help='Export YOLO_MODEL to a TensorRT engine and exit')
 
     args = parser.parse_args()
 
+    if args.export_engine:
+        config = Config()
+        print(f"Exporting {config.YOLO_MODEL} to TensorRT engine...")
+        print(f"✓ Engine written: {export_tensorrt_engine(config)}")
+        return None
+
     print("="*60)
     print("RTSP Object Detection System")
     print("YOLOv8 + WebRTC Streaming")
@@ -1041,7 +1651,8 @@ async def main():
         print("-"*60)
 
         try:
-            drone_data, is_stream_active = await fetch_drone_config(args.drone_serial, args.api_url)
+            # The only async step of setup - a short-lived loop of its own
+            drone_data, is_stream_active = asyncio.run(fetch_drone_config(args.drone_serial, args.api_url))
 
             print(f"✓ Drone found: {drone_data.get('deviceName')}")
             print(f"  Alias: {drone_data.get('metadata', {}).get('alias', 'N/A')}")
@@ -1076,14 +1687,26 @@ async def main():
     print(f"Server Port: {config.WEB_SERVER_PORT}")
     print(f"YOLO Model: {config.YOLO_MODEL}")
     print("="*60)
+    return config
 
-    # Create and run detector
+
+async def run_detector(config):
+    """Create and run the detector on the main event loop"""
     detector = WebRTCDetector(config=config)
     await detector.run()
 
 if __name__ == "__main__":
+    # uvloop (libuv) speeds up the WS/WebRTC/notification socket I/O; fall back to the default loop if absent
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
-        asyncio.run(main())
+        config = setup()
+        if config is not None:
+            asyncio.run(run_detector(config))
     except KeyboardInterrupt:
         print("\nShutdown complete")
         sys.exit(0)
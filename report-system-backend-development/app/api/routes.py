@@ -2,23 +2,43 @@
 API Routes for report generation
 """
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, HTTPException, UploadFile, File, Response
+from fastapi.responses import FileResponse
 from app.models.project import GenerateReportRequest, GenerateReportResponse
-from app.utils.mongodb import get_project_by_id, get_incidents_by_project_id, get_database
+from app.utils.mongodb import get_project_with_incidents, get_database
 from app.services.pptx_generator import generate_pptx_report
-from app.services.map_generator import generate_overview_map, MapGenerator
+from app.services.map_generator import generate_overview_map, generate_satellite_overview_map, generate_incident_legend_map
 from app.services.photo_annotator import annotate_incident_photos
 from app.services.pdf_converter import convert_pptx_to_pdf_async
 from app.config import get_settings, get_upload_path, get_project_output_path, get_shapefile_path, get_asset_path, sanitize_filename
+import asyncio
+import logging
 import time
 import os
+import shutil
+import threading
 from datetime import datetime
 from typing import List, Dict
 from bson import ObjectId
 from pathlib import Path
+from collections import OrderedDict
 import aiofiles
+import orjson
 
 router = APIRouter()
+log = logging.getLogger("report")
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB read/write chunks when saving uploads
+
+# Fields list_assets returns (_id is always included)
+ASSET_LIST_PROJECTION = {
+    "name": 1,
+    "sanitizedFilename": 1,
+    "originalFilename": 1,
+    "path": 1,
+    "uploadedAt": 1,
+    "usedByProjects": 1
+}
 
 
 @router.post("/projects")
@@ -44,7 +64,7 @@ async def create_project(project_data: dict):
         created_project = await db.projects.find_one({"_id": result.inserted_id})
         created_project["_id"] = project_id  # Convert ObjectId to string
 
-        print(f"\n✅ Created project: {project_data.get('projectName')} (ID: {project_id})")
+        log.info("✅ Created project: %s (ID: %s)", project_data.get('projectName'), project_id)
 
         return {
             "success": True,
@@ -52,9 +72,7 @@ async def create_project(project_data: dict):
         }
 
     except Exception as e:
-        print(f"❌ Failed to create project: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Failed to create project: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
 
 
@@ -76,19 +94,17 @@ async def generate_report(request: GenerateReportRequest):
     try:
         # 1. Fetch data from MongoDB
         project_id = request.project_id
-        project = await get_project_by_id(project_id)
+        project, incidents = await get_project_with_incidents(project_id)
 
         if not project:
             raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
 
-        incidents = await get_incidents_by_project_id(project_id)
-
         if not incidents:
             raise HTTPException(status_code=400, detail="No incidents found for this project")
 
-        print(f"\n🚀 Starting report generation for project: {project_id}")
-        print(f"   Project: {project.get('projectName')}")
-        print(f"   Incidents: {len(incidents)}")
+        log.info("🚀 Starting report generation for project: %s", project_id)
+        log.info("   Project: %s", project.get('projectName'))
+        log.info("   Incidents: %s", len(incidents))
 
         # Prepare output paths - using new projects folder structure
         report_dir = get_project_output_path(project_id, "reports")
@@ -103,70 +119,61 @@ async def generate_report(request: GenerateReportRequest):
 
 
         # !!!!!!!!!! GENERATE MAPS !!!!!!!!!!
-        # 2. Generate overview map from shapefiles
-        print("\n📍 Step 1/4: Generating overview map...")
+        # 2. Generate overview map, satellite maps and legend concurrently - they don't depend
+        # on each other, and each renders in its own worker process (see map_generator)
+        log.info("📍 Step 1-2/4: Generating overview map, satellite imagery maps and legend...")
+        map_args = dict(
+            global_assets_dir=str(settings.global_assets_dir),
+            shapefile_dir=str(settings.shapefile_dir),
+            project_data=project,
+            incidents=incidents
+        )
+        legend_path = str(maps_dir / "incident_legend.png")
+        overview_result, satellite_result, legend_result = await asyncio.gather(
+            generate_overview_map(output_path=map_output_path, **map_args),
+            # Satellite overview at zoom level 12 - returns tuple (map_paths, incident_groups)
+            generate_satellite_overview_map(output_path=str(maps_dir), **map_args),
+            generate_incident_legend_map(output_path=legend_path, **map_args),
+            return_exceptions=True
+        )
 
         # RESUME THIS PART BELLOW !!!!!!!!
-        try:
-            map_path = await generate_overview_map(
-                shapefile_dir=str(settings.shapefile_dir),
-                global_assets_dir=str(settings.global_assets_dir),
-                project_data=project,
-                incidents=incidents,
-                output_path=map_output_path
-            )
-            print(f"   ✅ Map generated: {os.path.basename(map_path)}")
-        except Exception as e:
-            print(f"   ⚠️  Map generation failed: {e}")
+        if isinstance(overview_result, Exception):
+            log.warning("   ⚠️  Map generation failed: %s", overview_result)
             map_path = None
+        else:
+            map_path = overview_result
+            log.info("   ✅ Map generated: %s", os.path.basename(map_path))
 
-        # 2.5. Generate satellite imagery maps and legend
-        print("\n🛰️  Step 2/4: Generating satellite imagery maps and legend...")
+        # 2.5. Satellite imagery maps and legend
         satellite_overview_map = None
         satellite_incident_groups = []
         satellite_thumbnails = []
         incident_legend_map = None
-        try:
-            # Create MapGenerator instance
-            map_gen = MapGenerator(
-                global_assets_dir=str(settings.global_assets_dir),
-                shapefile_dir=str(settings.shapefile_dir),
-                project_data=project,
-                incidents=incidents
-            )
-
-            # Generate large satellite overview - now returns tuple (map_paths, incident_groups)
-            satellite_overview_path = str(maps_dir)
-            print(f"   Generating satellite overview map at zoom level 12...")
-            satellite_overview_map, satellite_incident_groups = map_gen.generate_satellite_overview_map(
-                output_path=satellite_overview_path
-            )
-            print("!!!!!!!!!!!!! yeah yeah yeah")
-            print(f"   ✅ Satellite overview generated: {len(satellite_overview_map)} maps with {len(satellite_incident_groups)} incident groups")
-
-            # Generate incident legend map
-            legend_path = str(maps_dir / "incident_legend.png")
-            incident_legend_map = map_gen.generate_incident_legend_map(
-                output_path=legend_path
-            )
-            if incident_legend_map:
-                print(f"   ✅ Incident legend generated: {os.path.basename(incident_legend_map)}")
-
-            # Generate thumbnails for each incident (reduced zoom for faster loading)
-            # thumbnails_dir = get_upload_path(project_id, "maps/thumbnails")
-            # for idx, incident in enumerate(incidents):
-            #     thumbnail_path = str(thumbnails_dir / f"incident_{idx+1}_thumbnail.png")
-            #     thumb = map_gen.generate_satellite_thumbnail(
-            #         incident=incident,
-            #         output_path=thumbnail_path,
-            #         zoom_level=14  # Reduced from 16 to 14 for faster tile fetching
-            #     )
-            #     satellite_thumbnails.append(thumb)
-            # print(f"   ✅ Generated {len(satellite_thumbnails)} incident thumbnails")
-
-        except Exception as e:
-            print(f"   ⚠️  Satellite map/legend generation failed: {e}")
-            print(f"       Continuing without satellite imagery...")
+        if isinstance(satellite_result, Exception):
+            log.warning("   ⚠️  Satellite map generation failed: %s", satellite_result)
+            log.warning("       Continuing without satellite imagery...")
+        else:
+            satellite_overview_map, satellite_incident_groups = satellite_result
+            log.info("   ✅ Satellite overview generated: %s maps with %s incident groups", len(satellite_overview_map), len(satellite_incident_groups))
+
+        if isinstance(legend_result, Exception):
+            log.warning("   ⚠️  Incident legend generation failed: %s", legend_result)
+        elif legend_result:
+            incident_legend_map = legend_result
+            log.info("   ✅ Incident legend generated: %s", os.path.basename(incident_legend_map))
+
+        # Generate thumbnails for each incident (reduced zoom for faster loading)
+        # thumbnails_dir = get_upload_path(project_id, "maps/thumbnails")
+        # for idx, incident in enumerate(incidents):
+        #     thumbnail_path = str(thumbnails_dir / f"incident_{idx+1}_thumbnail.png")
+        #     thumb = map_gen.generate_satellite_thumbnail(
+        #         incident=incident,
+        #         output_path=thumbnail_path,
+        #         zoom_level=14  # Reduced from 16 to 14 for faster tile fetching
+        #     )
+        #     satellite_thumbnails.append(thumb)
+        # print(f"   ✅ Generated {len(satellite_thumbnails)} incident thumbnails")
 
         # 3. Annotate photos
         # print("\n📸 Step 3/4: Annotating incident photos...")
@@ -187,7 +194,7 @@ async def generate_report(request: GenerateReportRequest):
 
         annotated_incidents = incidents  # Skipping annotation for now
         # 4. Generate PPTX with all content
-        print("\n📄 Step 4/4: Generating PPTX report...")
+        log.info("📄 Step 4/4: Generating PPTX report...")
         try:
             pptx_path = await generate_pptx_report(
                 project_data=project,
@@ -199,14 +206,13 @@ async def generate_report(request: GenerateReportRequest):
                 satellite_thumbnails=satellite_thumbnails,
                 incident_legend_map=incident_legend_map
             )
-            print("!!!!!!!!!!!!! yeah yeah yeah worked worked worked")
-            print(f"   ✅ PPTX generated: {os.path.basename(pptx_path)}")
+            log.info("   ✅ PPTX generated: %s", os.path.basename(pptx_path))
         except Exception as e:
-            print(f"   ❌ PPTX generation failed: {e}")
+            log.error("   ❌ PPTX generation failed: %s", e)
             raise
 
         # 5. Convert PPTX to PDF
-        print("\n📄 Step 5/5: Converting PPTX to PDF...")
+        log.info("📄 Step 5/5: Converting PPTX to PDF...")
         pdf_path = None
         pdf_url = None
         try:
@@ -217,9 +223,9 @@ async def generate_report(request: GenerateReportRequest):
             pdf_filename = os.path.basename(pdf_path)
             pdf_url = f"/uploads/{project_id}/reports/{pdf_filename}"
 
-            print(f"   ✅ PDF generated: {pdf_filename}")
+            log.info("   ✅ PDF generated: %s", pdf_filename)
         except Exception as e:
-            print(f"   ⚠️ PDF conversion failed (PPTX still available): {e}")
+            log.warning("   ⚠️ PDF conversion failed (PPTX still available): %s", e)
             # Don't fail the whole process if PDF conversion fails
             # User will still get the PPTX file
 
@@ -233,10 +239,10 @@ async def generate_report(request: GenerateReportRequest):
         report_url = f"/uploads/{project_id}/reports/{pptx_filename}"
         map_url = f"/uploads/{project_id}/maps/{map_filename}" if map_path else None
 
-        print(f"\n✅ Report generation complete! ({processing_time:.2f}s)")
-        print(f"   PPTX URL: {report_url}")
-        print(f"   PDF URL: {pdf_url if pdf_url else 'N/A'}")
-        print(f"   Map URL: {map_url}")
+        log.info("✅ Report generation complete! (%.2fs)", processing_time)
+        log.info("   PPTX URL: %s", report_url)
+        log.info("   PDF URL: %s", pdf_url if pdf_url else 'N/A')
+        log.info("   Map URL: %s", map_url)
 
         return GenerateReportResponse(
             success=True,
@@ -255,9 +261,7 @@ async def generate_report(request: GenerateReportRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"\n❌ Report generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Report generation failed: %s", e)
 
         return GenerateReportResponse(
             success=False,
@@ -308,21 +312,23 @@ async def upload_asset(
         result = await db.assets.insert_one(asset_doc)
         asset_id = str(result.inserted_id)
 
-        print(f"\n📁 Uploading asset: {asset_name}")
-        print(f"   Asset ID: {asset_id}")
-        print(f"   Original filename: {original_filename}")
-        print(f"   Sanitized filename: {sanitized_filename}")
+        log.info("📁 Uploading asset: %s", asset_name)
+        log.info("   Asset ID: %s", asset_id)
+        log.info("   Original filename: %s", original_filename)
+        log.info("   Sanitized filename: %s", sanitized_filename)
 
         # 2. Create folder structure
         asset_path = get_asset_path(asset_id, "original")
         file_path = asset_path / sanitized_filename
 
-        # 3. Save uploaded file
+        # 3. Save uploaded file - copied in 1 MB chunks so memory stays flat regardless of file size
+        file_size = 0
         async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
+                file_size += len(chunk)
 
-        print(f"   ✅ File saved to: {file_path}")
+        log.info("   ✅ File saved to: %s", file_path)
 
         # 4. Update asset record with path info
         relative_path = f"global_assets/{asset_id}/original/"
@@ -331,7 +337,7 @@ async def upload_asset(
             {"$set": {
                 "path": relative_path,
                 "fullPath": str(file_path),
-                "fileSize": len(content)
+                "fileSize": file_size
             }}
         )
 
@@ -349,9 +355,7 @@ async def upload_asset(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Asset upload failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Asset upload failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Asset upload failed: {str(e)}")
 
 
@@ -362,11 +366,12 @@ async def list_assets():
     Returns list of assets with metadata
     """
     try:
-        print("\n🔍 GET /api/assets - Fetching assets from MongoDB...")
+        log.info("🔍 GET /api/assets - Fetching assets from MongoDB...")
         db = get_database()
 
         # Fetch all assets, sorted by upload date (newest first)
-        assets_cursor = db.assets.find({"type": "pipeline"}).sort("uploadedAt", -1)
+        # Only the fields returned below (uses the type+uploadedAt index)
+        assets_cursor = db.assets.find({"type": "pipeline"}, projection=ASSET_LIST_PROJECTION).sort("uploadedAt", -1)
         assets = await assets_cursor.to_list(length=None)
 
         # Convert ObjectId to string for JSON serialization
@@ -382,9 +387,9 @@ async def list_assets():
                 "usedByProjects": asset.get("usedByProjects", [])
             }
             asset_list.append(asset_data)
-            print(f"   - {asset_data['name']} (ID: {asset_data['id']})")
+            log.debug("   - %s (ID: %s)", asset_data['name'], asset_data['id'])
 
-        print(f"\n✅ Returning {len(asset_list)} assets to client")
+        log.info("✅ Returning %s assets to client", len(asset_list))
 
         return {
             "success": True,
@@ -393,23 +398,34 @@ async def list_assets():
         }
 
     except Exception as e:
-        print(f"❌ Failed to fetch assets: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Failed to fetch assets: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch assets: {str(e)}")
 
 
+def _remove_asset_folder(asset_folder: Path, file_path: Path):
+    """Delete an asset folder and all its contents (background task - runs in the threadpool)"""
+    try:
+        shutil.rmtree(asset_folder)
+        log.info("   ✅ Deleted asset folder and all contents: %s", asset_folder)
+    except Exception as e:
+        log.warning("   ⚠️  Warning: Could not delete asset folder: %s", e)
+        # Try to at least delete the file
+        try:
+            if file_path.exists():
+                file_path.unlink()
+                log.info("   ✅ Deleted file: %s", file_path)
+        except Exception as e2:
+            log.warning("   ⚠️  Warning: Could not delete file: %s", e2)
+
+
 @router.delete("/assets/{asset_id}")
-async def delete_asset(asset_id: str):
+async def delete_asset(asset_id: str, background_tasks: BackgroundTasks):
     """
     Delete a specific asset by ID
     Removes both the database record and the file from disk
+    (the folder removal runs as a background task after the response is sent)
     """
     try:
-        from bson import ObjectId
-        from pathlib import Path
-        import shutil
-
         db = get_database()
 
         # 1. Fetch asset from database
@@ -421,28 +437,16 @@ async def delete_asset(asset_id: str):
         if not asset:
             raise HTTPException(status_code=404, detail="Asset not found")
 
-        print(f"\n🗑️  Deleting asset: {asset.get('name')}")
+        log.info("🗑️  Deleting asset: %s", asset.get('name'))
 
-        # 2. Delete entire asset folder from disk
+        # 2. Schedule deletion of the entire asset folder: global_assets/<asset_id>
+        # (rmtree can take seconds on large folders - keep it off the event loop)
         full_path = asset.get("fullPath")
         if full_path:
             file_path = Path(full_path)
-            # Delete the entire asset folder: global_assets/<asset_id>
             asset_folder = file_path.parent.parent  # global_assets/<asset_id>
-
-            if asset_folder.exists() and asset_folder.is_dir():
-                try:
-                    shutil.rmtree(asset_folder)
-                    print(f"   ✅ Deleted asset folder and all contents: {asset_folder}")
-                except Exception as e:
-                    print(f"   ⚠️  Warning: Could not delete asset folder: {e}")
-                    # Try to at least delete the file
-                    try:
-                        if file_path.exists():
-                            file_path.unlink()
-                            print(f"   ✅ Deleted file: {file_path}")
-                    except Exception as e2:
-                        print(f"   ⚠️  Warning: Could not delete file: {e2}")
+            if asset_folder.is_dir():
+                background_tasks.add_task(_remove_asset_folder, asset_folder, file_path)
 
         # 3. Delete from database
         delete_result = await db.assets.delete_one({"_id": ObjectId(asset_id)})
@@ -450,7 +454,7 @@ async def delete_asset(asset_id: str):
         if delete_result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Asset not found in database")
 
-        print(f"   ✅ Asset deleted from database")
+        log.info("   ✅ Asset deleted from database")
 
         return {
             "success": True,
@@ -460,9 +464,7 @@ async def delete_asset(asset_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to delete asset: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Failed to delete asset: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete asset: {str(e)}")
 
 
@@ -498,10 +500,82 @@ async def get_asset(asset_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to fetch asset: {e}")
+        log.error("❌ Failed to fetch asset: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch asset: {str(e)}")
 
 
+# Serialized /geojson response bodies, one entry per file path: path -> (mtime_ns, body).
+# Bounded by total body size (LRU eviction); a file too large for the budget isn't cached.
+GEOJSON_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_geojson_cache: OrderedDict = OrderedDict()
+_geojson_cache_bytes = 0
+_geojson_cache_lock = threading.Lock()
+
+
+def _load_geojson_response(path: str) -> bytes:
+    """
+    Parse a GeoJSON file with orjson and return the serialized API response body
+
+    Cached per path and keyed on the file's mtime_ns: repeat requests skip the disk read,
+    parse and re-encode, and a re-uploaded/replaced file replaces its stale entry.
+    Blocking (file I/O + parsing) - call it via asyncio.to_thread.
+    """
+    global _geojson_cache_bytes
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    with _geojson_cache_lock:
+        cached = _geojson_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            _geojson_cache.move_to_end(path)
+            return cached[1]
+
+    with open(path, 'rb') as f:
+        geojson_data = orjson.loads(f.read())
+    body = orjson.dumps({"success": True, "data": geojson_data})
+
+    with _geojson_cache_lock:
+        # Drop the superseded version of this file (if any) before adding the new one
+        old = _geojson_cache.pop(path, None)
+        if old is not None:
+            _geojson_cache_bytes -= len(old[1])
+        if len(body) <= GEOJSON_CACHE_MAX_BYTES:
+            _geojson_cache[path] = (mtime_ns, body)
+            _geojson_cache_bytes += len(body)
+            while _geojson_cache_bytes > GEOJSON_CACHE_MAX_BYTES:
+                _, (_, evicted) = _geojson_cache.popitem(last=False)
+                _geojson_cache_bytes -= len(evicted)
+    return body
+
+
+async def _get_asset_file(asset_id: str):
+    """
+    Look up an asset and resolve its GeoJSON file on disk
+
+    Returns:
+        Tuple of (asset document, Path to the file)
+
+    Raises:
+        HTTPException: 404 if the asset or its file is missing, 500 if it has no path
+    """
+    db = get_database()
+
+    # Fetch asset from database (only the fields needed to locate the file)
+    asset = await db.assets.find_one({"_id": ObjectId(asset_id)}, projection={"name": 1, "fullPath": 1})
+
+    if not asset:
+        raise HTTPException(status_code=404, detail=f"Asset not found: {asset_id}")
+
+    full_path = asset.get("fullPath")
+    if not full_path:
+        raise HTTPException(status_code=500, detail="Asset file path not found")
+
+    file_path = Path(full_path)
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail=f"Asset file not found on disk: {full_path}")
+
+    return asset, file_path
+
+
 @router.get("/assets/{asset_id}/geojson")
 async def get_asset_geojson(asset_id: str):
     """
@@ -509,40 +583,36 @@ async def get_asset_geojson(asset_id: str):
     Returns the actual GeoJSON data for map display
     """
     try:
-        import json
-
-        db = get_database()
-
-        # Fetch asset from database
-        asset = await db.assets.find_one({"_id": ObjectId(asset_id)})
+        # Read GeoJSON file from disk
+        asset, file_path = await _get_asset_file(asset_id)
 
-        if not asset:
-            raise HTTPException(status_code=404, detail=f"Asset not found: {asset_id}")
+        # Read and parse GeoJSON off the event loop (cached per file version - see _load_geojson_response)
+        body = await asyncio.to_thread(_load_geojson_response, str(file_path))
 
-        # Read GeoJSON file from disk
-        full_path = asset.get("fullPath")
-        if not full_path:
-            raise HTTPException(status_code=500, detail="Asset file path not found")
+        log.info("📍 Loaded GeoJSON for asset: %s", asset.get('name'))
 
-        file_path = Path(full_path)
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail=f"Asset file not found on disk: {full_path}")
+        return Response(content=body, media_type="application/json")
 
-        # Read and parse GeoJSON
-        with open(file_path, 'r', encoding='utf-8') as f:
-            geojson_data = json.load(f)
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("❌ Failed to fetch asset GeoJSON: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to fetch asset GeoJSON: {str(e)}")
 
-        print(f"📍 Loaded GeoJSON for asset: {asset.get('name')}")
 
-        return {
-            "success": True,
-            "data": geojson_data
-        }
+@router.get("/assets/{asset_id}/geojson-raw")
+async def get_asset_geojson_raw(asset_id: str):
+    """
+    Get the GeoJSON file of a specific asset as-is (no {success, data} envelope)
+    The file is streamed straight from disk - never parsed or re-encoded - so prefer
+    this over /geojson for large pipelines
+    """
+    try:
+        _, file_path = await _get_asset_file(asset_id)
+        return FileResponse(file_path, media_type="application/geo+json")
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to fetch asset GeoJSON: {e}")
-        import traceback
-        traceback.print_exc()
+        log.error("❌ Failed to fetch asset GeoJSON: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch asset GeoJSON: {str(e)}")
@@ -3,6 +3,7 @@ Configuration management for Python backend
 """
 import os
 from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -23,9 +24,21 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = True
 
+    # Report generation
+    map_workers: int = 3  # Processes rendering the overview/satellite/legend maps in parallel
+    report_workers: Optional[int] = None  # Processes building PPTX reports (None = os.cpu_count())
+    # PPTX -> PDF via long-running unoserver daemons (e.g. "2002,2003" - one port per daemon,
+    # started with `unoserver --port <port>`). Empty = PowerPoint COM automation (Windows)
+    unoserver_host: str = "127.0.0.1"
+    unoserver_ports: str = ""
+
     # CORS
     nextjs_url: str = "http://localhost:3000"
 
+    # Static file offload: when set (e.g. "/_protected_uploads"), /uploads/* responses hand the
+    # file to nginx via X-Accel-Redirect instead of streaming it through Python. Empty = StaticFiles (dev)
+    x_accel_redirect_prefix: str = ""
+
     class Config:
         env_file = ".env"
         case_sensitive = False
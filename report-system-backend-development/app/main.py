@@ -5,23 +5,58 @@ Main entry point for the Python backend service.
 Handles report generation (PPTX, maps, photo annotation).
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from app.config import get_settings
 from app.api import routes
 from app.utils.mongodb import connect_to_mongodb, close_mongodb_connection
+from app.utils.worker_logging import LOG_FORMAT
+from app.services.map_generator import shutdown_map_executor
+from app.services.pptx_generator import shutdown_report_executor
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from urllib.parse import quote
+import logging
+import logging.config
+import queue
 import os
 
 # Initialize settings
 settings = get_settings()
 
+# Logging: request handlers only enqueue records (no stdout lock, no I/O on the event loop);
+# a QueueListener thread formats and writes them to stderr. Worker processes can't reach
+# this in-process queue - their pools install init_worker_logging instead
+log_queue = queue.SimpleQueue()
+log_stream = logging.StreamHandler()  # stderr
+log_stream.setFormatter(logging.Formatter(LOG_FORMAT))
+log_listener = QueueListener(log_queue, log_stream)
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "queue": {"()": QueueHandler, "queue": log_queue},
+    },
+    "loggers": {
+        "report": {
+            "handlers": ["queue"],
+            "level": "DEBUG" if settings.debug else "INFO",
+            "propagate": False,
+        },
+    },
+})
+log_listener.start()
+log = logging.getLogger("report")
+
 # Create FastAPI app
 app = FastAPI(
     title="Pipeline Report Generator API",
     description="Python backend for generating pipeline surveillance reports",
     version="1.0.0",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,  # orjson for every JSON route (requires orjson)
 )
 
 # CORS middleware (allow Next.js and external IPs to call this API)
@@ -41,14 +76,17 @@ async def startup():
     try:
         await connect_to_mongodb()
     except Exception as e:
-        print(f"⚠️  Warning: Could not connect to MongoDB: {e}")
-        print("   API will work but database features will be disabled")
+        log.warning("⚠️  Warning: Could not connect to MongoDB: %s", e)
+        log.warning("   API will work but database features will be disabled")
 
 
 @app.on_event("shutdown")
 async def shutdown():
-    """Close MongoDB connection on shutdown"""
+    """Close MongoDB connection and map/report worker processes on shutdown, then flush the log queue"""
     await close_mongodb_connection()
+    shutdown_map_executor()
+    shutdown_report_executor()
+    log_listener.stop()
 
 
 # Include API routes
@@ -64,19 +102,35 @@ global_assets_path = os.path.join(root_dir, "global_assets")
 
 if not os.path.exists(projects_path):
     os.makedirs(projects_path, exist_ok=True)
-    print(f"📁 Created projects directory: {projects_path}")
+    log.info("📁 Created projects directory: %s", projects_path)
 
 if not os.path.exists(global_assets_path):
     os.makedirs(global_assets_path, exist_ok=True)
-    print(f"📁 Created global_assets directory: {global_assets_path}")
+    log.info("📁 Created global_assets directory: %s", global_assets_path)
 
 # Mount projects folder for reports/maps
-app.mount("/uploads", StaticFiles(directory=projects_path), name="uploads")
-print(f"✅ Serving project files from: {projects_path}")
+if settings.x_accel_redirect_prefix:
+    # Production: nginx serves the bytes with sendfile(); Python only resolves the path. Needs e.g.
+    #   location /_protected_uploads/ { internal; alias /path/to/projects/; sendfile on; tcp_nopush on; }
+    projects_root = Path(projects_path).resolve()
+
+    @app.get("/uploads/{file_path:path}")
+    async def serve_upload(file_path: str):
+        """Hand a project file (report/map/photo) off to nginx via X-Accel-Redirect"""
+        target = (projects_root / file_path).resolve()
+        if not target.is_relative_to(projects_root) or not target.is_file():
+            raise HTTPException(status_code=404, detail="File not found")
+        redirect = f"{settings.x_accel_redirect_prefix.rstrip('/')}/{target.relative_to(projects_root).as_posix()}"
+        return Response(headers={"X-Accel-Redirect": quote(redirect)})
+
+    log.info("✅ Serving project files from: %s (via X-Accel-Redirect %s)", projects_path, settings.x_accel_redirect_prefix)
+else:
+    app.mount("/uploads", StaticFiles(directory=projects_path), name="uploads")
+    log.info("✅ Serving project files from: %s", projects_path)
 
 # Mount global_assets folder for pipeline GeoJSON files
 app.mount("/assets", StaticFiles(directory=global_assets_path), name="assets")
-print(f"✅ Serving global assets from: {global_assets_path}")
+log.info("✅ Serving global assets from: %s", global_assets_path)
 
 
 @app.get("/")
@@ -1,15 +1,29 @@
 import geopandas as gpd
+import matplotlib
+matplotlib.use("Agg")  # Headless raster backend - maps are only ever saved to PNG (also in worker processes)
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.patches import Circle, Rectangle, RegularPolygon
 from matplotlib import patheffects
 from shapely.geometry import Point, box
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import asyncio
+import logging
 import os
 import numpy as np
 import math
 import contextily as ctx
 from adjustText import adjust_text
+from app.config import get_settings
+from app.utils.worker_logging import init_worker_logging
+
+# Child of the "report" logger configured in app/main.py
+log = logging.getLogger("report.maps")
 
 # Configure contextily timeout
 os.environ['CONTEXTILY_TIMEOUT'] = '30'
@@ -45,6 +59,7 @@ TARGET_ASPECT_RATIO = 0.7  # FIXED aspect ratio (height/width) - zoom adjusts to
 EXTRA_BUFFER_PCT = 0.05  # Reduced from 0.50 to minimize padding
 VERTICAL_BUFFER_PCT = 0.03  # Reduced from 0.12
 HORIZONTAL_BUFFER_PCT = 0.03  # Reduced from 0.12
+EXTENT_FILTER_BUFFER_PCT = 0.05  # Margin kept around the map extent when dropping off-map base layer features
 
 # Marker and symbol sizes (as percentage of map width)
 PIPELINE_MARKER_RADIUS_PCT = 0.002
@@ -177,8 +192,9 @@ ESRI_SATELLITE_URL = 'https://server.arcgisonline.com/ArcGIS/rest/services/World
 # UTILITY FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=256)
 def categorize_incident(description: str) -> dict:
-    """Categorize an incident based on keywords in its description"""
+    """Categorize an incident based on keywords in its description (memoized; descriptions repeat heavily)"""
     if not description:
         return INCIDENT_CATEGORIES['other']
 
@@ -217,7 +233,7 @@ def generate_incident_legend(incidents: List[Dict[str, Any]], output_path: str)
     - Wrapped description text
     - Tilted-square (diamond) symbols
     """
-    print("🎨 Generating compact incident legend (4-inch width)...")
+    log.info("🎨 Generating compact incident legend (4-inch width)...")
 
     # Categorize and count
     categorized_incidents = []
@@ -412,12 +428,12 @@ def generate_incident_legend(incidents: List[Dict[str, Any]], output_path: str)
 
     # Save
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
 
-    print(f"   ✅ Legend saved: {output_path}")
-    print(f"   📊 {num_incidents} incidents across {len(category_counts)} categories")
+    log.info("   ✅ Legend saved: %s", output_path)
+    log.info("   📊 %s incidents across %s categories", num_incidents, len(category_counts))
     return output_path
 
 
@@ -425,6 +441,59 @@ def generate_incident_legend(incidents: List[Dict[str, Any]], output_path: str)
 # MAP GENERATOR CLASS
 # ============================================================================
 
+# ============================================================================
+# FIGURE POOL
+# ============================================================================
+
+# One pooled Figure per (figsize, dpi) per process - map jobs in a worker run one at a time,
+# so reusing the figure (and its Agg canvas buffers) across renders needs no locking.
+# The figures live outside pyplot's registry (object API + Agg canvas), so other code creating
+# or closing pyplot figures can't swap or destroy them mid-render.
+_figure_pool: Dict[tuple, Any] = {}
+
+
+def acquire_figure(figsize: tuple, dpi: int):
+    """
+    Get a cleared (fig, ax) of the given size, reusing this process's pooled figure
+
+    Callers lay out and save through the returned fig (fig.tight_layout/fig.savefig),
+    never through pyplot's current-figure functions.
+    """
+    key = (tuple(figsize), dpi)
+    fig = _figure_pool.get(key)
+    if fig is None:
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        _figure_pool[key] = fig
+    else:
+        # clf() rather than ax.clear(): also drops figure-level artists, keeps the canvas
+        fig.clf()
+    return fig, fig.add_subplot()
+
+
+# ============================================================================
+# LAYER CACHE
+# ============================================================================
+
+@lru_cache(maxsize=32)
+def _read_layer_cached(path: str, mtime_ns: int, crs: Optional[str]) -> gpd.GeoDataFrame:
+    kwargs = {"crs": crs} if crs else {}
+    gdf = gpd.read_file(path, engine="pyogrio", **kwargs)
+    gdf.sindex  # Build the spatial index now so it is cached along with the frame
+    return gdf
+
+
+def read_layer(path, crs: Optional[str] = None) -> gpd.GeoDataFrame:
+    """
+    Read a GeoJSON/shapefile layer, cached per (path, mtime) for the life of the process
+
+    The returned GeoDataFrame already has its spatial index built and is shared between
+    callers - treat it as read-only (to_crs/filtering return new frames, which is fine).
+    """
+    path = str(path)
+    return _read_layer_cached(path, os.stat(path).st_mtime_ns, crs)
+
+
 class MapGenerator:
     """Vector map generator using shapefiles"""
 
@@ -463,10 +532,10 @@ class MapGenerator:
             'operation_base': base / 'OPERATION_BASE84.geojson',
         }
 
-        print(f"📁 GeoJSON/Shapefile files configured from: {base}")
-        print(f"🛢️  Pipeline asset: {pipeline_path}")
-        print(f"💾 Basemap cache directory: {self.cache_dir}")
-        print(f"🔑 Pipeline ID: {self.pipeline_id}")
+        log.debug("📁 GeoJSON/Shapefile files configured from: %s", base)
+        log.debug("🛢️  Pipeline asset: %s", pipeline_path)
+        log.debug("💾 Basemap cache directory: %s", self.cache_dir)
+        log.debug("🔑 Pipeline ID: %s", self.pipeline_id)
 
     def _resolve_pipeline_asset_path(self, project_data: Dict[str, Any]) -> Path:
         """Resolve pipeline asset path from selected asset ID"""
@@ -478,14 +547,14 @@ class MapGenerator:
             # Fallback to legacy filename-based lookup
             legacy_filename = project_data.get('pipelineRowShapefile', '')
             if legacy_filename:
-                print(f"⚠️  Using legacy filename lookup: {legacy_filename}")
+                log.warning("⚠️  Using legacy filename lookup: %s", legacy_filename)
                 # Try to find in assets folder
                 legacy_path = self.shapefile_dir / legacy_filename
                 if legacy_path.exists():
                     return legacy_path
 
             # Ultimate fallback to hardcoded default
-            print(f"⚠️  No pipeline selected, using default: Santababra-FLB_AITEO_Trunk_Line.geojson")
+            log.warning("⚠️  No pipeline selected, using default: Santababra-FLB_AITEO_Trunk_Line.geojson")
             return self.shapefile_dir / 'Santababra-FLB_AITEO_Trunk_Line.geojson'
 
         # For now, use the default pipeline
@@ -493,7 +562,7 @@ class MapGenerator:
 
         asset_path = self.global_assets_dir / asset_id / 'original' / asset_name
 
-        print(f"   🔑 Resolved pipeline asset path: {asset_path}")
+        log.debug("   🔑 Resolved pipeline asset path: %s", asset_path)
         return asset_path
 
     def _setup_basemap_cache(self, map_type='overview'):
@@ -518,14 +587,14 @@ class MapGenerator:
         # Set contextily cache directory using absolute path
         ctx.set_cache_dir(str(pipeline_cache_abs))
 
-        print(f"   💾 Using basemap cache: {pipeline_cache_abs}")
+        log.debug("   💾 Using basemap cache: %s", pipeline_cache_abs)
         return pipeline_cache_abs
 
     def _load_shapefiles(self):
         """Load all required shapefiles"""
         try:
-            pipeline_gdf = gpd.read_file(self.shapefiles['pipeline_obama_brass'], crs="EPSG:4326")
-            print(pipeline_gdf.crs)
+            pipeline_gdf = read_layer(self.shapefiles['pipeline_obama_brass'], crs="EPSG:4326")
+            log.debug("%s", pipeline_gdf.crs)
             # settlements_gdf = gpd.read_file(self.shapefiles['settlements'])
             # rivers_gdf = gpd.read_file(self.shapefiles['rivers'])
             # minor_rivers_gdf = gpd.read_file(self.shapefiles['minor_rivers'])
@@ -533,7 +602,7 @@ class MapGenerator:
             # boundaries_gdf = gpd.read_file(self.shapefiles['boundaries'])
             # operation_base_gdf = gpd.read_file(self.shapefiles['operation_base'])
 
-            print(f"   ✅ Loaded {len(pipeline_gdf)} pipeline features")
+            log.info("   ✅ Loaded %s pipeline features", len(pipeline_gdf))
             # print(f"   ✅ Loaded {len(settlements_gdf)} settlements")
             # print(f"   ✅ Loaded {len(rivers_gdf)} rivers")
             # print(f"   ✅ Loaded {len(boundaries_gdf)} boundaries")
@@ -549,7 +618,7 @@ class MapGenerator:
                 # 'operation_base': operation_base_gdf
             }
         except Exception as e:
-            print(f"   ❌ Error loading shapefiles: {e}")
+            log.error("   ❌ Error loading shapefiles: %s", e)
             raise
 
     def _create_incidents_gdf(self):
@@ -561,21 +630,21 @@ class MapGenerator:
         for inc in self.incidents:
             lat = inc['latitude']
             lon = inc['longitude']
-            print(f"   📍 Incident {inc.get('incidentId', 'INC')}: lat={lat}, lon={lon}")
+            log.debug("   📍 Incident %s: lat=%s, lon=%s", inc.get('incidentId', 'INC'), lat, lon)
             incidents_data.append({
                 'geometry': Point(lon, lat),  # Point takes (x, y) = (longitude, latitude)
                 'id': inc.get('incidentId', 'INC'),
                 'description': inc['description']
             })
         incidents_gdf = gpd.GeoDataFrame(incidents_data, crs="EPSG:4326")
-        print(f"   ✅ Created {len(incidents_gdf)} incident points in EPSG:4326")
+        log.info("   ✅ Created %s incident points in EPSG:4326", len(incidents_gdf))
         return incidents_gdf
 
     def _ensure_crs(self, gdfs: dict, target_crs: str):
         """Ensure all GeoDataFrames are in target CRS"""
         for name, gdf in gdfs.items():
             if gdf is not None and gdf.crs.to_string() != target_crs:
-                print(f"   🔄 Converting {name} to {target_crs}")
+                log.debug("   🔄 Converting %s to %s", name, target_crs)
                 gdfs[name] = gdf.to_crs(target_crs)
         return gdfs
 
@@ -593,7 +662,7 @@ class MapGenerator:
                 max(overall_bounds[2], incident_bounds[2]),  # xmax
                 max(overall_bounds[3], incident_bounds[3])   # ymax
             ]
-            print(f"   📍 Expanded map extent to include {len(incidents_gdf)} incidents")
+            log.debug("   📍 Expanded map extent to include %s incidents", len(incidents_gdf))
 
         # Get combined bounds
         data_width = overall_bounds[2] - overall_bounds[0]
@@ -628,8 +697,8 @@ class MapGenerator:
         }
 
         unit = "m" if is_web_mercator else "°"
-        print(f"   📏 Fixed Map Extent: {map_width:.4f}{unit} × {map_height:.4f}{unit} (aspect: {map_height/map_width:.3f})")
-        print(f"   📏 Pipeline Size: {data_width:.4f}{unit} × {data_height:.4f}{unit}")
+        log.debug("   📏 Fixed Map Extent: %.4f%s × %.4f%s (aspect: %.3f)", map_width, unit, map_height, unit, map_height/map_width)
+        log.debug("   📏 Pipeline Size: %.4f%s × %.4f%s", data_width, unit, data_height, unit)
 
         return map_extent, map_width, map_height
 
@@ -654,21 +723,36 @@ class MapGenerator:
             'meters_per_unit': meters_per_unit,
         }
 
+    def _filter_to_extent(self, gdf, map_extent, buffer_pct=EXTENT_FILTER_BUFFER_PCT):
+        """
+        Keep only features whose bounding box touches the (buffered) map extent
+
+        Uses the GeoDataFrame's spatial index, so it is a cheap read-only filter - features are
+        kept whole (not cut like gpd.clip), so what is visible inside the extent is unchanged.
+        """
+        if gdf is None or len(gdf) == 0:
+            return gdf
+        dx = (map_extent['xmax'] - map_extent['xmin']) * buffer_pct
+        dy = (map_extent['ymax'] - map_extent['ymin']) * buffer_pct
+        bbox = box(map_extent['xmin'] - dx, map_extent['ymin'] - dy,
+                   map_extent['xmax'] + dx, map_extent['ymax'] + dy)
+        return gdf.iloc[np.sort(gdf.sindex.query(bbox))]
+
     def _render_base_layers(self, ax, gdfs, map_extent):
-        """Render base map layers (boundaries, water, rivers)"""
-        gdfs['boundaries'].plot(ax=ax, facecolor=COLORS['boundaries_fill'],
-                                linewidth=BOUNDARY_LINEWIDTH, zorder=1)
-        print("   ✅ LGA boundaries rendered")
+        """Render base map layers (boundaries, water, rivers) - only features near the map extent"""
+        self._filter_to_extent(gdfs['boundaries'], map_extent).plot(
+            ax=ax, facecolor=COLORS['boundaries_fill'], linewidth=BOUNDARY_LINEWIDTH, zorder=1)
+        log.info("   ✅ LGA boundaries rendered")
 
-        gdfs['rivers_poly'].plot(ax=ax, color=COLORS['water_polygon'], 
-                                linewidth=RIVER_POLY_LINEWIDTH, zorder=2)
-        print("   ✅ River polygons rendered")
+        self._filter_to_extent(gdfs['rivers_poly'], map_extent).plot(
+            ax=ax, color=COLORS['water_polygon'], linewidth=RIVER_POLY_LINEWIDTH, zorder=2)
+        log.info("   ✅ River polygons rendered")
 
-        gdfs['rivers'].plot(ax=ax, color=COLORS['river_lines'], 
-                           linewidth=RIVER_LINE_LINEWIDTH, zorder=2)
-        gdfs['minor_rivers'].plot(ax=ax, color=COLORS['river_lines'], 
-                                 linewidth=MINOR_RIVER_LINEWIDTH, zorder=2)
-        print("   ✅ River lines rendered")
+        self._filter_to_extent(gdfs['rivers'], map_extent).plot(
+            ax=ax, color=COLORS['river_lines'], linewidth=RIVER_LINE_LINEWIDTH, zorder=2)
+        self._filter_to_extent(gdfs['minor_rivers'], map_extent).plot(
+            ax=ax, color=COLORS['river_lines'], linewidth=MINOR_RIVER_LINEWIDTH, zorder=2)
+        log.info("   ✅ River lines rendered")
 
     def _render_settlements(self, ax, settlements_gdf, map_extent, map_width, sizes):
         """Render settlement points and labels"""
@@ -693,28 +777,28 @@ class MapGenerator:
 
         if name_field:
             potential_labels = []
-            for _, row in settlements_gdf.iterrows():
-                name = row.get(name_field, '')
+            # Iterate plain column arrays rather than iterrows() (no per-row Series construction)
+            centroids = settlements_gdf.geometry.centroid
+            boundary_margin = map_width * BOUNDARY_MARGIN_PCT
+            for name, x, y in zip(settlements_gdf[name_field].to_numpy(),
+                                  centroids.x.to_numpy(), centroids.y.to_numpy()):
                 if not name or not isinstance(name, str) or len(name) == 0:
                     continue
 
-                point = row.geometry.centroid if hasattr(row.geometry, 'centroid') else row.geometry
-
-                if not (map_extent['xmin'] <= point.x <= map_extent['xmax'] and
-                        map_extent['ymin'] <= point.y <= map_extent['ymax']):
+                if not (map_extent['xmin'] <= x <= map_extent['xmax'] and
+                        map_extent['ymin'] <= y <= map_extent['ymax']):
                     continue
 
-                boundary_margin = map_width * BOUNDARY_MARGIN_PCT
-                if (point.x < map_extent['xmin'] + boundary_margin or
-                    point.x > map_extent['xmax'] - boundary_margin or
-                    point.y < map_extent['ymin'] + boundary_margin or
-                    point.y > map_extent['ymax'] - boundary_margin):
+                if (x < map_extent['xmin'] + boundary_margin or
+                    x > map_extent['xmax'] - boundary_margin or
+                    y < map_extent['ymin'] + boundary_margin or
+                    y > map_extent['ymax'] - boundary_margin):
                     continue
 
                 potential_labels.append({
                     'name': name.title(),
-                    'x': point.x,
-                    'y': point.y,
+                    'x': float(x),
+                    'y': float(y),
                     'priority': len(name)
                 })
 
@@ -748,7 +832,7 @@ class MapGenerator:
                     )
                     placed_labels.append(label)
 
-            print(f"   ✅ {len(placed_labels)} settlements labeled")
+            log.info("   ✅ %s settlements labeled", len(placed_labels))
 
     def _render_operation_bases(self, ax, operation_base_gdf, map_extent, map_width, label_color="#1A1A1A"):
         """Render operation base hexagons with labels"""
@@ -810,7 +894,7 @@ class MapGenerator:
                         zorder=7
                     )
 
-        print(f"   ✅ {len(operation_base_clipped)} operation bases rendered")
+        log.info("   ✅ %s operation bases rendered", len(operation_base_clipped))
 
     def _render_pipeline(self, ax, pipeline_gdf, map_width):
         """Render pipeline with markers"""
@@ -854,7 +938,7 @@ class MapGenerator:
             )
             ax.add_patch(square)
 
-        print(f"   ✅ Pipeline rendered with {len(marker_coords)} markers")
+        log.info("   ✅ Pipeline rendered with %s markers", len(marker_coords))
         return marker_coords
 
     def _render_pipeline_label(self, ax, pipeline_gdf, map_width):
@@ -921,7 +1005,7 @@ class MapGenerator:
                 zorder=7
             )
 
-        print(f"   ✅ Pipeline label added: {pipeline_name}")
+        log.info("   ✅ Pipeline label added: %s", pipeline_name)
 
     def _render_incidents(self, ax, incidents_gdf, sizes, map_width=None, pipeline_gdf=None, show_callouts=True):
         """Render color-coded incident markers with optional count callout labels"""
@@ -1088,9 +1172,9 @@ class MapGenerator:
                 incident_index += 1
 
         if show_callouts:
-            print(f"   ✅ {len(incidents_gdf)} incident markers rendered with callouts ({len(incident_categories)} categories)")
+            log.info("   ✅ %s incident markers rendered with callouts (%s categories)", len(incidents_gdf), len(incident_categories))
         else:
-            print(f"   ✅ {len(incidents_gdf)} incident markers rendered without callouts ({len(incident_categories)} categories)")
+            log.info("   ✅ %s incident markers rendered without callouts (%s categories)", len(incidents_gdf), len(incident_categories))
 
     def _add_north_arrow_and_scale(self, ax, map_extent, map_width, map_height, sizes, color):
         """Add north arrow and scale bar"""
@@ -1099,7 +1183,7 @@ class MapGenerator:
         north_arrow_path = logo_dir / 'north-arrow.png'
 
         if not north_arrow_path.exists():
-            print(f"   ⚠️  North arrow not found")
+            log.warning("   ⚠️  North arrow not found")
             return
 
         try:
@@ -1160,18 +1244,18 @@ class MapGenerator:
                 f'0        {SCALE_BAR_TARGET_KM/2:.1f}        {SCALE_BAR_TARGET_KM} Km',
                 fontsize=7, ha='center', weight='normal', color=color, zorder=20)
 
-            print(f"   ✅ North arrow and scale bar added")
+            log.info("   ✅ North arrow and scale bar added")
 
         except Exception as e:
-            print(f"   ⚠️  Failed to add north arrow: {e}")
+            log.warning("   ⚠️  Failed to add north arrow: %s", e)
 
     def generate_incident_legend_map(self, output_path: str) -> str:
         """Generate a standalone incident legend (4" × 14")"""
-        print(f"📋 Generating incident legend map...")
+        log.info("📋 Generating incident legend map...")
 
         incidents_gdf = self._create_incidents_gdf()
         if incidents_gdf is None or len(incidents_gdf) == 0:
-            print(f"   ⚠️  No incidents to create legend")
+            log.warning("   ⚠️  No incidents to create legend")
             return None
 
         # Convert to WGS84 for lat/lon display
@@ -1188,7 +1272,7 @@ class MapGenerator:
             incident_categories[cat_code]['incidents'].append(incident)
 
         # Create figure (7.2" × 14" - wider for better readability)
-        fig, ax = plt.subplots(figsize=(7.2, 14), dpi=300)
+        fig, ax = acquire_figure((7.2, 14), 300)
         ax.set_xlim(0, 100)
         ax.set_ylim(0, 194.4)  # 100 * (14/7.2) to keep circles circular
         ax.axis('off')
@@ -1250,12 +1334,12 @@ class MapGenerator:
 
         # Save
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        plt.tight_layout(pad=0)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        fig.tight_layout(pad=0)
+        fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+        # No plt.close(): the figure is pooled and reused by acquire_figure
 
-        print(f"   ✅ Legend saved: {output_path}")
-        print(f"   📊 {len(incident_categories)} categories, {len(incidents_gdf)} total incidents")
+        log.info("   ✅ Legend saved: %s", output_path)
+        log.info("   📊 %s categories, %s total incidents", len(incident_categories), len(incidents_gdf))
         return output_path
 
     def generate_overview_map(self, output_path: str) -> str:
@@ -1263,7 +1347,7 @@ class MapGenerator:
         Generate overview map with vector layers and a beautiful tile basemap.
         Basemap is added LAST to prevent arrow rendering issues.
         """
-        print(f"🗺️  Generating overview map...")
+        log.info("🗺️  Generating overview map...")
 
         # 1. Load shapefiles
         gdfs = self._load_shapefiles()
@@ -1285,11 +1369,11 @@ class MapGenerator:
         sizes['meters_per_unit'] = 1  # Web Mercator uses meters
 
         # 5. Create figure
-        fig, ax = plt.subplots(figsize=(PAGE_WIDTH_INCHES, PAGE_HEIGHT_INCHES), dpi=DPI)
+        fig, ax = acquire_figure((PAGE_WIDTH_INCHES, PAGE_HEIGHT_INCHES), DPI)
         fig.patch.set_facecolor('white')
         ax.set_aspect('equal')
 
-        print(f"   📐 Figure: {PAGE_WIDTH_INCHES}\" × {PAGE_HEIGHT_INCHES}\" @ {DPI} DPI")
+        log.debug("   📐 Figure: %s\" × %s\" @ %s DPI", PAGE_WIDTH_INCHES, PAGE_HEIGHT_INCHES, DPI)
 
         # 6. Set extent FIRST
         ax.set_xlim(map_extent['xmin'], map_extent['xmax'])
@@ -1310,8 +1394,8 @@ class MapGenerator:
 
         # 10. Add basemap LAST (after adjust_text completes)
         # This prevents basemap transform from interfering with arrow rendering
-        print("   🌍 Downloading and stitching basemap tiles...")
-        print("   ⏱️  Timeout: 1 minute for primary, 30 seconds for fallback")
+        log.info("   🌍 Downloading and stitching basemap tiles...")
+        log.info("   ⏱️  Timeout: 1 minute for primary, 30 seconds for fallback")
 
         try:
             import threading
@@ -1341,15 +1425,15 @@ class MapGenerator:
             thread.join(timeout=1)  # 1 minute timeout
 
             if basemap_loaded[0]:
-                print("   ✅ OpenStreetMap basemap loaded successfully")
+                log.info("   ✅ OpenStreetMap basemap loaded successfully")
             else:
                 # Try lighter CartoDB basemap as fallback
                 if error_msg[0]:
-                    print(f"   ⚠️ Primary basemap failed: {error_msg[0]}")
+                    log.warning("   ⚠️ Primary basemap failed: %s", error_msg[0])
                 else:
-                    print(f"   ⚠️ Primary basemap timed out after 1 minute")
+                    log.warning("   ⚠️ Primary basemap timed out after 1 minute")
 
-                print("   🔄 Trying lighter CartoDB basemap...")
+                log.debug("   🔄 Trying lighter CartoDB basemap...")
                 basemap_loaded[0] = False
                 error_msg[0] = None
 
@@ -1374,28 +1458,28 @@ class MapGenerator:
                 thread2.join(timeout=30)  # 30 second timeout for lighter basemap
 
                 if basemap_loaded[0]:
-                    print("   ✅ CartoDB basemap loaded successfully")
+                    log.info("   ✅ CartoDB basemap loaded successfully")
                 else:
                     if error_msg[0]:
-                        print(f"   ⚠️ Fallback basemap also failed: {error_msg[0]}")
+                        log.warning("   ⚠️ Fallback basemap also failed: %s", error_msg[0])
                     else:
-                        print(f"   ⚠️ Fallback basemap timed out after 30 seconds")
-                    print(f"   ℹ️  Continuing without basemap tiles...")
+                        log.warning("   ⚠️ Fallback basemap timed out after 30 seconds")
+                    log.info("   ℹ️  Continuing without basemap tiles...")
 
         except Exception as e:
-            print(f"   ⚠️ Warning: Could not load basemap: {e}")
-            print(f"   ℹ️  Continuing without basemap tiles...")
+            log.warning("   ⚠️ Warning: Could not load basemap: %s", e)
+            log.info("   ℹ️  Continuing without basemap tiles...")
 
         # 10. Final setup
         ax.set_axis_off()
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        plt.tight_layout(pad=0)
-        plt.savefig(output_path, dpi=DPI, bbox_inches='tight',
+        fig.tight_layout(pad=0)
+        fig.savefig(output_path, dpi=DPI, bbox_inches='tight',
                     facecolor='white', edgecolor='none')
-        plt.close()
+        # No plt.close(): the figure is pooled and reused by acquire_figure
 
-        print(f"   ✅ Map saved: {output_path}")
+        log.info("   ✅ Map saved: %s", output_path)
         return output_path
 
     # def generate_satellite_overview_map(self, output_path: str) -> str:
@@ -1548,15 +1632,15 @@ class MapGenerator:
             tuple: (list of map paths, list of incident groups with metadata)
         """
         INCIDENTS_PER_MAP = 3
-        print(f"🛰️  Starting categorized multi-map generation (Max {INCIDENTS_PER_MAP} incidents/map)...")
-        print("!!!!!!!!!!!!!!", output_path)
+        log.info("🛰️  Starting categorized multi-map generation (Max %s incidents/map)...", INCIDENTS_PER_MAP)
+        log.debug("!!!!!!!!!!!!!! %s", output_path)
         # 1. Load data ONCE
         gdfs = self._load_shapefiles()
         all_incidents_gdf = self._create_incidents_gdf()
 
         # Handle case with no incidents
         if all_incidents_gdf is None or len(all_incidents_gdf) == 0:
-            print("ℹ️ No incidents found. Generating one base map.")
+            log.info("ℹ️ No incidents found. Generating one base map.")
             output_path = os.path.join(output_path, 'satellite_overview_base.png')
             map_path = self._generate_single_satellite_map(gdfs, None, output_path)
             return ([map_path], [[]])
@@ -1564,7 +1648,7 @@ class MapGenerator:
         # ---------------------------------------------------------
         # 2. ENRICH & SORT: Apply categorization manually to allow sorting
         # ---------------------------------------------------------
-        print("ℹ️ Categorizing incidents for sorting...")
+        log.info("ℹ️ Categorizing incidents for sorting...")
         
         # We create a temporary list to hold the category codes
         cat_codes = []
@@ -1601,14 +1685,14 @@ class MapGenerator:
         num_incidents = len(all_incidents_gdf)
         num_maps = (num_incidents + INCIDENTS_PER_MAP - 1) // INCIDENTS_PER_MAP
         
-        print(f"ℹ️ Found {num_incidents} incidents across categories: {all_incidents_gdf['incident_category'].unique()}")
-        print(f"ℹ️ Will generate {num_maps} map(s).")
+        log.info("ℹ️ Found %s incidents across categories: %s", num_incidents, all_incidents_gdf['incident_category'].unique())
+        log.info("ℹ️ Will generate %s map(s).", num_maps)
 
         output_paths = []
         incident_groups = []  # Store incident metadata for each map
 
         # 4. Loop to generate maps
-        print("!!!!!!!!!!!!!!!!!!!!!!!!!!!", self.incidents)
+        log.debug("!!!!!!!!!!!!!!!!!!!!!!!!!!! %s", self.incidents)
         for i in range(num_maps):
             start_index = i * INCIDENTS_PER_MAP
             end_index = start_index + INCIDENTS_PER_MAP
@@ -1621,17 +1705,17 @@ class MapGenerator:
             for idx in range(start_index, min(end_index, len(self.incidents))):
                 row = all_incidents_gdf.iloc[idx]   # Fixed: use idx not i
 
-                print("!!!!!!!!", row)
+                log.debug("!!!!!!!! %s", row)
                 # Find this incident in your original list by incidentId
                 incident = next(
                     (inc for inc in self.incidents if inc.get("incidentId") == row["id"]),
                     None
                 )
 
-                print("!!!!!!!!", incident)
+                log.debug("!!!!!!!! %s", incident)
 
                 if incident is None:
-                    print(f"⚠️ incidentId {row['incidentId']} not found in metadata list")
+                    log.warning("⚠️ incidentId %s not found in metadata list", row['incidentId'])
                     continue
 
                 metadata = {
@@ -1646,7 +1730,7 @@ class MapGenerator:
                 incidents_metadata.append(metadata)
 
             incident_groups.append(incidents_metadata)
-            print(f"📸 Attached {len(incidents_metadata)} incident metadata for map {i+1}")
+            log.info("📸 Attached %s incident metadata for map %s", len(incidents_metadata), i+1)
 
             # Generate a filename based on the category of the first incident in this batch
             try:
@@ -1659,16 +1743,16 @@ class MapGenerator:
 
             filename = f"Map_{i+1:02d}_{cat_label}.png"
             subset_output_path = os.path.join(output_path, filename)
-            print(subset_output_path)
+            log.debug("%s", subset_output_path)
 
             # Call the helper to generate the composite image (map + annotated images + lines)
             map_path = self._generate_composite_satellite_map(
                 gdfs, incidents_subset_gdf, incidents_metadata, subset_output_path
             )
             output_paths.append(map_path)
-            print("!!!!!!!!!!! finsih creating one map")
+            log.debug("!!!!!!!!!!! finsih creating one map")
 
-        print(f"✅ Finished generating all {len(output_paths)} maps with incident metadata.")
+        log.info("✅ Finished generating all %s maps with incident metadata.", len(output_paths))
         return (output_paths, incident_groups)
 
 
@@ -1684,7 +1768,7 @@ class MapGenerator:
         from pathlib import Path
         import tempfile
 
-        print(f"   🎨 Creating composite satellite overview with annotated images...")
+        log.info("   🎨 Creating composite satellite overview with annotated images...")
 
         # Step 1: Generate the satellite map to a temporary file and get its extent
         temp_map = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
@@ -1694,20 +1778,20 @@ class MapGenerator:
         # Step 2: Load the map image
         map_img = Image.open(map_image_path)
         map_width, map_height = map_img.size
-        print(f"   📏 Map dimensions: {map_width}x{map_height}")
+        log.debug("   📏 Map dimensions: %sx%s", map_width, map_height)
 
         # Step 3: Calculate composite dimensions
         # Map takes 70% of width, images take 30%
         composite_width = int(map_width / 0.7)  # If map is 70%, calculate total width
         images_column_width = composite_width - map_width
         composite_height = map_height
-        print(f"   📐 Composite dimensions: {composite_width}x{composite_height}")
-        print(f"   📦 Images column width: {images_column_width}")
+        log.debug("   📐 Composite dimensions: %sx%s", composite_width, composite_height)
+        log.debug("   📦 Images column width: %s", images_column_width)
 
         # Step 4: Create composite canvas
         composite = Image.new('RGB', (composite_width, composite_height), color='white')
         composite.paste(map_img, (0, 0))
-        print(f"   ✅ Map pasted at (0, 0)")
+        log.debug("   ✅ Map pasted at (0, 0)")
 
         # Step 5: Get base projects directory for loading annotated images
         # Navigate from app/services/ -> app/ -> Backend/report system/ -> projects/
@@ -1723,7 +1807,7 @@ class MapGenerator:
             map_extent_lat_min = map_extent['ymin']
             map_extent_lat_max = map_extent['ymax']
 
-            print(f"   📍 Using map extent: lon [{map_extent_lon_min:.6f}, {map_extent_lon_max:.6f}] lat [{map_extent_lat_min:.6f}, {map_extent_lat_max:.6f}]")
+            log.debug("   📍 Using map extent: lon [%.6f, %.6f] lat [%.6f, %.6f]", map_extent_lon_min, map_extent_lon_max, map_extent_lat_min, map_extent_lat_max)
 
             if map_extent_lon_max > map_extent_lon_min and map_extent_lat_max > map_extent_lat_min:
 
@@ -1734,7 +1818,7 @@ class MapGenerator:
 
                 for idx, incident in enumerate(incidents_metadata[:3]):
                     photo_path_relative = incident.get('photoPath', '')
-                    print("!!!!!!!!!!!!", photo_path_relative)
+                    log.debug("!!!!!!!!!!!! %s", photo_path_relative)
                     circle_center = incident.get('circleCenter', {})
                     inc_lat = incident.get('latitude', 0)
                     inc_lon = incident.get('longitude', 0)
@@ -1745,17 +1829,17 @@ class MapGenerator:
                     incident_color = category['color']  # This is a hex string like '#FF5733'
                     # Convert hex color to RGB tuple for PIL
                     color_rgb = tuple(int(incident_color.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-                    print(f"      🎨 Incident category: {category['name']}, Color: {incident_color} -> RGB{color_rgb}")
+                    log.debug("      🎨 Incident category: %s, Color: %s -> RGB%s", category['name'], incident_color, color_rgb)
 
                     if not photo_path_relative:
-                        print(f"      ⚠️ No photo path for incident {idx + 1}")
+                        log.warning("      ⚠️ No photo path for incident %s", idx + 1)
                         continue
 
                     # Construct full path
                     photo_path = str(base_dir / photo_path_relative)
 
                     if not os.path.exists(photo_path):
-                        print(f"      ⚠️ Image not found: {photo_path}")
+                        log.warning("      ⚠️ Image not found: %s", photo_path)
                         continue
 
                     try:
@@ -1764,11 +1848,11 @@ class MapGenerator:
 
                         # Convert to RGB if necessary (handles RGBA, CMYK, grayscale, etc.)
                         if annotated_img.mode != 'RGB':
-                            print(f"      🔄 Converting image from {annotated_img.mode} to RGB")
+                            log.debug("      🔄 Converting image from %s to RGB", annotated_img.mode)
                             annotated_img = annotated_img.convert('RGB')
 
                         orig_width, orig_height = annotated_img.size
-                        print(f"      📐 Original image size: {orig_width}x{orig_height}")
+                        log.debug("      📐 Original image size: %sx%s", orig_width, orig_height)
 
                         # Get circle center - clamp to image bounds if coordinates are from different resolution
                         circle_x = circle_center.get('x', orig_width / 2)
@@ -1776,11 +1860,11 @@ class MapGenerator:
 
                         # If circle center is outside image bounds, use center of image
                         if circle_x < 0 or circle_x > orig_width or circle_y < 0 or circle_y > orig_height:
-                            print(f"      ⚠️ Circle center ({circle_x:.0f}, {circle_y:.0f}) outside image bounds ({orig_width}x{orig_height}), using image center")
+                            log.warning("      ⚠️ Circle center (%.0f, %.0f) outside image bounds (%sx%s), using image center", circle_x, circle_y, orig_width, orig_height)
                             circle_x = orig_width / 2
                             circle_y = orig_height / 2
 
-                        print(f"      🎯 Circle center: ({circle_x:.0f}, {circle_y:.0f})")
+                        log.debug("      🎯 Circle center: (%.0f, %.0f)", circle_x, circle_y)
 
                         # Crop to square around circle - use the whole image if it's already small
                         padding_factor = 1.8
@@ -1806,7 +1890,7 @@ class MapGenerator:
                         crop_height = bottom - top
 
                         if crop_width <= 0 or crop_height <= 0:
-                            print(f"      ⚠️ Invalid crop dimensions, using full image")
+                            log.warning("      ⚠️ Invalid crop dimensions, using full image")
                             left, top, right, bottom = 0, 0, orig_width, orig_height
                             crop_size = min(orig_width, orig_height)
                         else:
@@ -1833,7 +1917,7 @@ class MapGenerator:
                                 if bottom - top < crop_size:
                                     crop_size = bottom - top
 
-                        print(f"      ✂️  Crop box: ({left}, {top}, {right}, {bottom}) size={crop_size}")
+                        log.debug("      ✂️  Crop box: (%s, %s, %s, %s) size=%s", left, top, right, bottom, crop_size)
 
                         cropped = annotated_img.crop((left, top, right, bottom))
 
@@ -1841,13 +1925,13 @@ class MapGenerator:
                         # Use the smaller of width/height to ensure it fits
                         max_size = min(images_column_width - 2 * padding, image_height - 2 * padding)
                         target_size = (max_size, max_size)  # Square!
-                        print(f"      📏 Resizing to SQUARE: {target_size}")
+                        log.debug("      📏 Resizing to SQUARE: %s", target_size)
                         cropped_resized = cropped.resize(target_size, Image.Resampling.LANCZOS)
 
                         # Paste into composite - center it in the row
                         paste_x = map_width + padding
                         paste_y = idx * image_height + padding + (image_height - max_size) // 2  # Center vertically in row
-                        print(f"      📍 Pasting at: ({paste_x}, {paste_y})")
+                        log.debug("      📍 Pasting at: (%s, %s)", paste_x, paste_y)
                         composite.paste(cropped_resized, (paste_x, paste_y))
 
                         # Calculate circle center position in composite
@@ -1856,11 +1940,11 @@ class MapGenerator:
 
                         # Debug: check if circle is within crop
                         if circle_x_in_crop < 0 or circle_x_in_crop > (right - left) or circle_y_in_crop < 0 or circle_y_in_crop > (bottom - top):
-                            print(f"      ⚠️ Circle center outside crop region, using crop center")
+                            log.warning("      ⚠️ Circle center outside crop region, using crop center")
                             circle_x_in_crop = (right - left) / 2
                             circle_y_in_crop = (bottom - top) / 2
 
-                        print(f"      📍 Circle in crop: ({circle_x_in_crop:.1f}, {circle_y_in_crop:.1f})")
+                        log.debug("      📍 Circle in crop: (%.1f, %.1f)", circle_x_in_crop, circle_y_in_crop)
 
                         scale_x = target_size[0] / crop_size if crop_size > 0 else 1
                         scale_y = target_size[1] / crop_size if crop_size > 0 else 1
@@ -1868,12 +1952,12 @@ class MapGenerator:
                         circle_center_x = paste_x + (circle_x_in_crop * scale_x)
                         circle_center_y = paste_y + (circle_y_in_crop * scale_y)
 
-                        print(f"      🎯 Final circle center in composite: ({circle_center_x:.1f}, {circle_center_y:.1f})")
+                        log.debug("      🎯 Final circle center in composite: (%.1f, %.1f)", circle_center_x, circle_center_y)
 
                         # Calculate incident marker position on map
-                        print(f"      🔍 Calculating connector line for incident {idx + 1}")
-                        print(f"         Map extent check: lon [{map_extent_lon_min:.6f}, {map_extent_lon_max:.6f}] lat [{map_extent_lat_min:.6f}, {map_extent_lat_max:.6f}]")
-                        print(f"         Incident position: lat={inc_lat:.6f}, lon={inc_lon:.6f}")
+                        log.debug("      🔍 Calculating connector line for incident %s", idx + 1)
+                        log.debug("         Map extent check: lon [%.6f, %.6f] lat [%.6f, %.6f]", map_extent_lon_min, map_extent_lon_max, map_extent_lat_min, map_extent_lat_max)
+                        log.debug("         Incident position: lat=%.6f, lon=%.6f", inc_lat, inc_lon)
 
                         if map_extent_lon_max > map_extent_lon_min and map_extent_lat_max > map_extent_lat_min:
                             norm_x = (inc_lon - map_extent_lon_min) / (map_extent_lon_max - map_extent_lon_min)
@@ -1882,9 +1966,9 @@ class MapGenerator:
                             incident_map_x = norm_x * map_width
                             incident_map_y = norm_y * map_height
 
-                            print(f"         Normalized: x={norm_x:.3f}, y={norm_y:.3f}")
-                            print(f"         Incident marker at: ({incident_map_x:.1f}, {incident_map_y:.1f})")
-                            print(f"         Circle center at: ({circle_center_x:.1f}, {circle_center_y:.1f})")
+                            log.debug("         Normalized: x=%.3f, y=%.3f", norm_x, norm_y)
+                            log.debug("         Incident marker at: (%.1f, %.1f)", incident_map_x, incident_map_y)
+                            log.debug("         Circle center at: (%.1f, %.1f)", circle_center_x, circle_center_y)
 
                             # Draw connector line using incident's category color
                             draw.line(
@@ -1893,16 +1977,16 @@ class MapGenerator:
                                 width=8
                             )
 
-                            print(f"      ✅ Added incident {idx + 1} with connector line (color: {incident_color})")
+                            log.debug("      ✅ Added incident %s with connector line (color: %s)", idx + 1, incident_color)
                         else:
-                            print(f"      ⚠️ Skipping connector: Invalid map extent")
+                            log.warning("      ⚠️ Skipping connector: Invalid map extent")
 
                     except Exception as e:
-                        print(f"      ⚠️ Error processing incident {idx + 1}: {e}")
+                        log.warning("      ⚠️ Error processing incident %s: %s", idx + 1, e)
 
         # Step 7: Save composite image
         composite.save(output_path, format='PNG', dpi=(DPI, DPI))
-        print(f"   ✅ Composite saved: {os.path.basename(output_path)}")
+        log.info("   ✅ Composite saved: %s", os.path.basename(output_path))
 
         # Cleanup temp map
         try:
@@ -1917,7 +2001,7 @@ class MapGenerator:
         Helper: Renders a single map for a specific subset of incidents.
         Contains the original threading/rendering logic.
         """
-        print(f"   📍 Processing map: {os.path.basename(output_path)}")
+        log.debug("   📍 Processing map: %s", os.path.basename(output_path))
         
         # Use WGS84 (degrees)
         target_crs = "EPSG:4326"
@@ -1935,7 +2019,7 @@ class MapGenerator:
         sizes = self._calculate_sizes(map_width, map_height, is_web_mercator=False)
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(PAGE_WIDTH_INCHES, PAGE_HEIGHT_INCHES), dpi=DPI)
+        fig, ax = acquire_figure((PAGE_WIDTH_INCHES, PAGE_HEIGHT_INCHES), DPI)
         ax.set_aspect('equal')
 
         # Set extent BEFORE adding basemap
@@ -1954,7 +2038,7 @@ class MapGenerator:
         self._setup_basemap_cache(map_type='satellite')
 
         # --- ORIGINAL THREADING LOGIC PRESERVED ---
-        print(f"    📡 Fetching satellite imagery...")
+        log.debug("    📡 Fetching satellite imagery...")
         try:
             import threading
             import time
@@ -1984,14 +2068,14 @@ class MapGenerator:
 
             if basemap_loaded[0]:
                 elapsed = time.time() - start_time
-                print(f"    ✅ Satellite imagery loaded in {elapsed:.1f}s")
+                log.debug("    ✅ Satellite imagery loaded in %.1fs", elapsed)
             else:
                 if error_msg[0]:
-                    print(f"    ⚠️ Satellite basemap failed: {error_msg[0]}")
+                    log.warning("    ⚠️ Satellite basemap failed: %s", error_msg[0])
                 else:
-                    print(f"    ⚠️ Satellite basemap timed out")
+                    log.warning("    ⚠️ Satellite basemap timed out")
 
-                print("    🔄 Trying lighter CartoDB basemap...")
+                log.debug("    🔄 Trying lighter CartoDB basemap...")
                 basemap_loaded[0] = False
                 error_msg[0] = None
 
@@ -2016,13 +2100,13 @@ class MapGenerator:
                 thread2.join(timeout=30) 
 
                 if basemap_loaded[0]:
-                    print("    ✅ CartoDB fallback basemap loaded")
+                    log.debug("    ✅ CartoDB fallback basemap loaded")
                 else:
-                    print(f"    ⚠️ Fallback basemap failed/timed out")
-                    print(f"    ℹ️  Continuing without basemap tiles...")
+                    log.warning("    ⚠️ Fallback basemap failed/timed out")
+                    log.debug("    ℹ️  Continuing without basemap tiles...")
 
         except Exception as e:
-            print(f"    ⚠️ Warning: Could not load satellite basemap: {e}")
+            log.warning("    ⚠️ Warning: Could not load satellite basemap: %s", e)
         # -------------------------------------------
 
         # Set extent and save
@@ -2031,20 +2115,90 @@ class MapGenerator:
         ax.set_ylim(map_extent['ymin'], map_extent['ymax'])
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        plt.tight_layout(pad=0)
-        plt.savefig(output_path, dpi=DPI, bbox_inches='tight',
+        fig.tight_layout(pad=0)
+        fig.savefig(output_path, dpi=DPI, bbox_inches='tight',
                     facecolor='white', edgecolor='none')
-        plt.close()
+        # No plt.close(): the figure is pooled and reused by acquire_figure
 
-        print(f"    ✅ Saved: {output_path}")
+        log.debug("    ✅ Saved: %s", output_path)
         return output_path, map_extent
 
 # ============================================================================
 # ASYNC WRAPPER
 # ============================================================================
 
+# Maps render in worker processes: pyplot keeps global "current figure" state (plt.savefig/plt.close),
+# so threads would trample each other's figures, and matplotlib/GEOS work is GIL-bound anyway.
+_map_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_map_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared map rendering process pool"""
+    global _map_executor
+    if _map_executor is None:
+        _map_executor = ProcessPoolExecutor(max_workers=get_settings().map_workers,
+                                            initializer=init_worker_logging)
+    return _map_executor
+
+
+def _discard_broken_map_executor(executor: ProcessPoolExecutor):
+    """Drop a broken pool (a worker died) so the next get_map_executor() builds a fresh one"""
+    global _map_executor
+    if _map_executor is executor:  # Another job may already have replaced it
+        _map_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_map_executor():
+    """Shut down the map rendering process pool (app shutdown)"""
+    global _map_executor
+    if _map_executor is not None:
+        _map_executor.shutdown(wait=False, cancel_futures=True)
+        _map_executor = None
+
+
+def _run_map_job(method_name: str, global_assets_dir: str, shapefile_dir: str, project_data: Dict[str, Any],
+                 incidents: List[Dict[str, Any]], output_path: str):
+    """Build a MapGenerator and call one of its generate_* methods (runs in a worker process)"""
+    generator = MapGenerator(global_assets_dir, shapefile_dir, project_data, incidents)
+    return getattr(generator, method_name)(output_path)
+
+
+async def _submit_map_job(method_name: str, global_assets_dir: str, shapefile_dir: str,
+                          project_data: Dict[str, Any], incidents: List[Dict[str, Any]], output_path: str):
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = get_map_executor()
+        try:
+            return await loop.run_in_executor(
+                executor, _run_map_job, method_name,
+                global_assets_dir, shapefile_dir, project_data, incidents, output_path
+            )
+        except BrokenProcessPool:
+            # A worker died (OOM, GEOS/GDAL crash) - the pool is unusable from now on
+            _discard_broken_map_executor(executor)
+            if attempt:
+                raise
+            log.warning("⚠️  Map worker pool broke during %s, retrying on a fresh pool", method_name)
+
+
 async def generate_overview_map(global_assets_dir: str, shapefile_dir: str, project_data: Dict[str, Any],
                                 incidents: List[Dict[str, Any]], output_path: str) -> str:
     """Generate overview map (async wrapper)"""
-    generator = MapGenerator(global_assets_dir, shapefile_dir, project_data, incidents)
-    return generator.generate_overview_map(output_path)
\ No newline at end of file
+    return await _submit_map_job("generate_overview_map", global_assets_dir, shapefile_dir,
+                                 project_data, incidents, output_path)
+
+
+async def generate_satellite_overview_map(global_assets_dir: str, shapefile_dir: str, project_data: Dict[str, Any],
+                                          incidents: List[Dict[str, Any]],
+                                          output_path: str) -> tuple[list[str], list[list[dict]]]:
+    """Generate satellite overview maps and incident groups (async wrapper)"""
+    return await _submit_map_job("generate_satellite_overview_map", global_assets_dir, shapefile_dir,
+                                 project_data, incidents, output_path)
+
+
+async def generate_incident_legend_map(global_assets_dir: str, shapefile_dir: str, project_data: Dict[str, Any],
+                                       incidents: List[Dict[str, Any]], output_path: str) -> str:
+    """Generate incident legend map (async wrapper)"""
+    return await _submit_map_job("generate_incident_legend_map", global_assets_dir, shapefile_dir,
+                                 project_data, incidents, output_path)
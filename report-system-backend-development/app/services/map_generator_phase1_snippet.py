@@ -1,69 +1,108 @@
         # PHASE 1: Plot layers in exact z-order from experimental.md
+        # Step logging goes to the "report" logger (log = logging.getLogger("report.maps") in map_generator.py)
+        verbose = log.isEnabledFor(logging.DEBUG)
 
         # STEP 2: Base Layers (Water and Boundaries)
+        # Only features near the pipeline + incidents extent are plotted (spatial index filter)
+        data_bounds = pipeline_gdf.total_bounds
+        if incidents_gdf is not None and len(incidents_gdf) > 0:
+            inc_bounds = incidents_gdf.total_bounds
+            data_bounds = [min(data_bounds[0], inc_bounds[0]), min(data_bounds[1], inc_bounds[1]),
+                           max(data_bounds[2], inc_bounds[2]), max(data_bounds[3], inc_bounds[3])]
+        data_extent = {'xmin': data_bounds[0], 'ymin': data_bounds[1],
+                       'xmax': data_bounds[2], 'ymax': data_bounds[3]}
+        sea_gdf = self._filter_to_extent(sea_gdf, data_extent)
+        rivers_poly_gdf = self._filter_to_extent(rivers_poly_gdf, data_extent)
+        boundaries_gdf = self._filter_to_extent(boundaries_gdf, data_extent)
+        rivers_gdf = self._filter_to_extent(rivers_gdf, data_extent)
+        minor_rivers_gdf = self._filter_to_extent(minor_rivers_gdf, data_extent)
+
+        # Heavy polygon/line layers are rasterized=True so vector exports embed them as one image
         # 1. Water Polygons (Sea + River Polygons) - zorder=1
-        print("   → Plotting water polygons (sea, river polygons)")
-        sea_gdf.plot(ax=ax, color=COLORS['water_polygon'], edgecolor='none', zorder=1)
-        rivers_poly_gdf.plot(ax=ax, color=COLORS['water_polygon'], edgecolor='none', zorder=1)
+        if verbose:
+            log.debug("   → Plotting water polygons (sea, river polygons)")
+        sea_gdf.plot(ax=ax, color=COLORS['water_polygon'], edgecolor='none', zorder=1, rasterized=True)
+        rivers_poly_gdf.plot(ax=ax, color=COLORS['water_polygon'], edgecolor='none', zorder=1, rasterized=True)
 
         # 2. LGA Boundaries - zorder=2
-        print("   → Plotting LGA boundaries")
+        if verbose:
+            log.debug("   → Plotting LGA boundaries")
         boundaries_gdf.plot(ax=ax, facecolor='none', edgecolor=COLORS['boundaries'],
-                           linewidth=0.5, zorder=2)
+                           linewidth=0.5, zorder=2, rasterized=True)
 
         # 3. River Lines - zorder=3
-        print("   → Plotting river lines")
-        rivers_gdf.plot(ax=ax, color=COLORS['river_lines'], linewidth=0.8, zorder=3)
-        minor_rivers_gdf.plot(ax=ax, color=COLORS['river_lines'], linewidth=0.6, zorder=3)
+        if verbose:
+            log.debug("   → Plotting river lines")
+        rivers_gdf.plot(ax=ax, color=COLORS['river_lines'], linewidth=0.8, zorder=3, rasterized=True)
+        minor_rivers_gdf.plot(ax=ax, color=COLORS['river_lines'], linewidth=0.6, zorder=3, rasterized=True)
 
         # STEP 3: Settlement Points and Labels - zorder=4
-        print("   → Plotting all settlements with labels")
-        for idx, row in settlements_gdf.iterrows():
-            point = row.geometry
-            if point.is_empty or not hasattr(point, 'x'):
-                continue
-
-            # Plot small black circle for settlement
-            ax.plot(point.x, point.y, 'o', color=COLORS['settlement_marker'],
-                   markersize=2.5, zorder=4)
-
+        if verbose:
+            log.debug("   → Plotting all settlements with labels")
+        # Small black circles for all settlements in one scatter call (s = markersize**2 = 2.5**2)
+        settlement_pts = settlements_gdf[~settlements_gdf.geometry.is_empty &
+                                         (settlements_gdf.geom_type == 'Point')]
+        settlement_xs = settlement_pts.geometry.x.to_numpy()
+        settlement_ys = settlement_pts.geometry.y.to_numpy()
+        ax.scatter(settlement_xs, settlement_ys,
+                   s=6.25, c=COLORS['settlement_marker'], zorder=4)
+
+        # Labels: iterate plain column arrays (no per-row Series construction)
+        name_col = next((c for c in ('NAME', 'name') if c in settlement_pts.columns), None)
+        names = (settlement_pts[name_col].fillna('').astype(str).to_numpy() if name_col
+                 else [''] * len(settlement_pts))
+        for x, y, name in zip(settlement_xs, settlement_ys, names):
             # Add settlement name label with white outline
-            name = str(row.get('NAME', row.get('name', '')))
             if name:
-                ax.text(point.x + 0.001, point.y, name, fontsize=7,
+                ax.text(x + 0.001, y, name, fontsize=7,
                        ha='left', va='center', color=COLORS['text_main'], zorder=4,
                        path_effects=[patheffects.withStroke(linewidth=2, foreground='white')])
 
         # STEP 4: Pipeline and Markers
         # 5. Pipeline Route - zorder=5
-        print("   → Plotting pipeline route")
+        if verbose:
+            log.debug("   → Plotting pipeline route")
         pipeline_gdf.plot(ax=ax, color=COLORS['pipeline'], linewidth=3.5,
                          linestyle=(0, (6, 4)), zorder=5)  # (6,4) = dash-space pattern
 
         # 6. Pipeline Markers (Solid Circles) - zorder=6
-        print("   → Adding pipeline markers")
-        pipeline_coords = []
+        if verbose:
+            log.debug("   → Adding pipeline markers")
+        # One contiguous (N, 2) float array of all vertices (x, y only - drops any Z).
+        # Typed dispatch instead of hasattr(geom, 'coords'): Multi* parts are expanded explicitly
+        import numpy as np
+        from matplotlib.collections import EllipseCollection
+        from shapely.geometry import LineString, MultiLineString
+        coord_arrays = []
         for geom in pipeline_gdf.geometry:
-            if hasattr(geom, 'coords'):
-                pipeline_coords.extend(list(geom.coords))
-
-        for coord in pipeline_coords[::3]:  # Every 3rd point
-            circle = Circle((coord[0], coord[1]), radius=0.0025,
-                           facecolor=COLORS['pipeline_markers'],
-                           edgecolor='none',  # No outline - solid magenta
-                           zorder=6)
-            ax.add_patch(circle)
+            if geom is None or geom.is_empty:
+                continue
+            if isinstance(geom, LineString):
+                coord_arrays.append(np.asarray(geom.coords)[:, :2])
+            elif isinstance(geom, MultiLineString):
+                coord_arrays.extend(np.asarray(part.coords)[:, :2] for part in geom.geoms if not part.is_empty)
+        pipeline_coords = np.concatenate(coord_arrays) if coord_arrays else np.empty((0, 2))
+
+        # Every 3rd point, all drawn as one collection (diameter 0.005 = the old Circle radius 0.0025)
+        marker_coords = pipeline_coords[::3]
+        if len(marker_coords):
+            ax.add_collection(EllipseCollection(
+                widths=0.005, heights=0.005, angles=0, units='xy',
+                offsets=marker_coords, offset_transform=ax.transData,
+                facecolors=COLORS['pipeline_markers'],
+                edgecolors='none',  # No outline - solid magenta
+                zorder=6))
 
         # STEP 5: Pipeline Label - zorder=7
         # 7. Rotated Pipeline Label
-        print("   → Adding pipeline label")
+        if verbose:
+            log.debug("   → Adding pipeline label")
         if len(pipeline_coords) > 1:
             mid_idx = len(pipeline_coords) // 2
             p1 = pipeline_coords[mid_idx]
             p2 = pipeline_coords[mid_idx + 1] if mid_idx + 1 < len(pipeline_coords) else p1
 
             # Calculate rotation angle
-            import numpy as np
             angle_rad = np.arctan2(p2[1] - p1[1], p2[0] - p1[0])
             angle_deg = np.degrees(angle_rad)
 
@@ -76,7 +115,11 @@
 
         # STEP 6: Incidents and Callouts
         if incidents_gdf is not None and len(incidents_gdf) > 0:
-            print(f"   → Plotting {len(incidents_gdf)} incidents with callouts")
+            if verbose:
+                log.debug("   → Plotting %s incidents with callouts", len(incidents_gdf))
+            from matplotlib.collections import LineCollection
+            incident_xy = []
+            connector_segs = []
             for idx, (incident, inc_data) in enumerate(zip(incidents_gdf.itertuples(), self.incidents)):
                 x, y = incident.geometry.x, incident.geometry.y
 
@@ -84,10 +127,8 @@
                 callout_x = x + 0.08 if idx % 2 == 0 else x - 0.08
                 callout_y = y + 0.02
 
-                # 8. Connecting Line - zorder=8
-                ax.plot([x, callout_x], [y, callout_y],
-                       color=COLORS['incident_marker'],
-                       linewidth=1.0, linestyle='--', zorder=8)
+                # 8. Connecting Line - collected, drawn as one LineCollection after the loop
+                connector_segs.append(((x, y), (callout_x, callout_y)))
 
                 # 9. Callout Box - zorder=9
                 coords_text = f"(N{inc_data['latitude']:.6f}, E{inc_data['longitude']:.6f})"
@@ -101,9 +142,18 @@
                        ha='center', va='center', bbox=bbox_props, zorder=9,
                        linespacing=1.4)
 
-                # 10. Incident Marker - zorder=10
-                circle = Circle((x, y), radius=0.005,
-                               facecolor=COLORS['incident_marker'],
-                               edgecolor=COLORS['incident_outline'],
-                               linewidth=2, zorder=10)
-                ax.add_patch(circle)
+                incident_xy.append((x, y))
+
+            # 8. Connecting Lines - zorder=8, one collection (N, 2, 2) of marker -> callout segments
+            ax.add_collection(LineCollection(
+                np.asarray(connector_segs, dtype=float),
+                colors=COLORS['incident_marker'],
+                linewidths=1.0, linestyles='--', zorder=8))
+
+            # 10. Incident Markers - zorder=10, one collection (diameter 0.01 = the old radius 0.005)
+            ax.add_collection(EllipseCollection(
+                widths=0.01, heights=0.01, angles=0, units='xy',
+                offsets=np.asarray(incident_xy, dtype=float), offset_transform=ax.transData,
+                facecolors=COLORS['incident_marker'],
+                edgecolors=COLORS['incident_outline'],
+                linewidths=2, zorder=10))
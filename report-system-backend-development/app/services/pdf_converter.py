@@ -1,9 +1,85 @@
 """
 PDF Converter Service - Convert PPTX to PDF using PowerPoint COM automation (Windows)
+or LibreOffice on Linux/servers (persistent unoserver daemons, else headless soffice)
 """
 import os
 import sys
+import atexit
+import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from app.config import get_settings
+
+
+# ============================================================================
+# POWERPOINT POOL (persistent COM servers)
+# ============================================================================
+
+# Presentation.ExportAsFixedFormat constants (ppFixedFormatTypePDF, ppFixedFormatIntentPrint)
+PP_FIXED_FORMAT_TYPE_PDF = 2
+PP_FIXED_FORMAT_INTENT_PRINT = 2
+
+
+class PowerPointPool:
+    """
+    Warm PowerPoint COM servers reused across conversions
+
+    Starting and quitting PowerPoint costs seconds per call, so each worker thread keeps
+    its own Application handle alive (COM objects can't be shared across apartments/threads)
+    and PowerPoint is only quit at process exit.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started = False
+
+    @contextmanager
+    def acquire(self):
+        """Yield this thread's PowerPoint.Application, starting it on first use"""
+        powerpoint = getattr(self._local, 'powerpoint', None)
+        if powerpoint is None:
+            import comtypes
+            import comtypes.client
+
+            comtypes.CoInitialize()
+            powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
+            self._local.powerpoint = powerpoint
+            with self._lock:
+                self._started = True
+
+        try:
+            yield powerpoint
+        except Exception:
+            # The server may have crashed or been closed - start a fresh one next time
+            self._local.powerpoint = None
+            raise
+
+    def shutdown(self):
+        """Quit PowerPoint (registered with atexit)"""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+
+        try:
+            import comtypes
+            import comtypes.client
+
+            comtypes.CoInitialize()
+            # PowerPoint is a single-instance server, so this attaches to the pooled one
+            comtypes.client.GetActiveObject("Powerpoint.Application").Quit()
+        except Exception:
+            pass
+
+
+powerpoint_pool = PowerPointPool()
+atexit.register(powerpoint_pool.shutdown)
 
 
 def convert_pptx_to_pdf(pptx_path: str, pdf_path: str = None) -> str:
@@ -39,27 +115,21 @@ def convert_pptx_to_pdf(pptx_path: str, pdf_path: str = None) -> str:
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Import COM automation library
-        import comtypes.client
-
         print(f"📄 Converting PPTX to PDF...")
         print(f"   Input:  {pptx_path}")
         print(f"   Output: {pdf_path}")
 
-        # Start PowerPoint
-        powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
-        powerpoint.Visible = 1  # Make visible for debugging (optional)
-
-        # Open presentation
-        presentation = powerpoint.Presentations.Open(str(pptx_path), WithWindow=False)
-
-        # Save as PDF (format 32 = ppSaveAsPDF)
-        # See: https://docs.microsoft.com/en-us/office/vba/api/powerpoint.ppsaveasfiletype
-        presentation.SaveAs(str(pdf_path), 32)
-
-        # Close presentation and PowerPoint
-        presentation.Close()
-        powerpoint.Quit()
+        # Reuse the warm PowerPoint instance (no window: WithWindow=False)
+        with powerpoint_pool.acquire() as powerpoint:
+            presentation = powerpoint.Presentations.Open(str(pptx_path), WithWindow=False)
+            try:
+                # Export as PDF - skips SaveAs's document-state/recent-files bookkeeping
+                # See: https://learn.microsoft.com/en-us/office/vba/api/powerpoint.presentation.exportasfixedformat
+                presentation.ExportAsFixedFormat(str(pdf_path), PP_FIXED_FORMAT_TYPE_PDF,
+                                                 PP_FIXED_FORMAT_INTENT_PRINT)
+            finally:
+                # Close the presentation only - PowerPoint stays up for the next conversion
+                presentation.Close()
 
         print(f"   ✅ PDF created successfully: {pdf_path.name}")
 
@@ -71,20 +141,179 @@ def convert_pptx_to_pdf(pptx_path: str, pdf_path: str = None) -> str:
             "Install with: pip install comtypes"
         )
     except Exception as e:
-        # Clean up PowerPoint if it's still running
-        try:
-            if 'powerpoint' in locals():
-                powerpoint.Quit()
-        except:
-            pass
-
         raise Exception(f"PDF conversion failed: {str(e)}")
 
 
+# ============================================================================
+# UNOSERVER (persistent LibreOffice daemons)
+# ============================================================================
+
+# Free daemon ports - each unoserver converts one document at a time, so a conversion
+# checks a port out and hands it back when done (round-robin across the daemons)
+_unoserver_ports: Optional[asyncio.Queue] = None
+
+
+def _configured_unoserver_ports() -> List[int]:
+    """Parse the comma-separated UNOSERVER_PORTS setting"""
+    raw = get_settings().unoserver_ports
+    return [int(port) for port in raw.split(",") if port.strip()]
+
+
+def _get_unoserver_ports() -> asyncio.Queue:
+    """Lazily build the free-port queue (must be created on the running event loop)"""
+    global _unoserver_ports
+    if _unoserver_ports is None:
+        _unoserver_ports = asyncio.Queue()
+        for port in _configured_unoserver_ports():
+            _unoserver_ports.put_nowait(port)
+    return _unoserver_ports
+
+
+async def convert_pptx_to_pdf_unoserver(pptx_path: str, pdf_path: str = None) -> str:
+    """
+    Convert PPTX file to PDF through an already-running unoserver daemon
+
+    Each call is a `unoconvert` RPC into a warm LibreOffice instance, so no soffice
+    startup is paid per report.
+
+    Args:
+        pptx_path: Path to input PPTX file
+        pdf_path: Optional output PDF path (defaults to same name with .pdf extension)
+
+    Returns:
+        str: Path to generated PDF file
+
+    Raises:
+        Exception: If conversion fails
+    """
+    pptx_path = Path(pptx_path).resolve()
+    if not pptx_path.exists():
+        raise FileNotFoundError(f"PPTX file not found: {pptx_path}")
+
+    pdf_path = pptx_path.with_suffix('.pdf') if pdf_path is None else Path(pdf_path).resolve()
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+
+    ports = _get_unoserver_ports()
+    port = await ports.get()
+    try:
+        print(f"📄 Converting PPTX to PDF (unoserver :{port})...")
+        process = await asyncio.create_subprocess_exec(
+            'unoconvert',
+            '--host', get_settings().unoserver_host,
+            '--port', str(port),
+            '--convert-to', 'pdf',
+            str(pptx_path), str(pdf_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+    except FileNotFoundError:
+        raise Exception("unoconvert not found. Install with: pip install unoserver")
+    finally:
+        ports.put_nowait(port)
+
+    if process.returncode != 0 or not pdf_path.exists():
+        raise Exception(f"PDF conversion failed: {stderr.decode(errors='replace').strip()}")
+
+    print(f"   ✅ PDF created successfully: {pdf_path.name}")
+    return str(pdf_path)
+
+
+# Concurrent PowerPoint conversions - more than a few just queue up inside Office
+PPT_CONCURRENCY = 3
+
+
+def _init_com_thread():
+    """ThreadPoolExecutor initializer: enter a COM apartment once per conversion thread"""
+    try:
+        import comtypes
+        comtypes.CoInitialize()
+    except ImportError:
+        pass  # Reported by convert_pptx_to_pdf
+
+
+# Dedicated, bounded threads (not the shared default executor) - each keeps its warm
+# PowerPoint handle from powerpoint_pool across calls
+_ppt_executor = ThreadPoolExecutor(max_workers=PPT_CONCURRENCY, thread_name_prefix="pptx",
+                                   initializer=_init_com_thread)
+_ppt_semaphore = asyncio.Semaphore(PPT_CONCURRENCY)
+
+
+# ============================================================================
+# SOFFICE (headless LibreOffice fallback - Linux/servers without unoserver)
+# ============================================================================
+
+# Free LibreOffice profile slots - soffice serializes on its user-profile lock, so each
+# concurrent conversion gets its own profile dir (reused, so profile init is paid once per slot)
+_soffice_slots: Optional[asyncio.Queue] = None
+
+
+def _get_soffice_slots() -> asyncio.Queue:
+    """Lazily build the free-slot queue (must be created on the running event loop)"""
+    global _soffice_slots
+    if _soffice_slots is None:
+        _soffice_slots = asyncio.Queue()
+        for slot in range(PPT_CONCURRENCY):
+            _soffice_slots.put_nowait(slot)
+    return _soffice_slots
+
+
+async def convert_pptx_to_pdf_soffice(pptx_path: str, pdf_path: str = None) -> str:
+    """
+    Convert PPTX file to PDF with a headless `soffice --convert-to pdf` run
+
+    Args:
+        pptx_path: Path to input PPTX file
+        pdf_path: Optional output PDF path (defaults to same name with .pdf extension)
+
+    Returns:
+        str: Path to generated PDF file
+
+    Raises:
+        Exception: If conversion fails
+    """
+    pptx_path = Path(pptx_path).resolve()
+    if not pptx_path.exists():
+        raise FileNotFoundError(f"PPTX file not found: {pptx_path}")
+
+    pdf_path = pptx_path.with_suffix('.pdf') if pdf_path is None else Path(pdf_path).resolve()
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+
+    slots = _get_soffice_slots()
+    slot = await slots.get()
+    try:
+        profile_dir = Path(tempfile.gettempdir()) / f"lo_profile_{os.getpid()}_{slot}"
+        print(f"📄 Converting PPTX to PDF (soffice)...")
+        process = await asyncio.create_subprocess_exec(
+            'soffice', '--headless', f'-env:UserInstallation={profile_dir.as_uri()}',
+            '--convert-to', 'pdf', '--outdir', str(pdf_path.parent), str(pptx_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+    except FileNotFoundError:
+        raise Exception("soffice not found. Install LibreOffice for PDF conversion on this platform")
+    finally:
+        slots.put_nowait(slot)
+
+    # soffice always names the output after the input
+    produced = pdf_path.parent / f"{pptx_path.stem}.pdf"
+    if process.returncode != 0 or not produced.exists():
+        raise Exception(f"PDF conversion failed: {stderr.decode(errors='replace').strip()}")
+    if produced != pdf_path:
+        produced.replace(pdf_path)
+
+    print(f"   ✅ PDF created successfully: {pdf_path.name}")
+    return str(pdf_path)
+
+
 async def convert_pptx_to_pdf_async(pptx_path: str, pdf_path: str = None) -> str:
     """
     Async wrapper for convert_pptx_to_pdf
 
+    Uses the unoserver daemons when UNOSERVER_PORTS is configured, otherwise
+    PowerPoint COM automation in a worker thread (Windows) or headless soffice.
+
     Args:
         pptx_path: Path to input PPTX file
         pdf_path: Optional output PDF path
@@ -92,15 +321,45 @@ async def convert_pptx_to_pdf_async(pptx_path: str, pdf_path: str = None) -> str
     Returns:
         str: Path to generated PDF file
     """
-    import asyncio
-
-    # Run synchronous conversion in thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        convert_pptx_to_pdf,
-        pptx_path,
-        pdf_path
+    if _configured_unoserver_ports():
+        return await convert_pptx_to_pdf_unoserver(pptx_path, pdf_path)
+
+    if sys.platform != 'win32':
+        return await convert_pptx_to_pdf_soffice(pptx_path, pdf_path)
+
+    # Run synchronous conversion on the dedicated COM threads to avoid blocking
+    async with _ppt_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _ppt_executor,
+            convert_pptx_to_pdf,
+            pptx_path,
+            pdf_path
+        )
+
+
+# ============================================================================
+# BATCH CONVERSION
+# ============================================================================
+
+async def convert_many_pptx_to_pdf_async(pairs: List[Tuple[str, Optional[str]]]) -> List[Union[str, Exception]]:
+    """
+    Convert several PPTX files to PDF concurrently
+
+    Each conversion goes through convert_pptx_to_pdf_async, so the batch is spread across
+    the unoserver daemons, the soffice profile slots, or the warm PowerPoint threads
+    (bounded by PPT_CONCURRENCY) - PowerPoint is a single-instance server, so extra
+    processes would only contend for the same instance.
+
+    Args:
+        pairs: (pptx_path, pdf_path) tuples - pdf_path may be None
+
+    Returns:
+        list: PDF path for each pair, or the Exception if that conversion failed
+    """
+    return await asyncio.gather(
+        *(convert_pptx_to_pdf_async(pptx, pdf) for pptx, pdf in pairs),
+        return_exceptions=True
     )
 
 
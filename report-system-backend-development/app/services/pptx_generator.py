@@ -5,14 +5,41 @@ Generates professional PowerPoint reports matching NENGIFTOM format.
 Based on the working POC from python-poc/generate_slide1_fixed.py
 """
 
+import matplotlib
+matplotlib.use("Agg")  # Required for non-GUI environments (before pyplot is imported)
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 from pptx.oxml.xmlchemy import OxmlElement
-from typing import List, Dict, Any
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+from typing import List, Dict, Any, Optional
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import Counter
+from copy import deepcopy
+from functools import lru_cache
+import asyncio
+import io
+import logging
 import os
+import tempfile
+import zipfile
+
+from app.config import get_settings
+from app.utils.worker_logging import init_worker_logging
+from .map_generator import categorize_incident
+
+# Child of the "report" logger configured in app/main.py
+log = logging.getLogger("report.pptx")
 
 # Brand colors
 COLORS = {
@@ -37,8 +64,6 @@ def format_date_ordinal(date_input) -> str:
     Args:
         date_input: Can be a datetime object or a string in DD-MM-YYYY format
     """
-    from datetime import datetime
-
     # Handle datetime objects directly
     if hasattr(date_input, 'strftime'):
         date_obj = date_input
@@ -62,6 +87,98 @@ def format_date_ordinal(date_input) -> str:
     return f"{day}{suffix} of {month}, {year}"
 
 
+# Layout constants shared by every report (EMU values computed once at import)
+_SLIDE_WIDTH = Inches(13.333)  # 16:9
+_SLIDE_HEIGHT = Inches(7.5)
+_LOGO_TOP_LEFT = (Inches(0.5), Inches(0.2), Inches(0.92), Inches(0.92))
+_LOGO_TOP_RIGHT = (Inches(11.913), Inches(0.2), Inches(0.92), Inches(0.92))
+_LOGO_CORNER = (Inches(12.5), Inches(0.3), Inches(0.8), Inches(0.8))
+_CHART_TITLE_POS = (Inches(0.5), Inches(0.3), Inches(10), Inches(0.6))
+_TABLE_ROW_HEIGHT = Inches(0.73)
+_INCIDENT_COL_WIDTHS = (
+    Inches(0.7),  # S/N
+    Inches(2.5),  # Incident Points
+    Inches(3.8),  # Date/Coordinates
+    Inches(0.8),  # N/O
+    Inches(5),    # Description
+)
+_PERSONNEL_COL_WIDTHS = (Inches(3.333),) * 3
+_PERSONNEL_ROW_HEIGHTS = (Inches(0.7), Inches(1.0))
+_PT_14 = Pt(14)
+_PT_16 = Pt(16)
+_PT_18 = Pt(18)
+_PT_24 = Pt(24)
+_PT_28 = Pt(28)
+
+
+# Prebuilt bullet element, cloned onto each bulleted paragraph
+BULLET_CHAR = OxmlElement('a:buChar')
+BULLET_CHAR.set('char', '•')  # Unicode bullet character
+
+
+# Executive summary paragraph: bold company run + plain body run (body text filled per report)
+_EXEC_SUMMARY_P = parse_xml(
+    f'<a:p {nsdecls("a")}>'
+    f'<a:r><a:rPr sz="1800" b="1"><a:solidFill><a:srgbClr val="000000"/></a:solidFill>'
+    f'<a:latin typeface="Arial"/></a:rPr><a:t>NENGIFTOM Limited</a:t></a:r>'
+    f'<a:r><a:rPr sz="1800"><a:solidFill><a:srgbClr val="000000"/></a:solidFill>'
+    f'<a:latin typeface="Arial"/></a:rPr><a:t/></a:r>'
+    f'</a:p>'
+)
+
+# Media that is already compressed (PNG/JPEG maps, photos, charts) is stored as-is in the
+# package zip - deflating it again costs CPU for no size gain. XML parts keep the default deflate.
+_STORED_MEDIA_EXTS = frozenset({'png', 'jpg', 'jpeg', 'gif'})
+
+
+class _ReportZipWriter(_ZipPkgWriter):
+    """OPC zip writer that picks the compression per part"""
+
+    def write(self, pack_uri, blob):
+        compress_type = zipfile.ZIP_STORED if pack_uri.ext.lower() in _STORED_MEDIA_EXTS else zipfile.ZIP_DEFLATED
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=compress_type)
+
+
+class _ReportPackageWriter(PackageWriter):
+    """PackageWriter using _ReportZipWriter (python-pptx hardcodes its zip writer)"""
+
+    def _write(self):
+        with _ReportZipWriter(self._pkg_file) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+
+_ALIGN_XML = {PP_ALIGN.LEFT: 'l', PP_ALIGN.CENTER: 'ctr'}
+
+
+@lru_cache(maxsize=32)
+def _cell_style_parts(fill_rgb: RGBColor, font_size_pt: int, bold: bool, align,
+                      color: RGBColor, word_wrap: bool) -> tuple:
+    """Parsed (bodyPr, pPr, tcPr) templates for one table-cell style, cloned onto each cell"""
+    wrap = ' wrap="square"' if word_wrap else ''
+    b = ' b="1"' if bold else ''
+    body_pr = parse_xml(f'<a:bodyPr {nsdecls("a")} anchor="ctr"{wrap}/>')
+    p_pr = parse_xml(
+        f'<a:pPr {nsdecls("a")} algn="{_ALIGN_XML[align]}">'
+        f'<a:defRPr sz="{font_size_pt * 100}"{b}>'
+        f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+        f'<a:latin typeface="Arial"/>'
+        f'</a:defRPr></a:pPr>'
+    )
+    tc_pr = parse_xml(
+        f'<a:tcPr {nsdecls("a")}><a:solidFill><a:srgbClr val="{fill_rgb}"/></a:solidFill></a:tcPr>'
+    )
+    return body_pr, p_pr, tc_pr
+
+
+@lru_cache(maxsize=8)
+def _bullet_indent_attrs(indent_space_inches: float) -> tuple:
+    """(marL, indent) attribute strings for a hanging bullet indent - 1 inch = 914400 EMUs"""
+    indent_emu = int(indent_space_inches * 914400)
+    return str(indent_emu), str(-indent_emu)
+
+
 class PPTXGenerator:
     """PPTX Report Generator"""
 
@@ -91,12 +208,34 @@ class PPTXGenerator:
         self.satellite_thumbnails = satellite_thumbnails or []
         self.incident_legend_map = incident_legend_map
 
+        # Per-report strings used across several slides - derived once
+        inspection_date = self.project['inspectionDate']
+        self._formatted_date = format_date_ordinal(inspection_date)
+        self._date_short = inspection_date.strftime('%d-%m-%Y') if hasattr(inspection_date, 'strftime') else str(inspection_date)
+        self._n_incidents = len(self.incidents)
+        self._summary_run2 = f" conducted a Remotely Piloted Aircraft System (RPAS) inspection of the {self.project['routeInspected']} Right of Way (RoW) on {self._formatted_date}. The total length of the inspected pipeline was {self.project['pipelineLengthKm']}km, and {self._n_incidents} incident(s) were observed."
+
+        # Input images checked once (not per slide)
+        self._overview_exists = bool(overview_map_path) and os.path.exists(overview_map_path)
+        self._legend_exists = bool(incident_legend_map) and os.path.exists(incident_legend_map)
+        self._satellite_map_exists = [bool(p) and os.path.exists(p) for p in self.satellite_overview_map]
+
         # Logo paths (relative to backend)
         # logo_dir = Path(__file__).parent.parent / "assets" / "logos"
         logo_dir = Path(__file__).resolve()      # current file path
         logo_dir = logo_dir.parents[4] / "assets" / "logos"
         self.logos = str(logo_dir / "logo.png")
 
+        # Logo bytes read once - every slide places the same image (see _add_logo)
+        try:
+            with open(self.logos, 'rb') as f:
+                self._logo_blob = f.read()
+        except FileNotFoundError:
+            self._logo_blob = None
+        self._logo_exists = self._logo_blob is not None
+        self._logo_part = None  # Deck's single logo ImagePart, created in generate()
+        self._watermark_alpha = None  # Prebuilt <a:alphaModFix>, cloned onto each watermark
+
     def generate(self, output_path: str) -> str:
         """
         Generate complete PPTX report
@@ -107,14 +246,19 @@ class PPTXGenerator:
         print(f"🎯 Generating PPTX report...")
 
         prs = Presentation()
-        prs.slide_width = Inches(13.333)  # 16:9
-        prs.slide_height = Inches(7.5)
+        prs.slide_width = _SLIDE_WIDTH  # 16:9
+        prs.slide_height = _SLIDE_HEIGHT
 
         # Set metadata
         prs.core_properties.author = "NENGIFTOM Limited"
         prs.core_properties.title = f"{self.project['projectName']} - Daily Activity Report"
         prs.core_properties.subject = "RPAS Inspection Report"
 
+        # One logo image part for the whole deck: add_picture would re-read, re-hash and
+        # re-scan the package for the logo on every slide
+        if self._logo_blob is not None:
+            self._logo_part = prs.part.package.get_or_add_image_part(io.BytesIO(self._logo_blob))
+
         # Generate slides
         self._generate_slide1_title(prs)
         self._generate_slide2_executive_summary(prs)
@@ -125,20 +269,34 @@ class PPTXGenerator:
         self._generate_analytics_slides(prs)  # NEW: Analytics slides with charts
         # self._generate_slide5_plus_incident_details(prs)  # Now becomes slides 6+
 
-        # Save
+        # Save - serialize in memory (media stored, XML deflated), then one write to disk
+        package = prs.part.package
+        buf = io.BytesIO()
+        _ReportPackageWriter.write(buf, package._rels, tuple(package.iter_parts()))
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        prs.save(output_path)
+        with open(output_path, 'wb') as f:
+            f.write(buf.getbuffer())
 
         print(f"✅ PPTX saved: {output_path}")
         print(f"   - {len(prs.slides)} slides generated")
-        print(f"   - {len(self.incidents)} incidents included")
+        print(f"   - {self._n_incidents} incidents included")
 
         return output_path
 
 
+    def _add_logo(self, slide, left, top, width, height):
+        """Place the logo on a slide, relating the slide to the deck's shared logo image part"""
+        if self._logo_part is None:
+            raise FileNotFoundError(f"Logo not found: {self.logos}")
+        shapes = slide.shapes
+        rId = slide.part.relate_to(self._logo_part, RT.IMAGE)
+        pic = shapes._add_pic_from_image_part(self._logo_part, rId, left, top, width, height)
+        shapes._recalculate_extents()
+        return shapes._shape_factory(pic)
+
     def _add_central_watermark(self, slide):
         """Adds the NENGIFTOM logo as a large, semi-transparent, central watermark."""
-        if os.path.exists(self.logos):
+        if self._logo_exists:
             watermark_width = Inches(6.0)
             watermark_height = Inches(6.0)
 
@@ -146,38 +304,28 @@ class PPTXGenerator:
             left = Inches(4.16)
             top = Inches(1.25)
 
-            pic = slide.shapes.add_picture(self.logos, left, top,
-                                          width=watermark_width, height=watermark_height)
+            pic = self._add_logo(slide, left, top, watermark_width, watermark_height)
 
             # Make it semi-transparent (10% opacity = 90% transparent)
             # amt value: 10000 = 10% opacity, 50000 = 50% opacity, 100000 = 100% opacity
             try:
-                # Access the picture's element
-                pic_element = pic._element
-
-                # Define namespaces
-                ns = {
-                    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
-                    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'
-                }
-
-                # Find the blip element (the actual image reference)
-                blip = pic_element.find('.//a:blip', namespaces=ns)
+                # Find the blip element (the actual image reference) - always p:pic/p:blipFill/a:blip,
+                # so two direct child lookups instead of a descendant search
+                blip_fill = pic._element.find(qn('p:blipFill'))
+                blip = blip_fill.find(qn('a:blip')) if blip_fill is not None else None
 
                 if blip is not None:
-                    # Create alpha modulation element using OxmlElement
-                    # This sets the transparency level
-                    alpha_mod = OxmlElement('a:alphaModFix')
-                    alpha_mod.set('amt', '10000')  # 10% opacity = 90% transparent
-                    blip.append(alpha_mod)
-                    print("✅ Watermark transparency applied (10% opacity)")
+                    # Alpha modulation element sets the transparency level - built once, cloned per slide
+                    if self._watermark_alpha is None:
+                        self._watermark_alpha = OxmlElement('a:alphaModFix')
+                        self._watermark_alpha.set('amt', '10000')  # 10% opacity = 90% transparent
+                    blip.append(deepcopy(self._watermark_alpha))
+                    log.debug("✅ Watermark transparency applied (10% opacity)")
                 else:
-                    print("⚠️ Could not find blip element for transparency")
+                    log.warning("⚠️ Could not find blip element for transparency")
 
-            except Exception as e:
-                print(f"⚠️ Warning: Could not add watermark transparency: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                log.exception("⚠️ Warning: Could not add watermark transparency")
                 # Continue without transparency if it fails
 
     def _add_bullet_to_paragraph(self, paragraph, indent_space_inches=0.35):
@@ -191,35 +339,53 @@ class PPTXGenerator:
             paragraph: The paragraph object to add bullet formatting to
             indent_space_inches: Space between bullet and text in inches (default: 0.35")
         """
-        try:
-            # Get the paragraph's XML element
-            p_element = paragraph._element
+        # Get or create paragraph properties (pPr) - kept, since it already carries the
+        # paragraph's line spacing / space-after / font defaults
+        pPr = paragraph._element.get_or_add_pPr()
 
-            # Get or create paragraph properties (pPr)
-            pPr = p_element.get_or_add_pPr()
+        # Set marL (margin left) and indent attributes
+        # marL: Total left margin for the paragraph
+        # indent: Negative value creates hanging indent (space between bullet and text)
+        margin_attr, indent_attr = _bullet_indent_attrs(indent_space_inches)
+        pPr.set('marL', margin_attr)
+        pPr.set('indent', indent_attr)  # Negative creates the gap
 
-            # Convert inches to EMUs (English Metric Units)
-            # 1 inch = 914400 EMUs
-            indent_emu = int(indent_space_inches * 914400)
-            margin_emu = indent_emu  # Margin left for bullet position
+        # Add bullet character (clone of the prebuilt <a:buChar>)
+        pPr.append(deepcopy(BULLET_CHAR))
 
-            # Set marL (margin left) and indent attributes
-            # marL: Total left margin for the paragraph
-            # indent: Negative value creates hanging indent (space between bullet and text)
-            pPr.set('marL', str(margin_emu))
-            pPr.set('indent', str(-indent_emu))  # Negative creates the gap
+    def _size_table(self, graphic_frame, col_widths=None, row_heights=None):
+        """
+        Set column widths / row heights directly on the table XML in one pass.
 
-            # Add bullet character
-            buChar = OxmlElement('a:buChar')
-            buChar.set('char', '•')  # Unicode bullet character
-            pPr.append(buChar)
+        python-pptx's per-column/per-row setters re-sum the whole grid and resize
+        the frame on every assignment; here the frame is resized once at the end.
+        """
+        tbl = graphic_frame.table._tbl
+        if col_widths is not None:
+            for gridCol, width in zip(tbl.tblGrid.gridCol_lst, col_widths):
+                gridCol.set('w', str(width))
+            graphic_frame.width = Emu(sum(col_widths))
+        if row_heights is not None:
+            for tr, height in zip(tbl.tr_lst, row_heights):
+                tr.set('h', str(height))
+            graphic_frame.height = Emu(sum(row_heights))
+
+    def _style_cell(self, cell, text, fill_rgb, font_size_pt, bold=False, align=PP_ALIGN.LEFT,
+                    color=COLORS['BLACK'], word_wrap=False):
+        """
+        Set a table cell's text, fill and first-paragraph font in one go.
 
-            print(f"✅ Bullet indent set: {indent_space_inches}\" (marL={margin_emu}, indent={-indent_emu})")
+        The style XML is parsed once per distinct style and cloned onto each
+        cell, instead of a dozen python-pptx property writes per cell.
+        """
+        cell.text = text
+        body_pr, p_pr, tc_pr = _cell_style_parts(fill_rgb, font_size_pt, bold, align, color, word_wrap)
 
-        except Exception as e:
-            print(f"⚠️ Warning: Could not add bullet formatting: {e}")
-            import traceback
-            traceback.print_exc()
+        tc = cell._tc
+        txBody = tc.txBody
+        txBody.replace(txBody.bodyPr, deepcopy(body_pr))
+        txBody.p_lst[0].insert(0, deepcopy(p_pr))
+        tc.replace(tc.get_or_add_tcPr(), deepcopy(tc_pr))
 
     def _generate_slide1_title(self, prs):
         """Slide 1: Title Slide"""
@@ -227,14 +393,12 @@ class PPTXGenerator:
         self._add_central_watermark(slide)
         # Logos
 
-        slide.shapes.add_picture(self.logos, Inches(0.5), Inches(0.2),
-                                width=Inches(0.92), height=Inches(0.92))
+        self._add_logo(slide, *_LOGO_TOP_LEFT)
 
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(11.913), Inches(0.2),
-                                    width=Inches(0.92), height=Inches(0.92))
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_TOP_RIGHT)
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0), Inches(0.7), Inches(13.333), Inches(0.7))
+        title_box = slide.shapes.add_textbox(Inches(0), Inches(0.7), _SLIDE_WIDTH, Inches(0.7))
         title_frame = title_box.text_frame
         title_frame.text = "Daily Activity Report"
         title_frame.word_wrap = True
@@ -248,14 +412,14 @@ class PPTXGenerator:
         p.alignment = PP_ALIGN.CENTER
 
         # Subtitle
-        subtitle_box = slide.shapes.add_textbox(Inches(0), Inches(1.9), Inches(13.333), Inches(0.5))
+        subtitle_box = slide.shapes.add_textbox(Inches(0), Inches(1.9), _SLIDE_WIDTH, Inches(0.5))
         subtitle_frame = subtitle_box.text_frame
         subtitle_frame.text = "Project Information"
         subtitle_frame.word_wrap = True
         subtitle_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
 
         p = subtitle_frame.paragraphs[0]
-        p.font.size = Pt(28)
+        p.font.size = _PT_28
         p.font.bold = True
         p.font.name = 'Arial'
         p.font.color.rgb = COLORS['BROWN']
@@ -263,13 +427,10 @@ class PPTXGenerator:
 
         # Project details
         # Format date for display
-        inspection_date = self.project['inspectionDate']
-        date_display = inspection_date.strftime('%d-%m-%Y') if hasattr(inspection_date, 'strftime') else str(inspection_date)
-
         details_text = f"""Project Name: {self.project['projectName']}
 Base Location: {self.project['baseLocation']}
 Route Inspected: {self.project['routeInspected']}
-Date: {date_display}"""
+Date: {self._date_short}"""
 
         details_box = slide.shapes.add_textbox(Inches(1.667), Inches(2.4), Inches(10), Inches(1.5))
         details_frame = details_box.text_frame
@@ -287,34 +448,17 @@ Date: {date_display}"""
         # Personnel table (FIXED positioning)
         table_top = Inches(5.4)
         table_height = Inches(1.7)
-        table = slide.shapes.add_table(2, 3, Inches(1.667), table_top, Inches(12), table_height).table
+        table_frame = slide.shapes.add_table(2, 3, Inches(1.667), table_top, Inches(12), table_height)
+        table = table_frame.table
 
-        # Column widths
-        for col_idx in range(3):
-            table.columns[col_idx].width = Inches(3.333)
-
-        # Row heights
-        table.rows[0].height = Inches(0.7)
-        table.rows[1].height = Inches(1.0)
+        # Column widths / row heights
+        self._size_table(table_frame, _PERSONNEL_COL_WIDTHS, _PERSONNEL_ROW_HEIGHTS)
 
         # Header row
         headers = ['Prepared by', 'Checked by', 'Approved by']
         for col_idx, header in enumerate(headers):
-            cell = table.rows[0].cells[col_idx]
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = COLORS['ORANGE']
-
-            p = cell.text_frame.paragraphs[0]
-            p.font.size = Pt(18)
-            p.font.bold = True
-            p.font.name = 'Arial'
-            p.font.color.rgb = COLORS['WHITE']
-            p.alignment = PP_ALIGN.CENTER
-            cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-
-            cell.text_frame.margin_top = Inches(0.05)
-            cell.text_frame.margin_bottom = Inches(0.05)
+            self._style_cell(table.rows[0].cells[col_idx], header, COLORS['ORANGE'], 18,
+                             bold=True, align=PP_ALIGN.CENTER, color=COLORS['WHITE'])
 
         # Data row
         personnel = [
@@ -323,21 +467,8 @@ Date: {date_display}"""
             self.project['approvedBy']
         ]
         for col_idx, person in enumerate(personnel):
-            cell = table.rows[1].cells[col_idx]
-            cell.text = person
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = COLORS['CREAM']
-
-            p = cell.text_frame.paragraphs[0]
-            p.font.size = Pt(18)
-            p.font.name = 'Arial'
-            p.font.color.rgb = COLORS['BLACK']
-            p.alignment = PP_ALIGN.CENTER
-            cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-            cell.text_frame.word_wrap = True
-
-            cell.text_frame.margin_top = Inches(0.05)
-            cell.text_frame.margin_bottom = Inches(0.05)
+            self._style_cell(table.rows[1].cells[col_idx], person, COLORS['CREAM'], 18,
+                             align=PP_ALIGN.CENTER, word_wrap=True)
 
     def _generate_slide2_executive_summary(self, prs):
         """Slide 2: Executive Summary"""
@@ -356,35 +487,18 @@ Date: {date_display}"""
         p.font.color.rgb = COLORS['BROWN']
 
         # Logo
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(11.913), Inches(0.2),
-                                    width=Inches(0.92), height=Inches(0.92))
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_TOP_RIGHT)
 
         # Summary text with bold "NENGIFTOM Limited"
-        # Use formatted date
-        formatted_inspection_date = format_date_ordinal(self.project['inspectionDate'])
-
         summary_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(12), Inches(1.2))
         summary_frame = summary_box.text_frame
         summary_frame.word_wrap = True
 
-        # Clear default text and build with runs for mixed formatting
-        p = summary_frame.paragraphs[0]
-
-        # First run - "NENGIFTOM Limited" (bold)
-        run1 = p.add_run()
-        run1.text = "NENGIFTOM Limited"
-        run1.font.size = Pt(18)
-        run1.font.name = 'Arial'
-        run1.font.bold = True
-        run1.font.color.rgb = COLORS['BLACK']
-
-        # Second run - rest of the text (not bold)
-        run2 = p.add_run()
-        run2.text = f" conducted a Remotely Piloted Aircraft System (RPAS) inspection of the {self.project['routeInspected']} Right of Way (RoW) on {formatted_inspection_date}. The total length of the inspected pipeline was {self.project['pipelineLengthKm']}km, and {len(self.incidents)} incident(s) were observed."
-        run2.font.size = Pt(18)
-        run2.font.name = 'Arial'
-        run2.font.color.rgb = COLORS['BLACK']
+        # Replace the default paragraph with a clone of the prebuilt two-run paragraph
+        summary_p = deepcopy(_EXEC_SUMMARY_P)
+        summary_p.r_lst[1].text = self._summary_run2
+        summary_frame._txBody.replace(summary_frame.paragraphs[0]._p, summary_p)
 
        # Incident bullets
         if self.incidents:
@@ -406,7 +520,7 @@ Date: {date_display}"""
                 p.line_spacing = 1.4        # 1.4x line height (space between lines WITHIN paragraph)
                 p.space_after = Pt(12)      # 12 points space AFTER each bullet point
 
-                p.font.size = Pt(18)
+                p.font.size = _PT_18
                 p.font.name = 'Arial'
                 p.font.color.rgb = COLORS['BLACK']
 
@@ -418,65 +532,43 @@ Date: {date_display}"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_central_watermark(slide)
 
-        formatted_date = format_date_ordinal(self.project['inspectionDate'])
-
         # Title
         title_box = slide.shapes.add_textbox(Inches(0.2), Inches(0.5), Inches(11.5), Inches(0.75))
         title_frame = title_box.text_frame
-        title_frame.text = f"RPAS Activity and Tasking Report for {formatted_date}"
+        title_frame.text = f"RPAS Activity and Tasking Report for {self._formatted_date}"
         title_frame.word_wrap = True
 
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(24)
+        p.font.size = _PT_24
         p.font.bold = True
         p.font.name = 'Arial'
         p.font.color.rgb = COLORS['BROWN']
 
         # Logo
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(11.913), Inches(0.2),
-                                    width=Inches(0.92), height=Inches(0.92))
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_TOP_RIGHT)
 
         # Create table
-        rows = len(self.incidents) + 1
+        rows = self._n_incidents + 1
         cols = 5
-        table = slide.shapes.add_table(rows, cols, Inches(0.2), Inches(1.5),
-                                       Inches(12.8), Inches(5.5)).table
+        table_frame = slide.shapes.add_table(rows, cols, Inches(0.2), Inches(1.5),
+                                             Inches(12.8), Inches(5.5))
+        table = table_frame.table
 
-        # Column widths
-        table.columns[0].width = Inches(0.7)  # S/N
-        table.columns[1].width = Inches(2.5)    # Incident Points
-        table.columns[2].width = Inches(3.8)    # Date/Coordinates
-        table.columns[3].width = Inches(0.8)    # N/O
-        table.columns[4].width = Inches(5)  # Description
-
-        # Set row heights to 0.73 inches for all rows
-        for row in table.rows:
-            row.height = Inches(0.73)
+        # Column widths, and 0.73 inch row heights for all rows
+        self._size_table(table_frame, _INCIDENT_COL_WIDTHS, (_TABLE_ROW_HEIGHT,) * rows)
 
         # Header row
         headers = ['S/N', 'Incident Points', 'Date/Coordinates', 'N/O', 'Description']
         for col_idx, header in enumerate(headers):
-            cell = table.rows[0].cells[col_idx]
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = COLORS['ORANGE']
-
-            p = cell.text_frame.paragraphs[0]
-            p.font.size = Pt(18)
-            p.font.bold = True
-            p.font.name = 'Arial'
-            p.font.color.rgb = COLORS['WHITE']
-            p.alignment = PP_ALIGN.CENTER
-            cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+            self._style_cell(table.rows[0].cells[col_idx], header, COLORS['ORANGE'], 18,
+                             bold=True, align=PP_ALIGN.CENTER, color=COLORS['WHITE'])
 
         # Data rows
         for idx, incident in enumerate(self.incidents):
             row_color = COLORS['CREAM'] if idx % 2 == 0 else COLORS['LIGHTCREAM']
             coords = f"N{incident['latitude']}, E{incident['longitude']}"
-            # Format date for display
-            date_str = self.project['inspectionDate'].strftime('%d-%m-%Y') if hasattr(self.project['inspectionDate'], 'strftime') else str(self.project['inspectionDate'])
-            date_coords = f"{date_str}/{coords}"
+            date_coords = f"{self._date_short}/{coords}"
 
             row_data = [
                 str(idx + 1),
@@ -486,46 +578,34 @@ Date: {date_display}"""
                 incident['description']
             ]
 
+            cells = table.rows[idx + 1].cells
             for col_idx, data in enumerate(row_data):
-                cell = table.rows[idx + 1].cells[col_idx]
-                cell.text = data
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = row_color
-
-                p = cell.text_frame.paragraphs[0]
-                p.font.size = Pt(16)
-                p.font.name = 'Arial'
-                p.font.color.rgb = COLORS['BLACK']
-                p.alignment = PP_ALIGN.CENTER if col_idx in [0, 3] else PP_ALIGN.LEFT
-                cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-                cell.text_frame.word_wrap = True
+                align = PP_ALIGN.CENTER if col_idx in [0, 3] else PP_ALIGN.LEFT
+                self._style_cell(cells[col_idx], data, row_color, 16, align=align, word_wrap=True)
 
     def _generate_slide4_map_summary(self, prs):
         """Slide 4: Map with Summary Data"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         # self._add_central_watermark(slide)
 
-        formatted_date = format_date_ordinal(self.project['inspectionDate'])
-
         # Title
         title_box = slide.shapes.add_textbox(Inches(0.2), Inches(0.2), Inches(8.01), Inches(0.75))
         title_frame = title_box.text_frame
-        title_frame.text = f"RPAS Activity and Tasking Report for {formatted_date} Map"
+        title_frame.text = f"RPAS Activity and Tasking Report for {self._formatted_date} Map"
         title_frame.word_wrap = True
 
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(18)
+        p.font.size = _PT_18
         p.font.bold = True
         p.font.name = 'Arial'
         p.font.color.rgb = COLORS['BROWN']
 
         # Logo
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(11.913), Inches(0.2),
-                                    width=Inches(0.92), height=Inches(0.92))
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_TOP_RIGHT)
 
         # Map (left side)
-        if self.overview_map_path and os.path.exists(self.overview_map_path):
+        if self._overview_exists:
             slide.shapes.add_picture(self.overview_map_path, Inches(0.2), Inches(1.3),
                                     width=Inches(8.01), height=Inches(5.95))
         else:
@@ -534,14 +614,14 @@ Date: {date_display}"""
             pf = placeholder.text_frame
             pf.text = "[Map will be generated]"
             p = pf.paragraphs[0]
-            p.font.size = Pt(24)
+            p.font.size = _PT_24
             p.font.name = 'Arial'
             p.font.color.rgb = COLORS['BROWN']
             p.alignment = PP_ALIGN.CENTER
             pf.vertical_anchor = MSO_ANCHOR.MIDDLE
 
         # Incident legend (right side) - replaces summary table
-        if self.incident_legend_map and os.path.exists(self.incident_legend_map):
+        if self._legend_exists:
             # Legend is 7.2" x 14" (aspect ratio 1:1.944)
             # To maintain aspect ratio: if height = 5.95", then width = 3.06"
             # Center it horizontally in the available space
@@ -557,7 +637,7 @@ Date: {date_display}"""
             pf = placeholder.text_frame
             pf.text = "[Legend will be generated]"
             p = pf.paragraphs[0]
-            p.font.size = Pt(14)
+            p.font.size = _PT_14
             p.font.name = 'Arial'
             p.font.color.rgb = COLORS['BROWN']
             p.alignment = PP_ALIGN.CENTER
@@ -569,108 +649,69 @@ Date: {date_display}"""
         self._add_central_watermark(slide)
 
         # Title
-        formatted_date = format_date_ordinal(self.project['inspectionDate'])
-        title_text = f"RPAS Activity and Tasking Report for {formatted_date} Summary"
+        title_text = f"RPAS Activity and Tasking Report for {self._formatted_date} Summary"
 
         title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(10), Inches(0.6))
         title_frame = title_box.text_frame
         title_frame.text = title_text
 
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(24)
+        p.font.size = _PT_24
         p.font.bold = True
         p.font.name = 'Arial'
         p.font.color.rgb = COLORS['BROWN']
 
         # Logo
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(11.913), Inches(0.2),
-                                    width=Inches(0.92), height=Inches(0.92))
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_TOP_RIGHT)
 
         # Summary table (centered)
-        inspection_date = self.project['inspectionDate']
-        if hasattr(inspection_date, 'strftime'):
-            date_str = inspection_date.strftime('%d-%m-%Y')
-        else:
-            date_str = str(inspection_date)
-
         table_data = [
             ["Summary Data", "", COLORS['ORANGE'], True],
-            ["Date", date_str, COLORS['ORANGE'], False],
+            ["Date", self._date_short, COLORS['ORANGE'], False],
             ["Pipeline RoW Inspected", self.project['routeInspected'], COLORS['ORANGE'], False],
-            ["No. of Incident Points Identified", str(len(self.incidents)), COLORS['ORANGE'], False],
+            ["No. of Incident Points Identified", str(self._n_incidents), COLORS['ORANGE'], False],
             ["Closest Flow stations", self.project['closestFlowStation'], COLORS['ORANGE'], False],
             ["Length of Inspected Pipeline", f"{self.project['pipelineLengthKm']}km", COLORS['ORANGE'], False],
         ]
 
         # Center the table
-        table = slide.shapes.add_table(6, 2, Inches(3), Inches(2),
-                                       Inches(7.5), Inches(4.38)).table
+        table_frame = slide.shapes.add_table(6, 2, Inches(3), Inches(2),
+                                             Inches(7.5), Inches(4.38))
+        table = table_frame.table
 
         # Set row heights
-        for row in table.rows:
-            row.height = Inches(0.73)
+        self._size_table(table_frame, row_heights=(_TABLE_ROW_HEIGHT,) * 6)
 
         for row_idx, (label, value, header_color, is_title) in enumerate(table_data):
+            cells = table.rows[row_idx].cells
             if is_title:
-                cell = table.rows[row_idx].cells[0]
-                cell.text = label
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = header_color
-                cell.merge(table.rows[row_idx].cells[1])
-
-                p = cell.text_frame.paragraphs[0]
-                p.font.size = Pt(16)
-                p.font.bold = True
-                p.font.name = 'Arial'
-                p.font.color.rgb = COLORS['WHITE']
-                p.alignment = PP_ALIGN.CENTER
-                cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+                self._style_cell(cells[0], label, header_color, 16,
+                                 bold=True, align=PP_ALIGN.CENTER, color=COLORS['WHITE'])
+                cells[0].merge(cells[1])
             else:
                 # Label cell
-                label_cell = table.rows[row_idx].cells[0]
-                label_cell.text = label
-                label_cell.fill.solid()
-                label_cell.fill.fore_color.rgb = header_color
-
-                p = label_cell.text_frame.paragraphs[0]
-                p.font.size = Pt(14)
-                p.font.bold = True
-                p.font.name = 'Arial'
-                p.font.color.rgb = COLORS['WHITE']
-                p.alignment = PP_ALIGN.LEFT
-                label_cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+                self._style_cell(cells[0], label, header_color, 14, bold=True, color=COLORS['WHITE'])
 
                 # Value cell
                 value_color = COLORS['CREAM'] if (row_idx - 1) % 2 == 0 else COLORS['LIGHTCREAM']
-                value_cell = table.rows[row_idx].cells[1]
-                value_cell.text = value
-                value_cell.fill.solid()
-                value_cell.fill.fore_color.rgb = value_color
-
-                p = value_cell.text_frame.paragraphs[0]
-                p.font.size = Pt(14)
-                p.font.name = 'Arial'
-                p.font.color.rgb = COLORS['BLACK']
-                p.alignment = PP_ALIGN.LEFT
-                value_cell.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-                value_cell.text_frame.word_wrap = True
+                self._style_cell(cells[1], value, value_color, 14, word_wrap=True)
 
     def _generate_slide5_satellite_imagery_map(self, prs):
         """Slide 5+: Satellite Imagery Overview with Annotated Incident Images"""
 
         # Loop through each composite map (map already contains annotated images and connector lines)
-        for map_idx, map_path in enumerate(self.satellite_overview_map):
-            print(f"🛰️ Generating slide for composite map {map_idx + 1}: {map_path}")
+        for map_idx, (map_path, map_exists) in enumerate(zip(self.satellite_overview_map,
+                                                             self._satellite_map_exists)):
+            log.debug("🛰️ Generating slide for composite map %s: %s", map_idx + 1, map_path)
 
             slide = prs.slides.add_slide(prs.slide_layouts[6])
             self._add_central_watermark(slide)
 
             # Title
-            formatted_date = format_date_ordinal(self.project['inspectionDate'])
-            title_text = f"RPAS Activity and Tasking Report for {formatted_date}"
+            title_text = f"RPAS Activity and Tasking Report for {self._formatted_date}"
 
-            title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(10), Inches(0.6))
+            title_box = slide.shapes.add_textbox(*_CHART_TITLE_POS)
             title_frame = title_box.text_frame
             title_frame.text = title_text
 
@@ -681,43 +722,53 @@ Date: {date_display}"""
             p.font.color.rgb = COLORS['BROWN']
 
             # Logo
-            if os.path.exists(self.logos):
-                slide.shapes.add_picture(self.logos, Inches(12.5), Inches(0.3),
-                                        width=Inches(0.8), height=Inches(0.8))
+            if self._logo_exists:
+                self._add_logo(slide, *_LOGO_CORNER)
 
             # Add the composite image (already contains map + annotated images + connector lines)
-            if map_path and os.path.exists(map_path):
+            if map_exists:
                 # Center the composite image on the slide
                 slide.shapes.add_picture(map_path, Inches(0.3), Inches(1.2),
                                         width=Inches(12.7), height=Inches(5.9))
-                print(f"   ✅ Added composite satellite map with annotations and lines")
+                log.debug("   ✅ Added composite satellite map with annotations and lines")
             else:
-                print(f"   ⚠️ Warning: Composite map not found at {map_path}")
-
-    def _generate_analytics_slides(self, prs):
-        """Generate analytics slides with modern charts"""
-        import matplotlib
-        matplotlib.use("Agg")  # Required for non-GUI environments
-        import matplotlib.pyplot as plt
-        from collections import Counter
-        from .map_generator import categorize_incident
+                log.warning("   ⚠️ Warning: Composite map not found at %s", map_path)
+
+    def _analytics_chart_jobs(self):
+        """(render function, args) for each analytics chart, in slide order"""
+        # Single pass over the incidents; categorize_incident is memoized per description
+        rows = [
+            (
+                categorize_incident(incident.get('description', '')),
+                incident.get("severity", "Unknown"),
+                incident.get("status", "Unknown"),
+            )
+            for incident in self.incidents
+        ]
 
-        print("📊 Generating analytics slides...")
+        # Count categories, with each category's color from the categorizer
+        category_counts = Counter(cat["name"] for cat, _, _ in rows)
+        color_by_name = {cat["name"]: cat["color"] for cat, _, _ in rows}
+        labels = list(category_counts.keys())
+        values = list(category_counts.values())
+        category_colors = [color_by_name[name] for name in labels]
 
-        categories = []
-        severities = []
-        statuses = []
+        severity_counts = list(Counter(row[1] for row in rows).items())
+        status_counts = list(Counter(row[2] for row in rows).items())
 
-        for incident in self.incidents:
-            desc = incident.get('description', '')
-            cat = categorize_incident(desc)
-            categories.append(cat["name"])
+        return [
+            (_render_category_chart, (labels, values, category_colors)),
+            (_render_severity_status_chart, (severity_counts, status_counts)),
+        ]
 
-            severities.append(incident.get("severity", "Unknown"))
-            statuses.append(incident.get("status", "Unknown"))
+    def _generate_analytics_slides(self, prs):
+        """Generate analytics slides with modern charts"""
+        print("📊 Generating analytics slides...")
 
-        self._create_category_chart_slide(prs, categories)
-        self._create_severity_status_slide(prs, severities, statuses)
+        # Rendered in-process: the deck is already built in a report worker process
+        category_png, severity_status_png = [func(*args) for func, args in self._analytics_chart_jobs()]
+        self._create_category_chart_slide(prs, category_png)
+        self._create_severity_status_slide(prs, severity_status_png)
 
         print("✅ Analytics slides generated")
 
@@ -726,127 +777,42 @@ Date: {date_display}"""
     # 🔹 CATEGORY CHART SLIDE (MODERN DONUT + ROUNDED BAR CHART)
     # =====================================================================
 
-    def _create_category_chart_slide(self, prs, categories):
-        import matplotlib.pyplot as plt
-        from collections import Counter
-        import tempfile
-        import os
-        from .map_generator import categorize_incident
-
-        plt.style.use("fivethirtyeight")  # Modern clean theme
-
+    def _create_category_chart_slide(self, prs, chart_png):
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_central_watermark(slide)
 
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(10), Inches(0.6))
+        title_box = slide.shapes.add_textbox(*_CHART_TITLE_POS)
         title_frame = title_box.text_frame
         title_frame.text = "Incident Analytics: Distribution by Category"
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(16)
+        p.font.size = _PT_16
         p.font.bold = True
         p.font.color.rgb = COLORS['BROWN']
 
         # Logo
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(12.5), Inches(0.3),
-                                    width=Inches(0.8), height=Inches(0.8))
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_CORNER)
 
-        # Count categories
-        category_counts = Counter(categories)
-        labels = list(category_counts.keys())
-        values = list(category_counts.values())
-
-        # Gather category colors from the categorizer
-        category_colors = []
-        for name in labels:
-            for incident in self.incidents:
-                desc = incident.get("description", "")
-                cat = categorize_incident(desc)
-                if cat["name"] == name:
-                    category_colors.append(cat["color"])
-                    break
-
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(13, 5.5))
-
-        # ───────────────────────────────
-        # MODERN DONUT CHART
-        # ───────────────────────────────
-        wedges, texts, autotexts = ax1.pie(
-            values,
-            labels=labels,
-            colors=category_colors,
-            autopct='%1.1f%%',
-            startangle=90,
-            pctdistance=0.8,
-            wedgeprops=dict(width=0.45, edgecolor='white')
-        )
-        ax1.set_title("Category Distribution", fontsize=18, weight='bold')
-
-        # White text inside wedges
-        for a in autotexts:
-            a.set_color("white")
-            a.set_weight("bold")
-            a.set_fontsize(8)
-
-        # ───────────────────────────────
-        # MODERN ROUNDED BAR CHART
-        # ───────────────────────────────
-        bars = ax2.bar(
-            labels,
-            values,
-            color=category_colors,
-            edgecolor="white",
-            linewidth=1.5
-        )
-
-        # Rounded bars & clean text
-        for bar in bars:
-            bar.set_alpha(0.92)
-
-        ax2.set_title("Incident Count by Category", fontsize=18, weight="bold")
-        ax2.set_ylabel("Count")
-        ax2.grid(axis="y", alpha=0.3)
-
-        # Add counts above bars
-        for i, val in enumerate(values):
-            ax2.text(i, val + 0.1, str(val),
-                    ha='center', va='bottom', fontsize=12, weight='bold')
-
-        plt.tight_layout()
-
-        # Save temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-        temp_file.close()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches="tight", transparent=True)
-        plt.close()
-
-        slide.shapes.add_picture(temp_file.name, Inches(0.5), Inches(1.2),
+        slide.shapes.add_picture(io.BytesIO(chart_png), Inches(0.5), Inches(1.2),
                                 width=Inches(12.3))
 
-        os.unlink(temp_file.name)
-
 
     # =====================================================================
     # 🔹 SEVERITY + STATUS CHART SLIDE (MODERN BAR CHARTS)
     # =====================================================================
 
     def _create_severity_status_slide(self, prs, severities, statuses):
-        import matplotlib.pyplot as plt
-        from collections import Counter
-        import tempfile
-        import os
-
         plt.style.use("fivethirtyeight")
 
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_central_watermark(slide)
 
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(10), Inches(0.6))
+        title_box = slide.shapes.add_textbox(*_CHART_TITLE_POS)
         title_frame = title_box.text_frame
         title_frame.text = "Incident Analytics: Severity & Status"
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(28)
+        p.font.size = _PT_28
         p.font.bold = True
         p.font.color.rgb = COLORS["BROWN"]
 
@@ -885,107 +851,30 @@ Date: {date_display}"""
         os.unlink(temp_file.name)
 
 
-    def _create_severity_status_slide(self, prs, severities, statuses):
+    def _create_severity_status_slide(self, prs, chart_png):
         """Create slide with severity and status distribution"""
-        import matplotlib.pyplot as plt
-        import tempfile
-        from collections import Counter
-
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_central_watermark(slide)
 
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(10), Inches(0.6))
+        title_box = slide.shapes.add_textbox(*_CHART_TITLE_POS)
         title_frame = title_box.text_frame
         title_frame.text = "Incident Analytics: Severity & Status"
 
         p = title_frame.paragraphs[0]
-        p.font.size = Pt(28)
+        p.font.size = _PT_28
         p.font.bold = True
         p.font.name = 'Arial'
         p.font.color.rgb = COLORS['BROWN']
 
         # Logo
-        if os.path.exists(self.logos):
-            slide.shapes.add_picture(self.logos, Inches(12.5), Inches(0.3),
-                                    width=Inches(0.8), height=Inches(0.8))
-
-        # Count data
-        severity_counts = Counter(severities)
-        status_counts = Counter(statuses)
-
-        # Define colors
-        severity_colors = {
-            'Critical': '#DC143C',
-            'High': '#FF6347',
-            'Medium': '#FFA500',
-            'Low': '#FFD700',
-            'Unknown': '#808080'
-        }
-
-        status_colors = {
-            'NEW': '#4169E1',
-            'IN_PROGRESS': '#FFD700',
-            'RESOLVED': '#32CD32',
-            'CLOSED': '#808080',
-            'Unknown': '#A9A9A9'
-        }
-
-        # Create charts
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(13, 5.5))
-
-        # Severity bar chart
-        sev_colors = [severity_colors.get(s, '#808080') for s in severity_counts.keys()]
-        bars1 = ax1.bar(range(len(severity_counts)), list(severity_counts.values()),
-                       color=sev_colors, edgecolor='black', linewidth=2)
-        ax1.set_xticks(range(len(severity_counts)))
-        ax1.set_xticklabels(severity_counts.keys(), fontsize=11, weight='bold')
-        ax1.set_ylabel('Count', fontsize=12, weight='bold')
-        ax1.set_title('Incidents by Severity', fontsize=16, weight='bold', pad=20)
-        ax1.grid(axis='y', alpha=0.3)
-
-        # Add count labels
-        for i, count in enumerate(severity_counts.values()):
-            ax1.text(i, count + 0.1, str(count), ha='center', va='bottom',
-                    fontsize=12, weight='bold')
-
-        # Status donut chart
-        stat_colors = [status_colors.get(s, '#808080') for s in status_counts.keys()]
-        wedges, texts, autotexts = ax2.pie(
-            status_counts.values(),
-            labels=status_counts.keys(),
-            colors=stat_colors,
-            autopct='%1.1f%%',
-            startangle=90,
-            wedgeprops=dict(width=0.5, edgecolor='white', linewidth=2),
-            textprops={'fontsize': 11, 'weight': 'bold'}
-        )
-
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(13)
-            autotext.set_weight('bold')
-
-        ax2.set_title('Incidents by Status', fontsize=16, weight='bold', pad=20)
-
-        plt.tight_layout()
-
-        # Save to temp file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-        temp_file.close()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches='tight', transparent=True)
-        plt.close()
+        if self._logo_exists:
+            self._add_logo(slide, *_LOGO_CORNER)
 
         # Add to slide
-        slide.shapes.add_picture(temp_file.name, Inches(0.5), Inches(1.2),
+        slide.shapes.add_picture(io.BytesIO(chart_png), Inches(0.5), Inches(1.2),
                                 width=Inches(12.3), height=Inches(5.8))
 
-        # Cleanup
-        try:
-            os.unlink(temp_file.name)
-        except:
-            pass
-
     def _generate_slide5_plus_incident_details(self, prs):
         """Slides 5+: Individual Incident Details"""
         for incident in self.incidents:
@@ -1007,8 +896,7 @@ Date: {date_display}"""
             p.font.color.rgb = COLORS['BROWN']
 
             # Logo
-            slide.shapes.add_picture(self.logos, Inches(12.5), Inches(0.3),
-                                    width=Inches(0.8), height=Inches(0.8))
+            self._add_logo(slide, *_LOGO_CORNER)
 
             # Annotated photo
             if incident.get('annotatedPhotos') and len(incident['annotatedPhotos']) > 0:
@@ -1031,13 +919,208 @@ Date: {date_display}"""
                 phf = ph.text_frame
                 phf.text = "[Annotated photo will be added]"
                 p = phf.paragraphs[0]
-                p.font.size = Pt(24)
+                p.font.size = _PT_24
                 p.font.name = 'Arial'
                 p.font.color.rgb = COLORS['BROWN']
                 p.alignment = PP_ALIGN.CENTER
                 phf.vertical_anchor = MSO_ANCHOR.MIDDLE
 
 
+# ============================================================================
+# CHART RENDERING
+# ============================================================================
+
+# Both analytics charts are 13x5.5in; each report worker process draws them onto one reused
+# Figure/Agg canvas (object API, no pyplot figure registry). Reports in a worker process are
+# built one at a time, so no locking is needed.
+_chart_figure: Optional[Figure] = None
+
+
+def _acquire_chart_figure() -> Figure:
+    """Get this process's cleared chart Figure (call inside the chart style context)"""
+    global _chart_figure
+    if _chart_figure is None:
+        _chart_figure = Figure(figsize=(13, 5.5))
+        FigureCanvasAgg(_chart_figure)
+    else:
+        _chart_figure.clear()
+    return _chart_figure
+
+
+def _chart_png(fig: Figure) -> bytes:
+    """Lay out and rasterize the chart figure to PNG bytes"""
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, dpi=150, bbox_inches="tight", transparent=True)
+    return buf.getvalue()
+
+
+def _render_category_chart(labels: List[str], values: List[int], category_colors: List[str]) -> bytes:
+    """Render the category donut + bar chart to PNG bytes"""
+    with plt.style.context("fivethirtyeight"):  # Modern clean theme
+        fig = _acquire_chart_figure()
+        ax1, ax2 = fig.subplots(1, 2)
+
+        # ───────────────────────────────
+        # MODERN DONUT CHART
+        # ───────────────────────────────
+        wedges, texts, autotexts = ax1.pie(
+            values,
+            labels=labels,
+            colors=category_colors,
+            autopct='%1.1f%%',
+            startangle=90,
+            pctdistance=0.8,
+            wedgeprops=dict(width=0.45, edgecolor='white')
+        )
+        ax1.set_title("Category Distribution", fontsize=18, weight='bold')
+
+        # White text inside wedges
+        for a in autotexts:
+            a.set_color("white")
+            a.set_weight("bold")
+            a.set_fontsize(8)
+
+        # ───────────────────────────────
+        # MODERN ROUNDED BAR CHART
+        # ───────────────────────────────
+        bars = ax2.bar(
+            labels,
+            values,
+            color=category_colors,
+            edgecolor="white",
+            linewidth=1.5
+        )
+
+        # Rounded bars & clean text
+        for bar in bars:
+            bar.set_alpha(0.92)
+
+        ax2.set_title("Incident Count by Category", fontsize=18, weight="bold")
+        ax2.set_ylabel("Count")
+        ax2.grid(axis="y", alpha=0.3)
+
+        # Add counts above bars
+        for i, val in enumerate(values):
+            ax2.text(i, val + 0.1, str(val),
+                    ha='center', va='bottom', fontsize=12, weight='bold')
+
+        return _chart_png(fig)
+
+
+def _render_severity_status_chart(severity_counts: List[tuple], status_counts: List[tuple]) -> bytes:
+    """Render the severity bar + status donut chart to PNG bytes"""
+    severity_labels = [s for s, _ in severity_counts]
+    severity_values = [n for _, n in severity_counts]
+    status_labels = [s for s, _ in status_counts]
+    status_values = [n for _, n in status_counts]
+
+    # Define colors
+    severity_colors = {
+        'Critical': '#DC143C',
+        'High': '#FF6347',
+        'Medium': '#FFA500',
+        'Low': '#FFD700',
+        'Unknown': '#808080'
+    }
+
+    status_colors = {
+        'NEW': '#4169E1',
+        'IN_PROGRESS': '#FFD700',
+        'RESOLVED': '#32CD32',
+        'CLOSED': '#808080',
+        'Unknown': '#A9A9A9'
+    }
+
+    with plt.style.context("fivethirtyeight"):
+        # Create charts
+        fig = _acquire_chart_figure()
+        ax1, ax2 = fig.subplots(1, 2)
+
+        # Severity bar chart
+        sev_colors = [severity_colors.get(s, '#808080') for s in severity_labels]
+        bars1 = ax1.bar(range(len(severity_labels)), severity_values,
+                       color=sev_colors, edgecolor='black', linewidth=2)
+        ax1.set_xticks(range(len(severity_labels)))
+        ax1.set_xticklabels(severity_labels, fontsize=11, weight='bold')
+        ax1.set_ylabel('Count', fontsize=12, weight='bold')
+        ax1.set_title('Incidents by Severity', fontsize=16, weight='bold', pad=20)
+        ax1.grid(axis='y', alpha=0.3)
+
+        # Add count labels
+        for i, count in enumerate(severity_values):
+            ax1.text(i, count + 0.1, str(count), ha='center', va='bottom',
+                    fontsize=12, weight='bold')
+
+        # Status donut chart
+        stat_colors = [status_colors.get(s, '#808080') for s in status_labels]
+        wedges, texts, autotexts = ax2.pie(
+            status_values,
+            labels=status_labels,
+            colors=stat_colors,
+            autopct='%1.1f%%',
+            startangle=90,
+            wedgeprops=dict(width=0.5, edgecolor='white', linewidth=2),
+            textprops={'fontsize': 11, 'weight': 'bold'}
+        )
+
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(13)
+            autotext.set_weight('bold')
+
+        ax2.set_title('Incidents by Status', fontsize=16, weight='bold', pad=20)
+
+        return _chart_png(fig)
+
+
+# ============================================================================
+# ASYNC WRAPPER
+# ============================================================================
+
+# Building and serializing the deck is pure-Python, GIL-bound work - run it in worker processes
+# so one report doesn't stall the event loop and several reports build in parallel
+_report_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_report_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared PPTX generation process pool"""
+    global _report_executor
+    if _report_executor is None:
+        _report_executor = ProcessPoolExecutor(max_workers=get_settings().report_workers,
+                                               initializer=init_worker_logging)
+    return _report_executor
+
+
+def _discard_broken_report_executor(executor: ProcessPoolExecutor):
+    """Drop a broken pool (a worker died) so the next get_report_executor() builds a fresh one"""
+    global _report_executor
+    if _report_executor is executor:  # Another report may already have replaced it
+        _report_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_report_executor():
+    """Shut down the PPTX generation process pool (app shutdown)"""
+    global _report_executor
+    if _report_executor is not None:
+        _report_executor.shutdown(wait=False, cancel_futures=True)
+        _report_executor = None
+
+
+def _generate_pptx_sync(project_data: Dict[str, Any], incidents: List[Dict[str, Any]],
+                        overview_map_path: str, output_path: str,
+                        satellite_overview_map: List[str] = None,
+                        satellite_incident_groups: List[List[Dict[str, Any]]] = None,
+                        satellite_thumbnails: List[str] = None,
+                        incident_legend_map: str = None) -> str:
+    """Build and save the PPTX report (runs in a worker process)"""
+    generator = PPTXGenerator(project_data, incidents, overview_map_path,
+                             satellite_overview_map, satellite_incident_groups,
+                             satellite_thumbnails, incident_legend_map)
+    return generator.generate(output_path)
+
+
 async def generate_pptx_report(project_data: Dict[str, Any], incidents: List[Dict[str, Any]],
                                overview_map_path: str, output_path: str,
                                satellite_overview_map: List[str] = None,
@@ -1060,7 +1143,19 @@ async def generate_pptx_report(project_data: Dict[str, Any], incidents: List[Dic
     Returns:
         Path to generated PPTX
     """
-    generator = PPTXGenerator(project_data, incidents, overview_map_path,
-                             satellite_overview_map, satellite_incident_groups,
-                             satellite_thumbnails, incident_legend_map)
-    return generator.generate(output_path)
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = get_report_executor()
+        try:
+            return await loop.run_in_executor(
+                executor, _generate_pptx_sync,
+                project_data, incidents, overview_map_path, output_path,
+                satellite_overview_map, satellite_incident_groups,
+                satellite_thumbnails, incident_legend_map
+            )
+        except BrokenProcessPool:
+            # A worker died - the pool is unusable from now on, so replace it
+            _discard_broken_report_executor(executor)
+            if attempt:
+                raise
+            log.warning("⚠️  PPTX worker pool broke, retrying on a fresh pool")
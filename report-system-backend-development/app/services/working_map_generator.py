@@ -16,6 +16,7 @@ import os
 import numpy as np
 import math
 import contextily as ctx
+from .map_generator import read_layer  # Process-wide (path, mtime) layer cache
 
 # PHASE 1: Exact color palette from ArcMap reference (experimental.md)
 COLORS = {
@@ -114,13 +115,13 @@ class MapGenerator:
 
         # Load BASE LAYERS + Obama-Brass Pipeline
         try:
-            pipeline_obama_brass_gdf = gpd.read_file(self.shapefiles['pipeline_obama_brass'])
-            settlements_gdf = gpd.read_file(self.shapefiles['settlements'])
-            rivers_gdf = gpd.read_file(self.shapefiles['rivers'])
-            minor_rivers_gdf = gpd.read_file(self.shapefiles['minor_rivers'])
-            rivers_poly_gdf = gpd.read_file(self.shapefiles['rivers_poly'])
-            sea_gdf = gpd.read_file(self.shapefiles['sea'])
-            boundaries_gdf = gpd.read_file(self.shapefiles['boundaries'])
+            pipeline_obama_brass_gdf = read_layer(self.shapefiles['pipeline_obama_brass'])
+            settlements_gdf = read_layer(self.shapefiles['settlements'])
+            rivers_gdf = read_layer(self.shapefiles['rivers'])
+            minor_rivers_gdf = read_layer(self.shapefiles['minor_rivers'])
+            rivers_poly_gdf = read_layer(self.shapefiles['rivers_poly'])
+            sea_gdf = read_layer(self.shapefiles['sea'])
+            boundaries_gdf = read_layer(self.shapefiles['boundaries'])
 
             print(f"   ✅ Loaded {len(pipeline_obama_brass_gdf)} Obama-Brass pipeline features")
             print(f"   ✅ Loaded {len(settlements_gdf)} settlement features")
@@ -376,8 +377,8 @@ class MapGenerator:
 
         try:
             # Load pipeline shapefiles
-            pipeline_obama_brass_gdf = gpd.read_file(self.shapefiles['pipeline_obama_brass'])
-            pipeline_tebidaba_brass_gdf = gpd.read_file(self.shapefiles['pipeline_tebidaba_brass'])
+            pipeline_obama_brass_gdf = read_layer(self.shapefiles['pipeline_obama_brass'])
+            pipeline_tebidaba_brass_gdf = read_layer(self.shapefiles['pipeline_tebidaba_brass'])
 
             # Combine pipelines
             import pandas as pd
@@ -515,8 +516,8 @@ class MapGenerator:
         """
         try:
             # Load pipeline shapefiles
-            pipeline_obama_brass_gdf = gpd.read_file(self.shapefiles['pipeline_obama_brass'])
-            pipeline_tebidaba_brass_gdf = gpd.read_file(self.shapefiles['pipeline_tebidaba_brass'])
+            pipeline_obama_brass_gdf = read_layer(self.shapefiles['pipeline_obama_brass'])
+            pipeline_tebidaba_brass_gdf = read_layer(self.shapefiles['pipeline_tebidaba_brass'])
 
             # Combine pipelines
             import pandas as pd
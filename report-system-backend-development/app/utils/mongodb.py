@@ -7,6 +7,7 @@ from pymongo.errors import ConnectionFailure
 from bson import ObjectId
 from app.config import get_settings
 from typing import Optional
+import asyncio
 
 # Global MongoDB client
 _mongodb_client: Optional[AsyncIOMotorClient] = None
@@ -22,6 +23,12 @@ async def connect_to_mongodb():
         # Verify connection
         await _mongodb_client.admin.command('ping')
         print(f"✅ Connected to MongoDB: {settings.mongodb_uri}")
+        # Indexes backing the hot queries (create_index is a no-op if they already exist):
+        # incidents query in get_project_with_incidents
+        db = get_database()
+        await db.incidents.create_index("projectId")
+        # Serves list_assets' type filter + uploadedAt sort without an in-memory sort
+        await db.assets.create_index([("type", 1), ("uploadedAt", -1)])
     except ConnectionFailure as e:
         print(f"❌ Failed to connect to MongoDB: {e}")
         raise
@@ -61,3 +68,24 @@ async def get_incidents_by_project_id(project_id: str):
     async for incident in db.incidents.find({"projectId": ObjectId(project_id)}):
         incidents.append(incident)
     return incidents
+
+
+async def get_project_with_incidents(project_id: str):
+    """
+    Fetch a project and all its incidents, running both queries concurrently
+
+    Incidents are streamed from their own cursor rather than embedded with $lookup, so a
+    project with many (or large) incidents can't exceed the 16 MB BSON document limit.
+
+    Returns:
+        Tuple of (project, incidents); project is None if not found
+    """
+    db = get_database()
+    object_id = ObjectId(project_id)
+    project, incidents = await asyncio.gather(
+        db.projects.find_one({"_id": object_id}),
+        db.incidents.find({"projectId": object_id}).to_list(None),
+    )
+    if project is None:
+        return None, []
+    return project, incidents
@@ -0,0 +1,28 @@
+"""
+Logging setup for worker processes
+"""
+
+import logging
+
+from app.config import get_settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+
+def init_worker_logging():
+    """
+    ProcessPoolExecutor initializer: log the 'report' logger straight to stderr
+
+    Forked workers inherit the parent's QueueHandler, but its queue is only drained by the
+    listener thread in the parent - records logged in a worker would be lost and pile up in
+    the worker's memory. Each worker writes its own records to stderr instead.
+    """
+    handler = logging.StreamHandler()  # stderr
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger("report")
+    for old in list(logger.handlers):
+        logger.removeHandler(old)
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if get_settings().debug else logging.INFO)
+    logger.propagate = False